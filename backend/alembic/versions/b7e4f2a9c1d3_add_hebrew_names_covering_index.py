@@ -0,0 +1,32 @@
+"""add_hebrew_names_covering_index
+
+Revision ID: b7e4f2a9c1d3
+Revises: a1b2c3d4e5f6
+Create Date: 2026-10-17 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7e4f2a9c1d3'
+down_revision: Union[str, None] = 'a1b2c3d4e5f6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Covering index for translation lookups (english_name is stored lowercased),
+    # so WHERE english_name = :name can be served by an index-only scan
+    op.create_index(
+        'ix_hebrew_names_english_name_hebrew_name',
+        'hebrew_names',
+        ['english_name', 'hebrew_name'],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_hebrew_names_english_name_hebrew_name', table_name='hebrew_names')
@@ -68,18 +68,20 @@ async def check_auth_status():
 
 
 @router.post("/login-browser", response_model=AuthStatus)
-async def login_with_browser():
+async def login_with_browser(force_relogin: bool = False):
     """
     Open a browser window for manual LinkedIn login.
 
     This will open a browser, let you login manually,
     then capture and save the cookies for future API use.
+    A still-valid saved session is reused unless force_relogin is set
+    (e.g. to switch accounts).
     """
     client = get_linkedin_client()
 
     try:
         logger.info("Starting browser login flow...")
-        success = await client.login_with_browser()
+        success = await client.login_with_browser(force_relogin=force_relogin)
 
         if success:
             profile = await client.get_profile_info()
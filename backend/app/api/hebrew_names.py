@@ -10,6 +10,7 @@ from app.services.hebrew_names import (
     translate_name_to_hebrew,
     save_hebrew_name,
     get_missing_hebrew_names,
+    remove_from_cache,
 )
 from app.utils.logger import get_logger
 
@@ -165,4 +166,5 @@ async def delete_hebrew_name(
 
     await db.delete(entry)
     await db.commit()
+    remove_from_cache(entry.english_name)
     return {"message": "Hebrew name deleted"}
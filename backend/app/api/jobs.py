@@ -1,5 +1,6 @@
 import asyncio
 from datetime import datetime
+from urllib.parse import urlparse
 from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks
 from sqlalchemy import select, func
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -11,7 +12,7 @@ from app.models.job import Job, JobStatus, WorkflowStep
 from app.models.contact import Contact
 from app.models.activity import ActivityLog, ActionType
 from app.models.site_selector import SiteSelector
-from app.services.job_processor import JobProcessor
+from app.services.job_processor import JobProcessor, job_dispatcher
 from app.services.workflow_orchestrator import WorkflowOrchestrator
 from app.services.hebrew_names import save_hebrew_name
 from app.services.linkedin.client import LinkedInClient
@@ -55,15 +56,8 @@ class CompanySubmit(BaseModel):
 
 
 async def process_job_task(job_id: int):
-    """Background task to process a job."""
-    async with AsyncSessionLocal() as db:
-        try:
-            processor = JobProcessor(db)
-            await processor.process_job(job_id)
-            await db.commit()
-        except Exception as e:
-            logger.error(f"Background task failed for job {job_id}: {e}")
-            await db.rollback()
+    """Background task to queue a job for (batched) processing."""
+    await job_dispatcher.submit(job_id)
 
 
 @router.post("", response_model=JobResponse)
@@ -416,9 +410,8 @@ async def submit_company(
             raise HTTPException(status_code=404, detail=result["message"])
         raise HTTPException(status_code=400, detail=result["message"])
 
-    # Fetch and return updated job
-    job_result = await db.execute(select(Job).where(Job.id == job_id))
-    job = job_result.scalar_one_or_none()
+    # Return updated job (already in the session's identity map - no query)
+    job = await db.get(Job, job_id)
 
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
@@ -793,7 +786,6 @@ async def update_company_name(
     job.company_name = new_name
 
     # Also update the site selector for this domain so future jobs get the correct name
-    from urllib.parse import urlparse
     try:
         parsed = urlparse(job.url)
         domain = parsed.netloc.lower()
@@ -1,4 +1,5 @@
 from datetime import datetime
+from urllib.parse import urlparse
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -7,6 +8,7 @@ from pydantic import BaseModel
 from app.database import get_db
 from app.models.site_selector import SiteSelector
 from app.models.activity import ActivityLog, ActionType
+from app.services.job_processor import invalidate_selector_cache, remember_selector_domain
 from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -66,6 +68,7 @@ async def create_selector(
     db.add(selector)
     await db.flush()
     await db.refresh(selector)
+    remember_selector_domain(selector.domain)
 
     # Log the learning
     activity = ActivityLog(
@@ -140,6 +143,8 @@ async def update_selector(
 
     await db.flush()
     await db.refresh(selector)
+    if "domain" in update_data:
+        invalidate_selector_cache()
 
     logger.info(f"Updated selector for domain: {selector.domain}")
     return selector
@@ -158,6 +163,7 @@ async def delete_selector(selector_id: int, db: AsyncSession = Depends(get_db)):
 
     domain = selector.domain
     await db.delete(selector)
+    invalidate_selector_cache()
     logger.info(f"Deleted selector for domain: {domain}")
     return {"message": f"Selector for {domain} deleted"}
 
@@ -168,8 +174,6 @@ async def check_domain(
     db: AsyncSession = Depends(get_db),
 ):
     """Check if we have a selector for the given URL's domain."""
-    from urllib.parse import urlparse
-
     try:
         parsed = urlparse(url)
         domain = parsed.netloc.lower()
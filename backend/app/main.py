@@ -133,6 +133,11 @@ async def startup_event():
         if added > 0:
             logger.info(f"Seeded {added} built-in site selectors")
 
+    # Mirror user-provided Hebrew names in memory so lookups skip the DB
+    from app.services.hebrew_names import load_all_translations_to_cache
+    async with get_db_session() as db:
+        await load_all_translations_to_cache(db)
+
     # Start heartbeat checker thread (for auto-shutdown when browser closes)
     heartbeat_thread = threading.Thread(target=_heartbeat_checker, daemon=True)
     heartbeat_thread.start()
@@ -142,6 +147,12 @@ async def startup_event():
 @app.on_event("shutdown")
 async def shutdown_event():
     logger.info("JobiAI API shutting down...")
+    from app.services.job_processor import job_dispatcher
+    await job_dispatcher.stop()
+
+    # Close the browser kept open between workflows
+    from app.services.linkedin import get_linkedin_client
+    await get_linkedin_client().close()
 
 
 # --- Static Frontend Serving (for desktop app mode) ---
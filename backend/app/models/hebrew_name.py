@@ -1,6 +1,6 @@
 """Model for storing user-provided Hebrew name translations."""
 from datetime import datetime
-from sqlalchemy import String, DateTime
+from sqlalchemy import String, DateTime, Index
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.database import Base
@@ -9,6 +9,10 @@ from app.database import Base
 class HebrewName(Base):
     """Stores mappings from English names to Hebrew script."""
     __tablename__ = "hebrew_names"
+    __table_args__ = (
+        # Covering index so english_name lookups are answered from the index alone
+        Index('ix_hebrew_names_english_name_hebrew_name', 'english_name', 'hebrew_name'),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     english_name: Mapped[str] = mapped_column(String(100), unique=True, nullable=False, index=True)
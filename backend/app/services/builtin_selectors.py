@@ -9,6 +9,7 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.site_selector import SiteSelector, SiteType
+from app.services.job_processor import invalidate_selector_cache
 from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -182,6 +183,7 @@ async def seed_builtin_selectors(db: AsyncSession) -> int:
 
     if added > 0:
         await db.commit()
+        invalidate_selector_cache()
         logger.info(f"Seeded {added} built-in site selectors")
 
     return added
@@ -11,6 +11,9 @@ Names are looked up in:
 If a name is not found, return None to signal the workflow should pause.
 """
 
+import functools
+from pathlib import Path
+
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -19,559 +22,39 @@ from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
-# Mapping of English transliterations to Hebrew names
-# Format: english_lowercase -> hebrew_script
+# Built-in mapping of English transliterations to Hebrew names.
+# Format: one "english_lowercase<TAB>hebrew_script" pair per line.
 # ~500+ names from Behind the Name database and other sources
-ENGLISH_TO_HEBREW_NAMES = {
-    # === A ===
-    "aaron": "אהרון",
-    "abigail": "אביגיל",
-    "abraham": "אברהם",
-    "adam": "אדם",
-    "adara": "אדרה",
-    "adi": "עדי",
-    "adina": "עדינה",
-    "adir": "אדיר",
-    "adva": "אדוה",
-    "agam": "אגם",
-    "aharon": "אהרון",
-    "ahava": "אהבה",
-    "ahuva": "אהובה",
-    "akiva": "עקיבא",
-    "aliya": "עליה",
-    "aliza": "עליזה",
-    "alma": "עלמה",
-    "almog": "אלמוג",
-    "alon": "אלון",
-    "alona": "אלונה",
-    "ami": "עמי",
-    "amichai": "עמיחי",
-    "amir": "אמיר",
-    "amit": "עמית",
-    "amnon": "אמנון",
-    "amos": "עמוס",
-    "amram": "עמרם",
-    "anan": "ענן",
-    "anat": "ענת",
-    "arie": "אריה",
-    "ariel": "אריאל",
-    "arik": "אריק",
-    "arye": "אריה",
-    "asa": "אסא",
-    "asaf": "אסף",
-    "asher": "אשר",
-    "atalia": "עתליה",
-    "atara": "עטרה",
-    "avi": "אבי",
-    "avia": "אביה",
-    "aviad": "אביעד",
-    "avidan": "אבידן",
-    "aviel": "אביאל",
-    "avigail": "אביגיל",
-    "avigdor": "אביגדור",
-    "avihu": "אביהוא",
-    "aviram": "אבירם",
-    "avishag": "אבישג",
-    "avishai": "אבישי",
-    "avital": "אביטל",
-    "aviv": "אביב",
-    "aviva": "אביבה",
-    "avner": "אבנר",
-    "avraham": "אברהם",
-    "avram": "אברם",
-    "avshalom": "אבשלום",
-    "ayal": "איל",
-    "ayala": "איילה",
-    "ayelet": "איילת",
-    "azaria": "עזריה",
-    # === B ===
-    "bar": "בר",
-    "barak": "ברק",
-    "baruch": "ברוך",
-    "batel": "בת־אל",
-    "batsheva": "בת־שבע",
-    "batya": "בתיה",
-    "beeri": "בארי",
-    "benaya": "בניה",
-    "beni": "בני",
-    "benjamin": "בנימין",
-    "benny": "בני",
-    "beracha": "ברכה",
-    "binyamin": "בנימין",
-    "boaz": "בועז",
-    "bosmat": "בשמת",
-    "bracha": "ברכה",
-    # === C ===
-    "carmel": "כרמל",
-    "carmit": "כרמית",
-    "chaim": "חיים",
-    "chana": "חנה",
-    "chava": "חוה",
-    "chaya": "חיה",
-    "chen": "חן",
-    "chesed": "חסד",
-    # === D ===
-    "dafna": "דפנה",
-    "dalia": "דליה",
-    "dalit": "דלית",
-    "dan": "דן",
-    "dana": "דנה",
-    "dani": "דני",
-    "daniel": "דניאל",
-    "daniela": "דניאלה",
-    "danit": "דנית",
-    "danny": "דני",
-    "danya": "דניה",
-    "dar": "דר",
-    "daphne": "דפנה",
-    "david": "דוד",
-    "deborah": "דבורה",
-    "dekel": "דקל",
-    "dikla": "דקלה",
-    "dina": "דינה",
-    "dor": "דור",
-    "dori": "דורי",
-    "dorit": "דורית",
-    "doron": "דורון",
-    "dov": "דוב",
-    "dror": "דרור",
-    "drorit": "דרורית",
-    "dvora": "דבורה",
-    # === E ===
-    "eden": "עדן",
-    "edna": "עדנה",
-    "efraim": "אפרים",
-    "efrat": "אפרת",
-    "ehud": "אהוד",
-    "eilat": "אילת",
-    "eilon": "אילון",
-    "eitan": "איתן",
-    "elazar": "אלעזר",
-    "elchanan": "אלחנן",
-    "eldad": "אלדד",
-    "eli": "אלי",
-    "eliana": "אליענה",
-    "eliav": "אליאב",
-    "eliezer": "אליעזר",
-    "elijah": "אליהו",
-    "elior": "אליאור",
-    "eliora": "אליאורה",
-    "elisheva": "אלישבע",
-    "eliya": "אליה",
-    "eliyahu": "אליהו",
-    "ephraim": "אפרים",
-    "eran": "ערן",
-    "erez": "ארז",
-    "ester": "אסתר",
-    "esther": "אסתר",
-    "ethan": "איתן",
-    "eve": "חוה",
-    "eviatar": "אביתר",
-    "evyatar": "אביתר",
-    "eyal": "איל",
-    "eytan": "איתן",
-    "ezra": "עזרא",
-    # === G ===
-    "gad": "גד",
-    "gai": "גיא",
-    "gal": "גל",
-    "gali": "גלי",
-    "galia": "גליה",
-    "galit": "גלית",
-    "gavriel": "גבריאל",
-    "gaya": "גאיה",
-    "gefen": "גפן",
-    "geula": "גאולה",
-    "gideon": "גדעון",
-    "gidon": "גדעון",
-    "gil": "גיל",
-    "gila": "גילה",
-    "gilad": "גלעד",
-    "gili": "גילי",
-    "guy": "גיא",
-    # === H ===
-    "hadar": "הדר",
-    "hadas": "הדס",
-    "hadasa": "הדסה",
-    "hadassa": "הדסה",
-    "hadassah": "הדסה",
-    "hagar": "הגר",
-    "hagit": "חגית",
-    "hai": "חי",
-    "haim": "חיים",
-    "hallel": "הלל",
-    "hana": "חנה",
-    "hannah": "חנה",
-    "harel": "הראל",
-    "hava": "חוה",
-    "hayim": "חיים",
-    "hed": "הד",
-    "herut": "חרות",
-    "hevel": "הבל",
-    "hila": "הילה",
-    "hili": "הילי",
-    "hillel": "הלל",
-    "hodia": "הודיה",
-    "hyam": "חיים",
-    # === I ===
-    "idan": "עידן",
-    "ido": "עידו",
-    "ilai": "עילאי",
-    "ilan": "אילן",
-    "ilana": "אילנה",
-    "ilanit": "אילנית",
-    "ilat": "אילת",
-    "immanuel": "עמנואל",
-    "imri": "אמרי",
-    "inbal": "ענבל",
-    "inbar": "ענבר",
-    "ira": "עירא",
-    "iris": "איריס",
-    "irit": "עירית",
-    "israel": "ישראל",
-    "itai": "איתי",
-    "itamar": "איתמר",
-    "itan": "איתן",
-    "itay": "איתי",
-    "itzhak": "יצחק",
-    "iyov": "איוב",
-    # === J ===
-    "jardena": "ירדנה",
-    "jonathan": "יונתן",
-    "joseph": "יוסף",
-    "judith": "יהודית",
-    # === K ===
-    "karmel": "כרמל",
-    "kelila": "כלילה",
-    "keren": "קרן",
-    "keshet": "קשת",
-    "kfir": "כפיר",
-    "kineret": "כנרת",
-    "kobi": "קובי",
-    # === L ===
-    "lavi": "לביא",
-    "lea": "לאה",
-    "leah": "לאה",
-    "lee": "לי",
-    "lev": "לב",
-    "levana": "לבנה",
-    "levi": "לוי",
-    "li": "לי",
-    "lian": "ליאן",
-    "liat": "ליאת",
-    "libi": "ליבי",
-    "liel": "ליאל",
-    "lihi": "ליהי",
-    "lilach": "לילך",
-    "limor": "לימור",
-    "lior": "ליאור",
-    "liora": "ליאורה",
-    "liorit": "ליאורית",
-    "liraz": "לירז",
-    "liron": "לירון",
-    "lital": "ליטל",
-    "livna": "לבנה",
-    "livnat": "לבנת",
-    # === M ===
-    "maayan": "מעיין",
-    "malachi": "מלאכי",
-    "malka": "מלכה",
-    "maor": "מאור",
-    "margalit": "מרגלית",
-    "matan": "מתן",
-    "matityahu": "מתתיהו",
-    "maya": "מאיה",
-    "meir": "מאיר",
-    "meira": "מאירה",
-    "meirit": "מאירית",
-    "meital": "מיטל",
-    "melech": "מלך",
-    "menachem": "מנחם",
-    "menahem": "מנחם",
-    "menashe": "מנשה",
-    "menuha": "מנוחה",
-    "merav": "מירב",
-    "meshulam": "משולם",
-    "meyer": "מאיר",
-    "michael": "מיכאל",
-    "michaela": "מיכאלה",
-    "michal": "מיכל",
-    "mikhael": "מיכאל",
-    "miri": "מירי",
-    "miriam": "מרים",
-    "mirit": "מירית",
-    "miron": "מירון",
-    "miryam": "מרים",
-    "mor": "מור",
-    "moran": "מורן",
-    "mordecai": "מרדכי",
-    "moria": "מוריה",
-    "moshe": "משה",
-    "moti": "מוטי",
-    # === N ===
-    "naama": "נעמה",
-    "nachman": "נחמן",
-    "nachum": "נחום",
-    "nadav": "נדב",
-    "naftali": "נפתלי",
-    "nahal": "נחל",
-    "naomi": "נעמי",
-    "natan": "נתן",
-    "nathan": "נתן",
-    "nava": "נאוה",
-    "nechama": "נחמה",
-    "nehorai": "נהוראי",
-    "neria": "נריה",
-    "neta": "נטע",
-    "netanel": "נתנאל",
-    "netta": "נטע",
-    "nili": "נילי",
-    "nir": "ניר",
-    "nitai": "ניתאי",
-    "nitza": "ניצה",
-    "nitzan": "ניצן",
-    "niv": "ניב",
-    "noa": "נועה",
-    "noach": "נח",
-    "noah": "נועה",
-    "noam": "נועם",
-    "nofar": "נופר",
-    "noga": "נגה",
-    "noy": "נוי",
-    "noya": "נויה",
-    "nurit": "נורית",
-    # === O ===
-    "odelia": "אודליה",
-    "ofek": "אופק",
-    "ofer": "עופר",
-    "ofir": "אופיר",
-    "ofira": "אופירה",
-    "ofra": "עפרה",
-    "ofri": "עפרי",
-    "ohad": "אוהד",
-    "omer": "עומר",
-    "omri": "עמרי",
-    "ophir": "אופיר",
-    "or": "אור",
-    "ora": "אורה",
-    "orel": "אוראל",
-    "oren": "אורן",
-    "ori": "אורי",
-    "orit": "אורית",
-    "orli": "אורלי",
-    "orna": "ארנה",
-    "osher": "אושר",
-    "oz": "עוז",
-    # === P ===
-    "paz": "פז",
-    "peleg": "פלג",
-    "pnina": "פנינה",
-    # === R ===
-    "raanan": "רענן",
-    "rachel": "רחל",
-    "rani": "רני",
-    "ravid": "רביד",
-    "ravit": "רוית",
-    "raz": "רז",
-    "rebecca": "רבקה",
-    "reuben": "ראובן",
-    "reut": "רעות",
-    "rina": "רינה",
-    "rinat": "רינת",
-    "rivka": "רבקה",
-    "roi": "רועי",
-    "rom": "רום",
-    "romi": "רומי",
-    "ron": "רון",
-    "rona": "רונה",
-    "ronen": "רונן",
-    "roni": "רוני",
-    "ronit": "רונית",
-    "rotem": "רותם",
-    "roy": "רועי",
-    "rut": "רות",
-    "ruth": "רות",
-    # === S ===
-    "saar": "סער",
-    "sagi": "שגיא",
-    "sagit": "שגית",
-    "samuel": "שמואל",
-    "sapir": "ספיר",
-    "sara": "שרה",
-    "sarah": "שרה",
-    "sarit": "שרית",
-    "shachar": "שחר",
-    "shai": "שי",
-    "shaked": "שקד",
-    "shalev": "שלו",
-    "shalom": "שלום",
-    "shamira": "שמירה",
-    "shani": "שני",
-    "sharon": "שרון",
-    "shaul": "שאול",
-    "shay": "שי",
-    "shifra": "שפרה",
-    "shimon": "שמעון",
-    "shimshon": "שמשון",
-    "shir": "שיר",
-    "shira": "שירה",
-    "shiri": "שירי",
-    "shirli": "שירלי",
-    "shlomi": "שלומי",
-    "shlomit": "שלומית",
-    "shlomo": "שלמה",
-    "shmuel": "שמואל",
-    "shoshana": "שושנה",
-    "shulamit": "שולמית",
-    "sigal": "סיגל",
-    "simcha": "שמחה",
-    "simon": "שמעון",
-    "sivan": "סיון",
-    "smadar": "סמדר",
-    "solomon": "שלמה",
-    "sophia": "צופיה",
-    "stav": "סתיו",
-    # === T ===
-    "tahel": "תהל",
-    "tair": "תאיר",
-    "tal": "טל",
-    "tali": "טלי",
-    "talia": "טליה",
-    "tam": "תם",
-    "tamar": "תמר",
-    "tami": "תמי",
-    "tamir": "תמיר",
-    "tehila": "תהילה",
-    "tikva": "תקוה",
-    "tirtza": "תרצה",
-    "tohar": "טוהר",
-    "tom": "תום",
-    "tomer": "תומר",
-    "tova": "טובה",
-    "tovia": "טוביה",
-    "tuvya": "טוביה",
-    "tzachi": "צחי",
-    "tzafrir": "צפריר",
-    "tzila": "צילה",
-    "tzion": "ציון",
-    "tzipora": "ציפורה",
-    "tzippora": "ציפורה",
-    "tzivya": "צביה",
-    "tzvi": "צבי",
-    "tzvia": "צביה",
-    "tzofia": "צופיה",
-    # === U ===
-    "udi": "אודי",
-    "uri": "אורי",
-    "uria": "אוריה",
-    "uriel": "אוריאל",
-    "uzi": "עוזי",
-    # === V ===
-    "varda": "ורדה",
-    "vered": "ורד",
-    # === Y ===
-    "yaakov": "יעקב",
-    "yaara": "יערה",
-    "yael": "יעל",
-    "yaen": "יען",
-    "yafa": "יפה",
-    "yafit": "יפית",
-    "yahav": "יהב",
-    "yair": "יאיר",
-    "yakira": "יקירה",
-    "yakov": "יעקב",
-    "yali": "יהלי",
-    "yam": "ים",
-    "yanai": "ינאי",
-    "yaniv": "יניב",
-    "yarden": "ירדן",
-    "yardena": "ירדנה",
-    "yaron": "ירון",
-    "yarona": "ירונה",
-    "yasmin": "יסמין",
-    "yechezkel": "יחזקאל",
-    "yechiel": "יחיאל",
-    "yedidya": "ידידיה",
-    "yehonatan": "יהונתן",
-    "yehoshua": "יהושע",
-    "yehuda": "יהודה",
-    "yehudi": "יהודי",
-    "yehudit": "יהודית",
-    "yemima": "ימימה",
-    "yeshayahu": "ישעיהו",
-    "yiftach": "יפתח",
-    "yigal": "יגאל",
-    "yinon": "ינון",
-    "yishai": "ישי",
-    "yisrael": "ישראל",
-    "yissakhar": "יששכר",
-    "yitzhak": "יצחק",
-    "yoav": "יואב",
-    "yochanan": "יוחנן",
-    "yochai": "יוחאי",
-    "yocheved": "יוכבד",
-    "yoel": "יואל",
-    "yona": "יונה",
-    "yonatan": "יונתן",
-    "yoni": "יוני",
-    "yonina": "יונינה",
-    "yonit": "יונית",
-    "yoram": "יורם",
-    "yosef": "יוסף",
-    "yosi": "יוסי",
-    "yossi": "יוסי",
-    "yuli": "יולי",
-    "yuval": "יובל",
-    # === Z ===
-    "zahara": "זהרה",
-    "zeev": "זאב",
-    "ziv": "זיו",
-    "ziva": "זיוה",
-    "zivit": "זיוית",
-    "zohar": "זוהר",
-    # === Additional common variants ===
-    "natali": "נטלי",
-    "natalie": "נטלי",
-    # === User-contributed names (bundled for distribution) ===
-    "abeer": "אביר",
-    "arad": "ערד",
-    "ari": "ארי",
-    "ben": "בן",
-    "damian": "דמיאן",
-    "daniella": "דניאלה",
-    "eival": "עיבל",
-    "ela": "אלה",
-    "elad": "אלעד",
-    "gabi": "גבי",
-    "ganit": "גנית",
-    "iliya": "איליה",
-    "itzik": "איציק",
-    "karin": "קרין",
-    "kevin": "קווין",
-    "liad": "ליעד",
-    "maia": "מאיה",
-    "majd": "מאגד",
-    "may": "מאי",
-    "melina": "מלינה",
-    "mira": "מירה",
-    "mohamed": "מוחמד",
-    "mohammad": "מוחמד",
-    "muhammad": "מוחמד",
-    "narkis": "נרקיס",
-    "oded": "עודד",
-    "qasem": "קאסם",
-    "roee": "רועי",
-    "roey": "רועי",
-    "sari": "שרי",
-    "shahar": "שחר",
-    "vladi": "ולדי",
-    "yarin": "ירין",
-}
+_BUILTIN_NAMES_PATH = Path(__file__).with_name("hebrew_names.tsv")
+
+
+@functools.cache
+def get_builtin_names() -> dict[str, str]:
+    """
+    Load the built-in English -> Hebrew name dictionary.
+
+    The data lives in hebrew_names.tsv next to this module and is only read
+    on first use, so importing this module stays cheap.
+    """
+    with open(_BUILTIN_NAMES_PATH, encoding="utf-8") as f:
+        return dict(line.rstrip("\r\n").split("\t", 1) for line in f if line.strip())
+
 
 # Runtime cache for database translations (populated by async functions)
 # This allows the sync function to access DB translations without async DB calls
 _db_translations_cache: dict[str, str] = {}
 
+# Set once load_all_translations_to_cache() has mirrored the whole table.
+# From then on the cache is authoritative and a miss never needs a DB query.
+_db_cache_loaded = False
+
+
+def _first_word(name: str) -> str:
+    """Return the first space-separated word of a name without building a list."""
+    head = name.strip()
+    space = head.find(" ")
+    return head if space < 0 else head[:space]
+
 
 def add_to_cache(english_name: str, hebrew_name: str) -> None:
     """Add a translation to the runtime cache for sync access."""
@@ -579,6 +62,11 @@ def add_to_cache(english_name: str, hebrew_name: str) -> None:
     logger.debug(f"Added to cache: {english_name.lower()} -> {hebrew_name}")
 
 
+def remove_from_cache(english_name: str) -> None:
+    """Remove a translation from the runtime cache (e.g. after deleting it from the DB)."""
+    _db_translations_cache.pop(english_name.lower(), None)
+
+
 def translate_name_to_hebrew_sync(english_name: str) -> str | None:
     """
     Translate an English name to Hebrew script (synchronous).
@@ -597,15 +85,16 @@ def translate_name_to_hebrew_sync(english_name: str) -> str | None:
         return None
 
     # Extract first name and normalize
-    first_name = english_name.strip().split()[0].lower()
+    first_word = _first_word(english_name)
+    first_name = first_word.lower()
 
     # Check if already in Hebrew (contains Hebrew characters)
     if any('\u0590' <= char <= '\u05FF' for char in first_name):
         logger.debug(f"Name '{english_name}' is already in Hebrew")
-        return english_name.split()[0]  # Return original first name
+        return first_word  # Return original first name
 
     # 1. Look up in built-in dictionary
-    hebrew_name = ENGLISH_TO_HEBREW_NAMES.get(first_name)
+    hebrew_name = get_builtin_names().get(first_name)
     if hebrew_name:
         logger.debug(f"Translated '{first_name}' to Hebrew from dict: {hebrew_name}")
         return hebrew_name
@@ -636,15 +125,16 @@ async def translate_name_to_hebrew(english_name: str, db: AsyncSession) -> str |
         return None
 
     # Extract first name and normalize
-    first_name = english_name.strip().split()[0].lower()
+    first_word = _first_word(english_name)
+    first_name = first_word.lower()
 
     # Check if already in Hebrew (contains Hebrew characters)
     if any('\u0590' <= char <= '\u05FF' for char in first_name):
         logger.debug(f"Name '{english_name}' is already in Hebrew")
-        return english_name.split()[0]
+        return first_word
 
     # 1. Check built-in dictionary first
-    hebrew_name = ENGLISH_TO_HEBREW_NAMES.get(first_name)
+    hebrew_name = get_builtin_names().get(first_name)
     if hebrew_name:
         logger.debug(f"Translated '{first_name}' to Hebrew from dictionary: {hebrew_name}")
         return hebrew_name
@@ -655,6 +145,11 @@ async def translate_name_to_hebrew(english_name: str, db: AsyncSession) -> str |
         logger.debug(f"Translated '{first_name}' to Hebrew from cache: {cached}")
         return cached
 
+    # Cache mirrors the whole table - a miss means the DB doesn't have it either
+    if _db_cache_loaded:
+        logger.info(f"No Hebrew translation found for '{first_name}'")
+        return None
+
     # 3. Check database for user-provided translation
     result = await db.execute(
         select(HebrewName).where(HebrewName.english_name == first_name)
@@ -723,16 +218,31 @@ async def get_missing_hebrew_names(names: list[str], db: AsyncSession) -> list[s
         db: Database session
 
     Returns:
-        List of names that need Hebrew translations
+        List of first names (lowercased, deduplicated, in input order)
+        that need Hebrew translations
     """
-    missing = []
-    for name in names:
-        hebrew = await translate_name_to_hebrew(name, db)
-        if hebrew is None:
-            # Extract first name
-            first_name = name.strip().split()[0].lower()
-            if first_name not in missing:
-                missing.append(first_name)
+    # Ordered dedup of first names
+    first_names = dict.fromkeys(
+        _first_word(name).lower() for name in names if name and not name.isspace()
+    )
+
+    builtin_names = get_builtin_names()
+    missing = [
+        first_name for first_name in first_names
+        if not is_hebrew_text(first_name)
+        and first_name not in builtin_names
+        and first_name not in _db_translations_cache
+    ]
+
+    # Resolve the rest with one query instead of one per name
+    if missing and not _db_cache_loaded:
+        result = await db.execute(
+            select(HebrewName).where(HebrewName.english_name.in_(missing))
+        )
+        for entry in result.scalars():
+            add_to_cache(entry.english_name, entry.hebrew_name)
+        missing = [first_name for first_name in missing if first_name not in _db_translations_cache]
+
     return missing
 
 
@@ -763,6 +273,8 @@ async def load_all_translations_to_cache(db: AsyncSession) -> int:
     Returns:
         Number of translations loaded
     """
+    global _db_cache_loaded
+
     result = await db.execute(select(HebrewName))
     entries = result.scalars().all()
 
@@ -770,6 +282,7 @@ async def load_all_translations_to_cache(db: AsyncSession) -> int:
     for entry in entries:
         add_to_cache(entry.english_name, entry.hebrew_name)
         count += 1
+    _db_cache_loaded = True
 
     if count > 0:
         logger.info(f"Loaded {count} Hebrew name translations from database to cache")
@@ -1,10 +1,20 @@
+import functools
 import re
-from urllib.parse import urlparse
+from urllib.parse import ParseResult, urlparse
 
 from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Slug cleanup: hyphens/underscores -> spaces in a single pass
+_SLUG_TRANSLATION = str.maketrans("-_", "  ")
+
+
+@functools.lru_cache(maxsize=512)
+def compile_url_pattern(pattern: str) -> re.Pattern:
+    """Compile a company-extraction URL pattern once and reuse it."""
+    return re.compile(pattern, re.IGNORECASE)
+
 
 # Job platforms that host jobs for multiple companies
 # These need special handling - company is extracted from URL path/subdomain
@@ -112,16 +122,50 @@ KNOWN_COMPANY_SITES = {
 }
 
 
+def _lookup_domain_suffix(domain: str, table: dict):
+    """
+    Look up a domain or any of its parent domains in a domain-keyed table.
+
+    Tries "a.b.example.com", "b.example.com", "example.com", ... - one dict
+    hit per label instead of scanning every table entry. The most specific
+    match wins.
+    """
+    while domain:
+        value = table.get(domain)
+        if value is not None:
+            return value
+        _, _, domain = domain.partition(".")
+    return None
+
+
+def get_platform_config(domain: str) -> dict | None:
+    """Return the JOB_PLATFORMS config for an already-extracted domain, if any."""
+    return _lookup_domain_suffix(domain, JOB_PLATFORMS)
+
+
+def get_known_company(domain: str) -> str | None:
+    """Return the company name for an already-extracted known career-site domain."""
+    return _lookup_domain_suffix(domain, KNOWN_COMPANY_SITES)
+
+
 class JobParser:
     """Parses job URLs to extract company information."""
 
     def __init__(self):
         pass
 
-    def extract_domain(self, url: str) -> str:
-        """Extract domain from URL."""
+    def parse_url(self, url: str) -> ParseResult | None:
+        """Parse a URL once so callers can reuse the result; None if malformed."""
+        try:
+            return urlparse(url)
+        except Exception:
+            return None
+
+    def extract_domain(self, url: str, parsed: ParseResult | None = None) -> str:
+        """Extract domain from URL (reusing `parsed` if the caller already has it)."""
         try:
-            parsed = urlparse(url)
+            if parsed is None:
+                parsed = urlparse(url)
             domain = parsed.netloc.lower()
             # Remove www. prefix
             if domain.startswith("www."):
@@ -137,18 +181,8 @@ class JobParser:
         Returns:
             Tuple of (is_known, company_name)
         """
-        domain = self.extract_domain(url)
-
-        # Check exact domain match
-        if domain in KNOWN_COMPANY_SITES:
-            return True, KNOWN_COMPANY_SITES[domain]
-
-        # Check if domain ends with any known company domain
-        for company_domain, company_name in KNOWN_COMPANY_SITES.items():
-            if domain.endswith(company_domain):
-                return True, company_name
-
-        return False, None
+        company_name = get_known_company(self.extract_domain(url))
+        return company_name is not None, company_name
 
     def is_job_platform(self, url: str) -> tuple[bool, dict | None]:
         """
@@ -157,18 +191,8 @@ class JobParser:
         Returns:
             Tuple of (is_platform, platform_config)
         """
-        domain = self.extract_domain(url)
-
-        # Check exact domain match
-        if domain in JOB_PLATFORMS:
-            return True, JOB_PLATFORMS[domain]
-
-        # Check if domain ends with any platform domain
-        for platform_domain, config in JOB_PLATFORMS.items():
-            if domain.endswith(platform_domain):
-                return True, config
-
-        return False, None
+        config = get_platform_config(self.extract_domain(url))
+        return config is not None, config
 
     def extract_company_from_url(self, url: str, pattern: str) -> str | None:
         """
@@ -177,12 +201,10 @@ class JobParser:
         Used for job platforms where company is in the URL path/subdomain.
         """
         try:
-            match = re.search(pattern, url, re.IGNORECASE)
+            match = compile_url_pattern(pattern).search(url)
             if match:
-                company = match.group(1)
                 # Clean up: replace hyphens/underscores with spaces, title case
-                company = company.replace("-", " ").replace("_", " ")
-                company = company.title()
+                company = match.group(1).translate(_SLUG_TRANSLATION).title()
                 logger.info(f"Extracted company from URL: {company}")
                 return company
         except Exception as e:
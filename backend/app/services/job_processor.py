@@ -8,30 +8,118 @@ Flow:
 4. If unknown: set job to NEEDS_INPUT status for user to classify
 5. When user provides info: learn and save the pattern for future use
 """
+import asyncio
+import functools
 import re
+import time
 from datetime import datetime
-from sqlalchemy import select
+from urllib.parse import ParseResult, urlparse
+
+from sqlalchemy import insert, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.database import AsyncSessionLocal
 from app.models.job import Job, JobStatus
 from app.models.site_selector import SiteSelector, SiteType
 from app.models.activity import ActivityLog, ActionType
 from app.services.job_parser import (
     JobParser,
-    JOB_PLATFORMS,
-    KNOWN_COMPANY_SITES,
+    compile_url_pattern,
+    get_known_company,
+    get_platform_config,
 )
 from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Domains that have a SiteSelector row, mirrored in memory so domains without
+# one (pre-configured platforms, unknown sites) skip the per-job DB lookup.
+# Refreshed every _KNOWN_DOMAINS_TTL seconds as a safety net for external writes.
+_KNOWN_DOMAINS_TTL = 300
+_known_domains: set[str] | None = None
+_known_domains_expires_at = 0.0
+
+
+def remember_selector_domain(domain: str) -> None:
+    """Record that a SiteSelector now exists for domain."""
+    if _known_domains is not None:
+        _known_domains.add(domain)
+
+
+def invalidate_selector_cache() -> None:
+    """Drop the known-domain cache; it is reloaded on next use."""
+    global _known_domains
+    _known_domains = None
+
+
+# User-facing site_type strings -> SiteType (anything unknown is a company site)
+_SITE_TYPE_MAP = {"platform": SiteType.PLATFORM, "company": SiteType.COMPANY}
+
+# Separators ignored when comparing company names to URL segments
+_SEPARATOR_DELETION = str.maketrans("", "", " -_")
+
+
+def _normalize_company(name: str) -> str:
+    """Lowercase and strip spaces/hyphens/underscores in one translate pass."""
+    return name.lower().translate(_SEPARATOR_DELETION)
+
+
+@functools.lru_cache(maxsize=256)
+def _company_matchers(company_name: str) -> tuple[re.Pattern, re.Pattern]:
+    """
+    Build (and cache per company name) the regexes used to locate a company in a URL.
+
+    Returns:
+        - segment regex: finds the normalized name inside a raw subdomain/path
+          segment, allowing the hyphens/underscores that normalization strips
+        - variant regex: one case-insensitive alternation of the name's spellings
+          ("acme corp", "acme-corp", "acme_corp", "acmecorp") so a single scan of
+          the original URL finds the first one, without a lowercased copy
+    """
+    company_normalized = _normalize_company(company_name)
+    segment_re = re.compile(
+        "[-_]*".join(map(re.escape, company_normalized)), re.IGNORECASE
+    )
+
+    company_lower = company_name.lower()
+    variants = dict.fromkeys([
+        company_lower,
+        company_lower.replace(" ", "-"),
+        company_lower.replace(" ", "_"),
+        company_lower.replace(" ", ""),
+    ])
+    variant_re = re.compile("|".join(map(re.escape, variants)), re.IGNORECASE)
+    return segment_re, variant_re
+
+
+async def _get_known_domains(db: AsyncSession) -> set[str]:
+    """Return the set of domains that have a SiteSelector, loading it if stale."""
+    global _known_domains, _known_domains_expires_at
+
+    if _known_domains is None or time.monotonic() >= _known_domains_expires_at:
+        result = await db.execute(select(SiteSelector.domain))
+        _known_domains = set(result.scalars().all())
+        _known_domains_expires_at = time.monotonic() + _KNOWN_DOMAINS_TTL
+    return _known_domains
+
 
 class JobProcessor:
     """Handles job URL processing and company name extraction."""
 
-    def __init__(self, db: AsyncSession):
+    def __init__(self, db: AsyncSession, activity_rows: list[dict] | None = None):
         self.db = db
         self.parser = JobParser()
+        # When set, activity logs are collected here for one bulk INSERT
+        # by the caller instead of being added to the session one by one
+        self.activity_rows = activity_rows
+
+    def _log_activity(self, **fields) -> None:
+        """Record an ActivityLog row (buffered if the caller batches inserts)."""
+        if self.activity_rows is not None:
+            # Same keys on every row so they form one executemany
+            self.activity_rows.append({"details": None, "job_id": None, **fields})
+        else:
+            self.db.add(ActivityLog(**fields))
 
     async def process_job(self, job_id: int) -> dict:
         """
@@ -43,16 +131,20 @@ class JobProcessor:
             - needs_input: bool (if user needs to provide company name)
             - message: str
         """
-        # Get job from database
-        result = await self.db.execute(select(Job).where(Job.id == job_id))
+        # Claim the job: set status to processing and load it in one round-trip
+        result = await self.db.execute(
+            update(Job)
+            .where(Job.id == job_id)
+            .values(status=JobStatus.PROCESSING)
+            .returning(Job)
+        )
         job = result.scalar_one_or_none()
 
         if not job:
             return {"success": False, "message": f"Job {job_id} not found"}
 
-        # Update status to processing
-        job.status = JobStatus.PROCESSING
-        await self.db.flush()
+        # One timestamp for everything this run touches
+        now = datetime.utcnow()
 
         try:
             # Extract domain from URL
@@ -65,19 +157,19 @@ class JobProcessor:
             # Step 1: Check user-saved site selectors in database
             db_selector = await self._get_db_selector(domain)
             if db_selector:
-                return await self._handle_known_site(job, domain, db_selector)
+                return await self._handle_known_site(job, domain, db_selector, now)
 
             # Step 2: Check pre-configured job platforms
-            is_platform, platform_config = self.parser.is_job_platform(job.url)
-            if is_platform and platform_config:
+            platform_config = get_platform_config(domain)
+            if platform_config:
                 logger.info(f"Detected pre-configured job platform: {domain}")
-                return await self._handle_preconfigured_platform(job, domain, platform_config)
+                return await self._handle_preconfigured_platform(job, domain, platform_config, now)
 
             # Step 3: Check known company career sites
-            is_known, company_name = self.parser.is_known_company_site(job.url)
-            if is_known and company_name:
+            company_name = get_known_company(domain)
+            if company_name:
                 logger.info(f"Detected known company site: {domain} -> {company_name}")
-                return await self._handle_known_company_site(job, domain, company_name)
+                return await self._handle_known_company_site(job, domain, company_name, now)
 
             # Step 4: Unknown domain - need user input
             return await self._request_user_input(job, domain)
@@ -88,38 +180,40 @@ class JobProcessor:
             job.error_message = str(e)
 
             # Log error
-            activity = ActivityLog(
+            self._log_activity(
                 action_type=ActionType.ERROR,
                 description=f"Failed to process job: {e}",
                 details={"job_id": job_id, "error": str(e)},
                 job_id=job.id,
             )
-            self.db.add(activity)
 
             return {"success": False, "message": str(e)}
 
     async def _get_db_selector(self, domain: str) -> SiteSelector | None:
         """Get selector for domain from database."""
+        if domain not in await _get_known_domains(self.db):
+            return None
+
         result = await self.db.execute(
             select(SiteSelector).where(SiteSelector.domain == domain)
         )
         return result.scalar_one_or_none()
 
     async def _handle_known_site(
-        self, job: Job, domain: str, selector: SiteSelector
+        self, job: Job, domain: str, selector: SiteSelector, now: datetime
     ) -> dict:
         """Handle a URL from a known site (saved in database)."""
         # Update last_used_at
-        selector.last_used_at = datetime.utcnow()
+        selector.last_used_at = now
 
         if selector.site_type == SiteType.COMPANY:
             # Company website - use saved company name
             company_name = selector.company_name
             job.company_name = company_name
             job.status = JobStatus.COMPLETED
-            job.processed_at = datetime.utcnow()
+            job.processed_at = now
 
-            activity = ActivityLog(
+            self._log_activity(
                 action_type=ActionType.COMPANY_EXTRACTED,
                 description=f"Company from known site: {company_name}",
                 details={
@@ -130,7 +224,6 @@ class JobProcessor:
                 },
                 job_id=job.id,
             )
-            self.db.add(activity)
 
             logger.info(f"Used saved company name: {company_name}")
             return {
@@ -149,9 +242,9 @@ class JobProcessor:
                 if company_name:
                     job.company_name = company_name
                     job.status = JobStatus.COMPLETED
-                    job.processed_at = datetime.utcnow()
+                    job.processed_at = now
 
-                    activity = ActivityLog(
+                    self._log_activity(
                         action_type=ActionType.COMPANY_EXTRACTED,
                         description=f"Company extracted from platform URL: {company_name}",
                         details={
@@ -163,7 +256,6 @@ class JobProcessor:
                         },
                         job_id=job.id,
                     )
-                    self.db.add(activity)
 
                     logger.info(f"Extracted company from platform URL: {company_name}")
                     return {
@@ -179,7 +271,7 @@ class JobProcessor:
             return await self._request_user_input(job, domain)
 
     async def _handle_preconfigured_platform(
-        self, job: Job, domain: str, platform_config: dict
+        self, job: Job, domain: str, platform_config: dict, now: datetime
     ) -> dict:
         """Handle job URLs from pre-configured platforms (greenhouse, lever, etc.)."""
         company_name = None
@@ -193,9 +285,9 @@ class JobProcessor:
         if company_name:
             job.company_name = company_name
             job.status = JobStatus.COMPLETED
-            job.processed_at = datetime.utcnow()
+            job.processed_at = now
 
-            activity = ActivityLog(
+            self._log_activity(
                 action_type=ActionType.COMPANY_EXTRACTED,
                 description=f"Extracted company from platform URL: {company_name}",
                 details={
@@ -206,7 +298,6 @@ class JobProcessor:
                 },
                 job_id=job.id,
             )
-            self.db.add(activity)
 
             logger.info(f"Extracted company from pre-configured platform URL: {company_name}")
             return {
@@ -222,14 +313,14 @@ class JobProcessor:
         return await self._request_user_input(job, domain, is_known_platform=True)
 
     async def _handle_known_company_site(
-        self, job: Job, domain: str, company_name: str
+        self, job: Job, domain: str, company_name: str, now: datetime
     ) -> dict:
         """Handle job URLs from known company career sites (built-in list)."""
         job.company_name = company_name
         job.status = JobStatus.COMPLETED
-        job.processed_at = datetime.utcnow()
+        job.processed_at = now
 
-        activity = ActivityLog(
+        self._log_activity(
             action_type=ActionType.COMPANY_EXTRACTED,
             description=f"Company from known site: {company_name}",
             details={
@@ -240,7 +331,6 @@ class JobProcessor:
             },
             job_id=job.id,
         )
-        self.db.add(activity)
 
         logger.info(f"Used built-in company mapping: {domain} -> {company_name}")
         return {
@@ -257,7 +347,7 @@ class JobProcessor:
         job.status = JobStatus.NEEDS_INPUT
 
         # Log activity
-        activity = ActivityLog(
+        self._log_activity(
             action_type=ActionType.COMPANY_INPUT_NEEDED,
             description=f"Unknown job site: {domain}. User input needed.",
             details={
@@ -267,7 +357,6 @@ class JobProcessor:
             },
             job_id=job.id,
         )
-        self.db.add(activity)
 
         logger.info(f"Job {job.id} needs user input for domain: {domain}")
         return {
@@ -306,20 +395,23 @@ class JobProcessor:
         job.status = JobStatus.COMPLETED
         job.processed_at = datetime.utcnow()
 
-        domain = self.parser.extract_domain(job.url)
+        # Parse once - reused for the domain and for pattern generation
+        parsed = self.parser.parse_url(job.url)
+        domain = self.parser.extract_domain(job.url, parsed) if parsed else ""
 
         # Learn and save the pattern
         if domain:
             await self._learn_site_pattern(
                 domain=domain,
                 url=job.url,
+                parsed=parsed,
                 company_name=company_name,
                 site_type=site_type,
                 platform_name=platform_name,
             )
 
         # Log activity
-        activity = ActivityLog(
+        self._log_activity(
             action_type=ActionType.COMPANY_EXTRACTED,
             description=f"Company provided by user: {company_name}",
             details={
@@ -331,7 +423,6 @@ class JobProcessor:
             },
             job_id=job.id,
         )
-        self.db.add(activity)
 
         logger.info(f"Job {job_id} completed with user-provided company: {company_name}")
         return {
@@ -347,20 +438,20 @@ class JobProcessor:
         company_name: str,
         site_type: str,
         platform_name: str | None = None,
+        parsed: ParseResult | None = None,
     ):
         """Learn and save URL pattern for a site."""
-        # Check if already exists
-        result = await self.db.execute(
-            select(SiteSelector).where(SiteSelector.domain == domain)
-        )
-        existing = result.scalar_one_or_none()
+        # Check if already exists (no query for domains without a selector)
+        existing = await self._get_db_selector(domain)
 
-        site_type_enum = SiteType.PLATFORM if site_type == "platform" else SiteType.COMPANY
+        site_type_enum = _SITE_TYPE_MAP.get(site_type, SiteType.COMPANY)
 
         # Generate URL pattern for platforms
         url_pattern = None
         if site_type == "platform":
-            url_pattern = self._generate_url_pattern(url, company_name)
+            url_pattern = self._known_platform_pattern(domain, url)
+            if url_pattern is None:
+                url_pattern = self._generate_url_pattern(url, company_name, parsed)
 
         if existing:
             # Update existing
@@ -383,9 +474,10 @@ class JobProcessor:
                 example_company=company_name,
             )
             self.db.add(selector)
+            remember_selector_domain(domain)
 
             # Log activity
-            activity = ActivityLog(
+            self._log_activity(
                 action_type=ActionType.SELECTOR_LEARNED,
                 description=f"Learned pattern for domain: {domain} ({site_type})",
                 details={
@@ -395,41 +487,54 @@ class JobProcessor:
                     "url_pattern": url_pattern,
                 },
             )
-            self.db.add(activity)
             logger.info(f"Created new site pattern for domain: {domain}")
 
-    def _generate_url_pattern(self, url: str, company_name: str) -> str | None:
+    def _known_platform_pattern(self, domain: str, url: str) -> str | None:
+        """
+        Return the pre-configured pattern for a well-known platform domain.
+
+        Only used if it actually extracts a company from this URL - users are
+        usually asked about a known platform precisely because its pattern
+        didn't match, in which case we fall back to inferring a new one.
+        """
+        platform_config = get_platform_config(domain)
+        if not platform_config or "company_from_url" not in platform_config:
+            return None
+
+        pattern = platform_config["company_from_url"]
+        if compile_url_pattern(pattern).search(url):
+            logger.info(f"Using pre-configured pattern for platform: {domain}")
+            return pattern
+        return None
+
+    def _generate_url_pattern(
+        self, url: str, company_name: str, parsed: ParseResult | None = None
+    ) -> str | None:
         """
         Generate a regex pattern to extract company name from URL.
 
         Analyzes the URL to find where the company name appears and creates
         a pattern that can extract it from similar URLs.
         """
-        from urllib.parse import urlparse
-
         try:
-            parsed = urlparse(url)
+            if parsed is None:
+                parsed = urlparse(url)
 
-            # Normalize company name for matching (lowercase, no spaces/hyphens)
-            company_normalized = company_name.lower().replace(" ", "").replace("-", "").replace("_", "")
+            company_re, variant_re = _company_matchers(company_name)
 
             # Check subdomain
             host_parts = parsed.netloc.split(".")
-            if len(host_parts) > 2:
-                subdomain = host_parts[0].lower()
-                subdomain_normalized = subdomain.replace("-", "").replace("_", "")
-                if subdomain_normalized == company_normalized or company_normalized in subdomain_normalized:
-                    # Company is in subdomain: pattern like "([^.]+).domain.com"
-                    base_domain = ".".join(host_parts[1:])
-                    pattern = rf"([^.]+)\.{re.escape(base_domain)}"
-                    logger.info(f"Generated subdomain pattern: {pattern}")
-                    return pattern
+            if len(host_parts) > 2 and company_re.search(host_parts[0]):
+                # Company is in subdomain: pattern like "([^.]+).domain.com"
+                base_domain = ".".join(host_parts[1:])
+                pattern = rf"([^.]+)\.{re.escape(base_domain)}"
+                logger.info(f"Generated subdomain pattern: {pattern}")
+                return pattern
 
             # Check URL path segments
             path_parts = [p for p in parsed.path.split("/") if p]
             for i, part in enumerate(path_parts):
-                part_normalized = part.lower().replace("-", "").replace("_", "")
-                if part_normalized == company_normalized or company_normalized in part_normalized:
+                if company_re.search(part):
                     # Company is in this path segment
                     # Build pattern: domain/path1/path2/([^/]+)/...
                     domain_escaped = re.escape(parsed.netloc)
@@ -443,26 +548,17 @@ class JobProcessor:
                     return pattern
 
             # Fallback: try to find company name directly in URL
-            company_variants = [
-                company_name.lower(),
-                company_name.lower().replace(" ", "-"),
-                company_name.lower().replace(" ", "_"),
-                company_name.lower().replace(" ", ""),
-            ]
-
-            url_lower = url.lower()
-            for variant in company_variants:
-                if variant in url_lower:
-                    # Found it - try to build a pattern
-                    # This is a basic fallback
-                    idx = url_lower.find(variant)
-                    before = url[:idx]
-                    after = url[idx + len(variant):]
-
-                    # Find the boundaries (/, ., -, _, or end)
-                    pattern = re.escape(before) + r"([^/.\-_]+)"
-                    logger.info(f"Generated fallback pattern: {pattern}")
-                    return pattern
+            # (single pass over the URL for all spelling variants at once)
+            match = variant_re.search(url)
+            if match:
+                # Found it - build a pattern from everything before the match
+                # This is a basic fallback
+                before = url[:match.start()]
+
+                # Find the boundaries (/, ., -, _, or end)
+                pattern = re.escape(before) + r"([^/.\-_]+)"
+                logger.info(f"Generated fallback pattern: {pattern}")
+                return pattern
 
             logger.warning(f"Could not generate URL pattern for: {url}")
             return None
@@ -491,3 +587,93 @@ async def process_job_background(job_id: int, db: AsyncSession):
     processor = JobProcessor(db)
     await processor.process_job(job_id)
     await db.commit()
+
+
+class JobDispatcher:
+    """
+    Queues submitted jobs and processes them in batches.
+
+    A single worker drains the queue, collecting up to BATCH_SIZE job ids
+    that arrive within BATCH_WINDOW seconds of each other, then processes
+    the whole batch with one session and one commit, instead of a session +
+    commit per job. A single worker is used on purpose since SQLite
+    (desktop mode) only allows one writer at a time.
+    """
+
+    BATCH_SIZE = 32
+    BATCH_WINDOW = 0.05  # seconds
+
+    def __init__(self):
+        self._queue: asyncio.Queue[int] | None = None
+        self._worker: asyncio.Task | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    async def submit(self, job_id: int) -> None:
+        """Queue a job for processing, starting the worker if needed."""
+        loop = asyncio.get_running_loop()
+        if self._worker is None or self._worker.done() or self._loop is not loop:
+            self._loop = loop
+            self._queue = asyncio.Queue()
+            self._worker = asyncio.create_task(self._run())
+        self._queue.put_nowait(job_id)
+
+    async def stop(self) -> None:
+        """Cancel the worker (on app shutdown)."""
+        if self._worker and not self._worker.done():
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+        self._worker = None
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.BATCH_WINDOW
+            while len(batch) < self.BATCH_SIZE:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+
+            try:
+                await self._process_batch(batch)
+            except Exception as e:
+                logger.error(f"Batch processing failed for jobs {batch}: {e}")
+
+    async def _process_batch(self, job_ids: list[int]) -> None:
+        """Process a batch in one session; fall back to one-by-one if the commit fails."""
+        async with AsyncSessionLocal() as db:
+            try:
+                activity_rows: list[dict] = []
+                processor = JobProcessor(db, activity_rows=activity_rows)
+                for job_id in job_ids:
+                    await processor.process_job(job_id)
+                await db.flush()
+                # One Core INSERT for the whole batch's activity logs
+                if activity_rows:
+                    await db.execute(insert(ActivityLog), activity_rows)
+                await db.commit()
+                return
+            except Exception as e:
+                logger.error(f"Batch of {len(job_ids)} jobs failed, retrying individually: {e}")
+                await db.rollback()
+
+        if len(job_ids) == 1:
+            return
+        for job_id in job_ids:
+            async with AsyncSessionLocal() as db:
+                try:
+                    await process_job_background(job_id, db)
+                except Exception as e:
+                    logger.error(f"Background task failed for job {job_id}: {e}")
+                    await db.rollback()
+
+
+# Shared dispatcher used by the API's background tasks
+job_dispatcher = JobDispatcher()
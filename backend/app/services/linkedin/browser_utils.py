@@ -4,15 +4,30 @@ Browser utilities for LinkedIn automation.
 Contains browser context management, retry logic, and chat modal helpers.
 """
 
+import functools
 import os
+import random
+import re
+import socket
 import sys
+import time
+import weakref
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
+from types import MappingProxyType
+from typing import Mapping, final
 from contextlib import contextmanager
 
 from app.utils.logger import get_logger
+from .js_scripts import get_message_history_script
 
 logger = get_logger(__name__)
 
+try:
+    from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+except ImportError:
+    PlaywrightTimeoutError = TimeoutError
+
 
 def get_browser_data_path() -> Path:
     """
@@ -46,12 +61,91 @@ FAST_MODE = os.getenv("FAST_MODE", "true").lower() == "true"
 DELAY_MS = 300 if FAST_MODE else 1000
 
 # Retry delays in seconds: 0.2, 0.5, 1.5, 2.0
-RETRY_DELAYS = [0.2, 0.5, 1.5, 2.0]
+RETRY_DELAYS = (0.2, 0.5, 1.5, 2.0)
+
+# Post-click delays by action name, for clicks whose caller already waits for
+# the next page state. Anything not listed gets DELAY_MS.
+POST_CLICK_DELAYS: dict[str, int] = {
+    "click People tab": 0,
+    "click Connections dropdown": 0,
+    "click Show button": 0,
+}
+
+# Total time to wait for an element - same budget as the retry schedule
+RETRY_TIMEOUT_MS = int(sum(RETRY_DELAYS) * 1000)
+
+# How long a click's request gets to be answered when retry_click waits for it
+RESPONSE_TIMEOUT_MS = 10000
+
+# Polling backoff: first delay and cap, in milliseconds
+RETRY_BACKOFF_START_MS = 50
+RETRY_BACKOFF_MAX_MS = 2000
+
+# Private generator for retry jitter, so retries don't contend on the global one
+_rng = random.Random()
+
+
+def _backoff_delays(total_ms: int = RETRY_TIMEOUT_MS):
+    """
+    Yield polling delays in seconds: 0 for an immediate first attempt,
+    then full-jitter delays drawn from [0, ceiling], where the ceiling
+    doubles from RETRY_BACKOFF_START_MS up to RETRY_BACKOFF_MAX_MS,
+    until total_ms has been spent.
+
+    The jitter keeps concurrent jobs from retrying on the same offsets.
+    """
+    yield 0.0
+    ceiling, spent = RETRY_BACKOFF_START_MS, 0.0
+    while spent < total_ms:
+        remaining = total_ms - spent
+        # Spend a small leftover in one go rather than in ever-smaller draws
+        step = remaining if remaining <= RETRY_BACKOFF_START_MS else _rng.uniform(0, min(ceiling, remaining))
+        yield step / 1000
+        spent += step
+        ceiling = min(ceiling * 2, RETRY_BACKOFF_MAX_MS)
+
+
+def _jittered(delay_ms: int) -> int:
+    """Add up to 50% random padding to a fixed delay."""
+    return delay_ms + _rng.randint(0, delay_ms // 2)
+
+
+# Set once the browser data directory has been created
+_browser_data_dir_ensured = False
 
 
 def ensure_browser_data_dir():
-    """Ensure browser data directory exists."""
+    """Ensure browser data directory exists (only touches the filesystem once)."""
+    global _browser_data_dir_ensured
+    if _browser_data_dir_ensured:
+        return
     BROWSER_DATA_PATH.mkdir(parents=True, exist_ok=True)
+    _browser_data_dir_ensured = True
+
+
+# Hosts the first LinkedIn page load connects to
+LINKEDIN_HOSTS = ("www.linkedin.com", "static.licdn.com", "media.licdn.com")
+
+# Lookups are blocking, so they get their own small pool
+_dns_executor = ThreadPoolExecutor(max_workers=len(LINKEDIN_HOSTS), thread_name_prefix="dns-prewarm")
+
+
+def _resolve(host: str):
+    """Resolve a host so the answer is in the OS resolver cache."""
+    try:
+        socket.getaddrinfo(host, 443, proto=socket.IPPROTO_TCP)
+    except OSError as e:
+        logger.debug(f"DNS prewarm for {host} failed: {e}")
+
+
+def prewarm_dns(hosts: tuple[str, ...] = LINKEDIN_HOSTS) -> list[Future]:
+    """
+    Start resolving LinkedIn's hosts in the background.
+
+    Called just before Chromium launches, so the lookups overlap with
+    browser startup instead of delaying the first navigation.
+    """
+    return [_dns_executor.submit(_resolve, host) for host in hosts]
 
 
 def get_browser_visibility() -> bool:
@@ -64,7 +158,7 @@ def get_browser_visibility() -> bool:
         return True  # Default to visible
 
 
-def get_browser_args(viewport: dict = None, maximized: bool = True, hidden: bool = None) -> dict:
+def get_browser_args(viewport: dict = None, maximized: bool = True, hidden: bool = None) -> Mapping:
     """
     Get standard browser launch arguments.
 
@@ -74,115 +168,546 @@ def get_browser_args(viewport: dict = None, maximized: bool = True, hidden: bool
         hidden: If True, position window off-screen. If None, uses app settings.
 
     Returns:
-        Dict of arguments for launch_persistent_context
+        Read-only mapping of arguments for launch_persistent_context
     """
     # Determine if browser should be hidden
     if hidden is None:
         hidden = not get_browser_visibility()
 
+    size = (viewport["width"], viewport["height"]) if viewport else None
+    args = _build_browser_args(size, maximized, hidden)
+    if "viewport" not in args:
+        return args
+    # Playwright serializes the viewport as JSON, so it has to stay a plain
+    # dict - give each caller its own instead of the cached one
+    return MappingProxyType({**args, "viewport": dict(args["viewport"])})
+
+
+@functools.lru_cache(maxsize=8)
+def _build_browser_args(size: tuple[int, int] | None, maximized: bool, hidden: bool) -> Mapping:
+    """
+    Build (once per combination) the launch arguments for get_browser_args.
+
+    The result is shared between calls, so argument lists are tuples.
+    """
     if hidden:
         # Position window far off-screen (not headless - that's detected by LinkedIn)
-        return {
+        return MappingProxyType({
             "headless": False,
             "viewport": {"width": 1280, "height": 720},
-            "args": ["--window-position=-32000,-32000", "--window-size=1300,750"],
-        }
+            "args": ("--window-position=-32000,-32000", "--window-size=1300,750"),
+        })
 
     if maximized:
-        return {
+        return MappingProxyType({
             "headless": False,
             "no_viewport": True,
-            "args": ["--start-maximized"],
-        }
+            "args": ("--start-maximized",),
+        })
 
-    return {
+    width, height = size or (1280, 720)
+    return MappingProxyType({
         "headless": False,
-        "viewport": viewport or {"width": 1280, "height": 720},
-        "args": ["--window-size=1300,750", "--window-position=100,100"],
+        "viewport": {"width": width, "height": height},
+        "args": ("--window-size=1300,750", "--window-position=100,100"),
+    })
+
+
+@functools.lru_cache(maxsize=256)
+def compile_selectors(selectors: tuple[str, ...]) -> tuple[str, tuple[str, ...]]:
+    """
+    Pre-join a selector list for the combined Playwright queries.
+
+    Args:
+        selectors: Tuple of CSS selectors, in priority order
+
+    Returns:
+        Tuple of (combined selector string, individual selectors)
+    """
+    return ", ".join(selectors), selectors
+
+
+def _as_compiled(selectors) -> tuple[str, tuple[str, ...]]:
+    """Accept a selector list or a compile_selectors() result."""
+    if isinstance(selectors, tuple) and len(selectors) == 2 and isinstance(selectors[1], tuple):
+        return selectors
+    return compile_selectors(tuple(selectors))
+
+
+def _query_first(root, compiled: tuple[str, tuple[str, ...]]):
+    """
+    Find the first element matching any of the selectors, in selector order.
+
+    The selectors are first probed with a single combined query, so a miss
+    (the common case while polling) costs one round-trip instead of one per
+    selector. On a hit, the selectors are resolved individually to keep the
+    list's priority order and to report which one matched.
+
+    Args:
+        root: Playwright page or element handle to search within
+        compiled: Selectors as returned by compile_selectors()
+
+    Returns:
+        Tuple of (element, selector), or (None, None) if nothing matched
+    """
+    combined, selectors = compiled
+    if len(selectors) > 1:
+        try:
+            if not root.query_selector(combined):
+                return None, None
+        except Exception as e:
+            # One of the selectors is invalid on its own terms - probe individually
+            logger.debug(f"Combined selector query failed: {e}")
+
+    for selector in selectors:
+        try:
+            element = root.query_selector(selector)
+            if element:
+                return element, selector
+        except Exception as e:
+            logger.debug(f"Selector {selector} failed: {e}")
+    return None, None
+
+
+# Resolves a selector list in priority order inside the page. Trailing
+# Playwright :has-text('...') filters (one or more) are emulated as
+# case-insensitive substring matches on the element's text; any other
+# non-CSS selector makes querySelectorAll throw.
+FIRST_MATCH_JS = r"""
+(root, selectors) => {
+    const hasText = /:has-text\((['"])([^'"]*)\1\)$/;
+    for (const selector of selectors) {
+        let css = selector;
+        const texts = [];
+        for (let m = hasText.exec(css); m; m = hasText.exec(css)) {
+            texts.push(m[2].toLowerCase());
+            css = css.slice(0, m.index);
+        }
+        for (const el of root.querySelectorAll(css || '*')) {
+            const content = (el.textContent || '').replace(/\s+/g, ' ').toLowerCase();
+            if (texts.every((text) => content.includes(text))) return el;
+        }
     }
+    return null;
+}
+"""
+
+
+# Index of the first selector with a match in the page, or -1
+FIRST_MATCH_INDEX_JS = f"""
+(selectors) => {{
+    const firstMatch = {FIRST_MATCH_JS.strip()};
+    return selectors.findIndex((selector) => firstMatch(document, [selector]));
+}}
+"""
+
+
+def _find_first_matching(root, compiled: tuple[str, tuple[str, ...]]):
+    """
+    Resolve the selectors in priority order with a single evaluation.
+
+    Args:
+        root: Playwright element handle to search within
+        compiled: Selectors as returned by compile_selectors()
+
+    Returns:
+        The first matching element handle, or None
+
+    Raises:
+        Exception: If a selector can't be evaluated by the browser natively
+    """
+    return root.evaluate_handle(FIRST_MATCH_JS, list(compiled[1])).as_element()
+
+
+def find_first(root, selectors):
+    """
+    Look up the first matching selector inside an element, without waiting.
 
+    Args:
+        root: Playwright element handle to search within
+        selectors: List of CSS selectors to try, or a compile_selectors() result
+
+    Returns:
+        The first matching element handle, or None
+    """
+    compiled = _as_compiled(selectors)
+    try:
+        return _find_first_matching(root, compiled)
+    except Exception as e:
+        logger.debug(f"Batched lookup failed: {e}")
+        return _query_first(root, compiled)[0]
+
+
+# Runs FIRST_MATCH_JS against the whole document
+FIRST_MATCH_PAGE_JS = f"""
+(selectors) => ({FIRST_MATCH_JS.strip()})(document, selectors)
+"""
+
+
+def find_first_in_page(page, selectors):
+    """
+    Look up the first matching selector in the page, without waiting.
+
+    Args:
+        page: Playwright page object
+        selectors: List of CSS selectors to try, or a compile_selectors() result
+
+    Returns:
+        The first matching element handle, or None
+    """
+    compiled = _as_compiled(selectors)
+    try:
+        return page.evaluate_handle(FIRST_MATCH_PAGE_JS, list(compiled[1])).as_element()
+    except Exception as e:
+        logger.debug(f"Batched lookup failed: {e}")
+        return _query_first(page, compiled)[0]
+
+
+# Runs FIRST_MATCH_JS once per container, so a whole result list is searched
+# in one evaluation instead of one round-trip per card.
+FIRST_MATCH_EACH_JS = f"""
+([container, selectors]) => {{
+    const firstMatch = {FIRST_MATCH_JS.strip()};
+    return Array.from(document.querySelectorAll(container), (root) => firstMatch(root, selectors));
+}}
+"""
+
+
+def find_first_in_each(page, container_selector: str, selectors) -> list:
+    """
+    Look up the first matching selector inside every matching container.
 
+    Nothing is written to the page; the matches come back as one array
+    handle and are unpacked locally.
+
+    Args:
+        page: Playwright page object
+        container_selector: CSS selector for the containers, in document order
+        selectors: List of CSS selectors to try, or a compile_selectors() result
+
+    Returns:
+        One element handle (or None) per container
+
+    Raises:
+        Exception: If a selector can't be evaluated by the browser natively
+    """
+    compiled = _as_compiled(selectors)
+    array = page.evaluate_handle(FIRST_MATCH_EACH_JS, [container_selector, list(compiled[1])])
+    try:
+        properties = array.get_properties()
+        indexes = sorted(int(key) for key in properties if key.isdigit())
+        return [properties[str(i)].as_element() for i in indexes]
+    finally:
+        array.dispose()
+
+
+def _wait_for_first(page, root, compiled: tuple[str, tuple[str, ...]], action_name: str):
+    """
+    Wait until any of the selectors is attached, then resolve it in order.
+
+    Waiting is delegated to Playwright, which polls inside the browser and
+    returns as soon as the element appears instead of at the next retry
+    boundary. If the combined selector can't be waited on, falls back to
+    polling with an exponential backoff.
+
+    Args:
+        page: Playwright page object (for wait_for_timeout)
+        root: Page or element handle to search within
+        compiled: Selectors as returned by compile_selectors()
+        action_name: Human-readable name for logging
+
+    Returns:
+        Tuple of (element, selector), or (None, None) if nothing appeared
+    """
+    try:
+        root.wait_for_selector(compiled[0], state="attached", timeout=RETRY_TIMEOUT_MS)
+    except PlaywrightTimeoutError:
+        return None, None
+    except Exception as e:
+        logger.debug(f"Waiting for '{action_name}' failed: {e}, polling instead")
+        for attempt, delay in enumerate(_backoff_delays()):
+            if delay > 0:
+                logger.debug(f"Retry {attempt} for {action_name} - waiting {delay}s...")
+                page.wait_for_timeout(int(delay * 1000))
+            element, selector = _query_first(root, compiled)
+            if element:
+                return element, selector
+        return None, None
+
+    if root is not page and len(compiled[1]) > 1:
+        # One round-trip for the whole cascade instead of one per selector
+        try:
+            element = _find_first_matching(root, compiled)
+            if element:
+                return element, compiled[0]
+        except Exception as e:
+            logger.debug(f"Batched lookup for '{action_name}' failed: {e}")
+
+    return _query_first(root, compiled)
+
+
+def _locate_first(page, compiled: tuple[str, tuple[str, ...]], action_name: str):
+    """
+    Wait for any of the selectors on the page and return a Locator for it.
+
+    Locators re-resolve on every action and carry Playwright's auto-waiting,
+    so the caller's click/fill survives the element being re-rendered.
+    If the combined selector can't be waited on, falls back to
+    _wait_for_first, which returns an element handle.
+
+    Args:
+        page: Playwright page object
+        compiled: Selectors as returned by compile_selectors()
+        action_name: Human-readable name for logging
+
+    Returns:
+        Tuple of (locator, selector), or (None, None) if nothing appeared
+    """
+    combined, selectors = compiled
+    try:
+        page.locator(combined).first.wait_for(state="attached", timeout=RETRY_TIMEOUT_MS)
+    except PlaywrightTimeoutError:
+        return None, None
+    except Exception as e:
+        logger.debug(f"Locator wait for '{action_name}' failed: {e}")
+        return _wait_for_first(page, page, compiled, action_name)
+
+    if len(selectors) == 1:
+        return page.locator(combined).first, combined
+
+    # Keep the list's priority order rather than document order, picking
+    # the winner in one evaluation where the browser can run the selectors
+    try:
+        index = page.evaluate(FIRST_MATCH_INDEX_JS, list(selectors))
+        if index >= 0:
+            return page.locator(selectors[index]).first, selectors[index]
+    except Exception as e:
+        logger.debug(f"Batched lookup for '{action_name}' failed: {e}")
+
+    for selector in selectors:
+        locator = page.locator(selector).first
+        try:
+            if locator.count():
+                return locator, selector
+        except Exception as e:
+            logger.debug(f"Selector {selector} failed: {e}")
+    return None, None
+
+
+# True once no chat dialog or conversation bubble is left, in light or shadow DOM
+NO_CHAT_OPEN_JS = """
+    () => {
+        const selector = '[role="dialog"], .msg-overlay-conversation-bubble';
+        if (document.querySelector(selector)) return false;
+        for (const el of document.querySelectorAll('*')) {
+            if (el.shadowRoot && el.shadowRoot.querySelector(selector)) return false;
+        }
+        return true;
+    }
+"""
+
+
+def wait_until(page, js_predicate: str, timeout_ms: int = 500) -> bool:
+    """
+    Wait for a JS predicate to hold, for at most timeout_ms.
+
+    Returns as soon as the DOM reaches the expected state instead of
+    sleeping the whole budget.
+
+    Args:
+        page: Playwright page object
+        js_predicate: JavaScript function source returning a truthy value when done
+        timeout_ms: Maximum time to wait
+
+    Returns:
+        True if the predicate held before the timeout
+    """
+    try:
+        page.wait_for_function(js_predicate, timeout=timeout_ms, polling=100)
+        return True
+    except PlaywrightTimeoutError:
+        return False
+    except Exception as e:
+        logger.debug(f"wait_for_function failed: {e}, sleeping instead")
+        page.wait_for_timeout(timeout_ms)
+        return False
+
+
+# Resource types a page only needs for display, not for reading the DOM
+HEAVY_RESOURCE_TYPES = frozenset({"image", "media", "font"})
+
+# Analytics beacons and ad pixels, which nothing on the page waits for
+TRACKING_URL = re.compile(r"linkedin\.com/li/track|doubleclick\.net/")
+
+
+def _block_heavy_resources(route):
+    """Route handler that aborts display-only and tracking requests."""
+    request = route.request
+    if request.resource_type in HEAVY_RESOURCE_TYPES or TRACKING_URL.search(request.url):
+        route.abort()
+    else:
+        route.continue_()
+
+
+@contextmanager
+def blocking_heavy_resources(page):
+    """
+    Skip images, media, fonts and tracking requests on a page for the
+    duration of the block.
+
+    For background checks that only read the DOM. Stylesheets still load,
+    so a visible page doesn't look broken once the block ends.
+    """
+    page.route("**/*", _block_heavy_resources)
+    try:
+        yield page
+    finally:
+        try:
+            page.unroute("**/*", _block_heavy_resources)
+        except Exception as e:
+            logger.debug(f"Failed to remove resource filter: {e}")
+
+
+@final
 class RetryHelper:
     """Helper class for retry logic with progressive delays."""
 
+    __slots__ = ()
+
     @staticmethod
-    def retry_click(page, selectors: list[str], action_name: str, delay_ms: int = DELAY_MS) -> bool:
+    def _retry_core(
+        page, element, selectors, action_name: str,
+        click: bool = False, delay_ms: int | None = None, wait_response=None,
+    ):
         """
-        Retry clicking an element with progressive delays.
+        Shared find-and-optionally-click path for all retry methods.
 
         Args:
             page: Playwright page object
-            selectors: List of CSS selectors to try
+            element: Parent element to search within, or None for the whole page
+            selectors: List of CSS selectors to try, or a compile_selectors() result
             action_name: Human-readable name for logging
-            delay_ms: Delay after successful click
+            click: Whether to click the found element
+            delay_ms: Delay after successful click (default: POST_CLICK_DELAYS or DELAY_MS),
+                padded by up to 50% jitter
+            wait_response: URL pattern or predicate for the response the click
+                triggers; awaited (up to RESPONSE_TIMEOUT_MS) instead of sleeping.
+                In-page actions don't change the load state, so this - not a
+                load-state wait - is how to wait for what they sent
 
         Returns:
-            True if click succeeded
+            The found (and clicked) element, or None on failure
+        """
+        compiled = _as_compiled(selectors)
+        if element is None:
+            found, selector = _locate_first(page, compiled, action_name)
+            log = logger.info
+        else:
+            found, selector = _wait_for_first(page, element, compiled, action_name)
+            log = logger.debug
+
+        if not found:
+            logger.debug(f"Could not find element for '{action_name}' after retries")
+            return None
+        log(f"Found element for '{action_name}' with selector: {selector}")
+
+        if click:
+            if delay_ms is None:
+                delay_ms = POST_CLICK_DELAYS.get(action_name, DELAY_MS)
+            if wait_response is not None:
+                return RetryHelper._click_and_wait_for_response(page, found, selector, action_name, wait_response)
+            try:
+                found.click(timeout=RETRY_TIMEOUT_MS)
+            except Exception as e:
+                logger.debug(f"Selector {selector} failed: {e}")
+                return None
+            if delay_ms:
+                page.wait_for_timeout(_jittered(delay_ms))
+        return found
 
-        Raises:
-            Exception if all retries fail
+    @staticmethod
+    def _click_and_wait_for_response(page, found, selector: str, action_name: str, wait_response):
         """
-        for attempt, delay in enumerate([0] + RETRY_DELAYS):
-            if delay > 0:
-                logger.info(f"Retry {attempt}/{len(RETRY_DELAYS)} for {action_name} - waiting {delay}s...")
-                page.wait_for_timeout(int(delay * 1000))
+        Click and wait for the request the click sends to be answered.
 
-            for selector in selectors:
-                try:
-                    element = page.query_selector(selector)
-                    if element:
-                        logger.info(f"Found element for '{action_name}' with selector: {selector}")
-                        element.click()
-                        page.wait_for_timeout(delay_ms)
-                        return True
-                except Exception as e:
-                    logger.debug(f"Selector {selector} failed: {e}")
-                    continue
-
-            if delay == 0:
-                logger.info(f"First attempt for '{action_name}' failed, starting retries...")
+        Returns:
+            The clicked element, or None if the click failed or the response
+            never came back (or came back with an error status)
+        """
+        try:
+            with page.expect_response(wait_response, timeout=RESPONSE_TIMEOUT_MS) as response_info:
+                found.click(timeout=RETRY_TIMEOUT_MS)
+            response = response_info.value
+        except PlaywrightTimeoutError:
+            logger.warning(f"No response to '{action_name}' within {RESPONSE_TIMEOUT_MS}ms")
+            return None
+        except Exception as e:
+            logger.debug(f"Selector {selector} failed: {e}")
+            return None
+        if not response.ok:
+            logger.warning(f"'{action_name}' got HTTP {response.status}")
+            return None
+        return found
 
+    @staticmethod
+    def _fail(action_name: str):
+        """Log and raise the standard retry failure."""
         error_msg = f"Failed to {action_name} after {len(RETRY_DELAYS)} retries"
         logger.error(error_msg)
         raise Exception(error_msg)
 
     @staticmethod
-    def retry_find(page, selectors: list[str], action_name: str):
+    def retry_click(
+        page, selectors: list[str], action_name: str,
+        delay_ms: int | None = None, wait_response=None,
+    ) -> bool:
         """
-        Retry finding an element with progressive delays.
+        Retry clicking an element with progressive delays.
 
         Args:
             page: Playwright page object
-            selectors: List of CSS selectors to try
+            selectors: List of CSS selectors to try, or a compile_selectors() result
             action_name: Human-readable name for logging
+            delay_ms: Delay after successful click (default: POST_CLICK_DELAYS or DELAY_MS),
+                padded by up to 50% jitter
+            wait_response: URL pattern or predicate for the response the click
+                triggers; awaited (up to RESPONSE_TIMEOUT_MS) instead of sleeping.
+                In-page actions don't change the load state, so this - not a
+                load-state wait - is how to wait for what they sent
 
         Returns:
-            The found element
+            True if click succeeded
 
         Raises:
             Exception if all retries fail
         """
-        for attempt, delay in enumerate([0] + RETRY_DELAYS):
-            if delay > 0:
-                logger.info(f"Retry {attempt}/{len(RETRY_DELAYS)} for {action_name} - waiting {delay}s...")
-                page.wait_for_timeout(int(delay * 1000))
+        found = RetryHelper._retry_core(
+            page, None, selectors, action_name, click=True, delay_ms=delay_ms, wait_response=wait_response,
+        )
+        if found is None:
+            RetryHelper._fail(action_name)
+        return True
 
-            for selector in selectors:
-                try:
-                    element = page.query_selector(selector)
-                    if element:
-                        logger.info(f"Found element for '{action_name}' with selector: {selector}")
-                        return element
-                except Exception as e:
-                    logger.debug(f"Selector {selector} failed: {e}")
-                    continue
+    @staticmethod
+    def retry_find(page, selectors: list[str], action_name: str):
+        """
+        Retry finding an element with progressive delays.
 
-            if delay == 0:
-                logger.info(f"First attempt for '{action_name}' failed, starting retries...")
+        Args:
+            page: Playwright page object
+            selectors: List of CSS selectors to try, or a compile_selectors() result
+            action_name: Human-readable name for logging
 
-        error_msg = f"Failed to {action_name} after {len(RETRY_DELAYS)} retries"
-        logger.error(error_msg)
-        raise Exception(error_msg)
+        Returns:
+            A Locator for the found element
+
+        Raises:
+            Exception if all retries fail
+        """
+        found = RetryHelper._retry_core(page, None, selectors, action_name)
+        if found is None:
+            RetryHelper._fail(action_name)
+        return found
 
     @staticmethod
     def retry_find_in_element(page, element, selectors: list[str], action_name: str):
@@ -192,56 +717,368 @@ class RetryHelper:
         Args:
             page: Playwright page object (for wait_for_timeout)
             element: Parent element to search within
-            selectors: List of CSS selectors to try
+            selectors: List of CSS selectors to try, or a compile_selectors() result
             action_name: Human-readable name for logging
 
         Returns:
             The found element, or None if not found
         """
-        for attempt, delay in enumerate([0] + RETRY_DELAYS):
-            if delay > 0:
-                logger.debug(f"Retry {attempt}/{len(RETRY_DELAYS)} for {action_name} - waiting {delay}s...")
-                page.wait_for_timeout(int(delay * 1000))
-
-            for selector in selectors:
-                try:
-                    found = element.query_selector(selector)
-                    if found:
-                        logger.debug(f"Found element for '{action_name}' with selector: {selector}")
-                        return found
-                except Exception as e:
-                    logger.debug(f"Selector {selector} failed: {e}")
-                    continue
-
-        logger.debug(f"Could not find element for '{action_name}' after retries")
-        return None
+        return RetryHelper._retry_core(page, element, selectors, action_name)
 
     @staticmethod
-    def retry_click_in_element(page, element, selectors: list[str], action_name: str, delay_ms: int = DELAY_MS) -> bool:
+    def retry_click_in_element(page, element, selectors: list[str], action_name: str, delay_ms: int | None = None) -> bool:
         """
         Retry clicking an element within a parent element.
 
         Args:
             page: Playwright page object
             element: Parent element to search within
-            selectors: List of CSS selectors to try
+            selectors: List of CSS selectors to try, or a compile_selectors() result
             action_name: Human-readable name for logging
-            delay_ms: Delay after successful click
+            delay_ms: Delay after successful click (default: POST_CLICK_DELAYS or DELAY_MS),
+                padded by up to 50% jitter
 
         Returns:
             True if click succeeded, False otherwise
         """
-        found = RetryHelper.retry_find_in_element(page, element, selectors, action_name)
-        if found:
-            found.click()
-            page.wait_for_timeout(delay_ms)
-            return True
-        return False
+        return RetryHelper._retry_core(page, element, selectors, action_name, click=True, delay_ms=delay_ms) is not None
+
+
+# JS helpers for finding the messaging UI's shadow roots. The list of shadow
+# roots is cached on window between calls, so the full-document walk is only
+# repeated when a cached host is gone or the cached roots come up empty.
+SHADOW_ROOTS_JS = """
+        const cachedShadowRoots = () => {
+            const roots = window.__jobiaiShadowRoots;
+            if (roots && roots.length && roots.every(root => root.host.isConnected)) {
+                return roots;
+            }
+            return null;
+        };
+
+        const walkShadowRoots = () => {
+            const roots = [];
+            for (const el of document.querySelectorAll('*')) {
+                if (el.shadowRoot) roots.push(el.shadowRoot);
+            }
+            window.__jobiaiShadowRoots = roots;
+            return roots;
+        };
+"""
+
+
+# Close every open message dialog/overlay. Returns {closed, stillOpen}.
+CLOSE_ALL_OVERLAYS_JS = """
+    () => {""" + SHADOW_ROOTS_JS + """
+        const closeAll = (roots) => {
+            let closedCount = 0;
+
+            // LinkedIn 2026: Close each dialog via its header close control
+            // The close button is .msg-overlay-bubble-header__control but NOT .msg-overlay-conversation-bubble__expand-btn
+            const controlSelector = '[role="dialog"] .msg-overlay-bubble-header__control' +
+                                    ':not(.msg-overlay-conversation-bubble__expand-btn)';
+            const seen = new Set();
+            for (const root of roots) {
+                for (const btn of root.querySelectorAll(controlSelector)) {
+                    const dialog = btn.closest('[role="dialog"]');
+                    if (seen.has(dialog)) continue;
+                    seen.add(dialog);
+                    try {
+                        btn.click();
+                        closedCount++;
+                    } catch (e) {}
+                }
+            }
+
+            // Fallback: Find close buttons by aria-label (older LinkedIn versions)
+            for (const root of roots) {
+                for (const btn of root.querySelectorAll('button[aria-label*="Close"]')) {
+                    try {
+                        btn.click();
+                        closedCount++;
+                    } catch (e) {}
+                }
+            }
+            return closedCount;
+        };
+
+        // Try the cached shadow roots first; re-walk the DOM if they had nothing
+        const cached = cachedShadowRoots();
+        let roots = [document, ...(cached || walkShadowRoots())];
+        let closedCount = closeAll(roots);
+        if (closedCount === 0 && cached) {
+            roots = [document, ...walkShadowRoots()];
+            closedCount = closeAll(roots);
+        }
+
+        // Report what's left in the same round-trip, trying Escape on it first
+        const anyOpen = () => roots.some(
+            root => root.querySelector('[role="dialog"], .msg-overlay-conversation-bubble')
+        );
+        let stillOpen = anyOpen();
+        let escapeDispatched = false;
+        if (stillOpen && closedCount === 0) {
+            (document.activeElement || document.body).dispatchEvent(new KeyboardEvent('keydown', {
+                key: 'Escape', code: 'Escape', keyCode: 27, bubbles: true
+            }));
+            escapeDispatched = true;
+            stillOpen = anyOpen();
+        }
+        return {closed: closedCount, stillOpen: stillOpen, escapeDispatched: escapeDispatched};
+    }
+"""
+
+# Close the current chat modal. Returns {clicked, stillOpen}.
+CLOSE_CURRENT_CHAT_JS = """
+    () => {""" + SHADOW_ROOTS_JS + """
+        const clickClose = (shadowRoots) => {
+            const roots = [document, ...shadowRoots];
+            const findFirst = (selector) => {
+                for (const root of roots) {
+                    const found = root.querySelector(selector);
+                    if (found) return found;
+                }
+                return null;
+            };
+
+            // LinkedIn 2026: Find dialog in shadow DOM and click close button
+            // The close button is .msg-overlay-bubble-header__control but NOT .msg-overlay-conversation-bubble__expand-btn
+            for (const shadowRoot of shadowRoots) {
+                const dialog = shadowRoot.querySelector('[role="dialog"]');
+                if (dialog) {
+                    const headerControls = dialog.querySelectorAll('.msg-overlay-bubble-header__control');
+                    for (const btn of headerControls) {
+                        // Close button doesn't have expand-btn class (that's the minimize button)
+                        if (!btn.classList.contains('msg-overlay-conversation-bubble__expand-btn')) {
+                            btn.click();
+                            return true;
+                        }
+                    }
+                }
+            }
+
+            // Fallback: Try aria-label (older LinkedIn versions)
+            for (const root of roots) {
+                for (const btn of root.querySelectorAll('button[aria-label*="Close"]')) {
+                    try {
+                        btn.click();
+                        return true;
+                    } catch (e) {}
+                }
+            }
+
+            // Fallback: Try legacy selectors
+            const activeBubble = findFirst('.msg-overlay-conversation-bubble--is-active') ||
+                                findFirst('.msg-overlay-conversation-bubble');
+            if (activeBubble) {
+                const headerControls = activeBubble.querySelectorAll('.msg-overlay-bubble-header__control');
+                for (const btn of headerControls) {
+                    if (!btn.classList.contains('msg-overlay-conversation-bubble__expand-btn')) {
+                        btn.click();
+                        return true;
+                    }
+                }
+            }
+
+            return false;
+        };
+
+        // Try the cached shadow roots first; re-walk the DOM if they had nothing
+        const cached = cachedShadowRoots();
+        let shadowRoots = cached || walkShadowRoots();
+        let clicked = clickClose(shadowRoots);
+        if (!clicked && cached) {
+            shadowRoots = walkShadowRoots();
+            clicked = clickClose(shadowRoots);
+        }
+
+        // Report whether anything is still open in the same round-trip
+        const stillOpen = [document, ...shadowRoots].some(
+            root => root.querySelector('[role="dialog"], .msg-overlay-conversation-bubble')
+        );
+        return {clicked: clicked, stillOpen: stillOpen};
+    }
+"""
+
+# Count the open chat's messages (see get_message_history_script) and, when
+# there are any, click its close button in the same round-trip.
+# Returns the history result plus whether a close button was clicked.
+HISTORY_OR_CLOSE_JS = """
+    () => {
+        const history = """ + get_message_history_script().strip() + """;
+        history.closed = false;
+        if (history.count > 0) {
+            const close = window.__jobiai_closeCurrentChat || (""" + CLOSE_CURRENT_CHAT_JS.strip() + """);
+            history.closed = close().clicked;
+        }
+        return history;
+    }
+"""
+
+# Detect an open chat modal, searching nested shadow roots.
+# Returns {found, selector, location, debug}.
+IS_MODAL_OPEN_JS = """
+    () => {
+        const selectors = [
+            '[role="dialog"]',
+            '.msg-overlay-conversation-bubble',
+            '.msg-form',
+            '[role="textbox"]',
+            '.msg-overlay-bubble-header',
+            '.msg-s-message-list-container',
+            '.artdeco-modal'
+        ];
+        // One selector-list query per root instead of one query per selector
+        const combined = selectors.join(', ');
+        const matchedSelector = (el) => selectors.find(sel => el.matches(sel));
+
+        const debugInfo = {
+            lightDomChecked: true,
+            shadowRootsFound: 0,
+            shadowHostClasses: []
+        };
+
+        // Check light DOM first
+        const lightFound = document.querySelector(combined);
+        if (lightFound) {
+            return {found: true, selector: matchedSelector(lightFound), location: 'light-dom', debug: debugInfo};
+        }
 
+        // Recursive function to search shadow DOM at any depth
+        const searchShadowDOM = (root, depth = 0) => {
+            if (depth > 5) return null; // Prevent infinite recursion
 
+            const elements = root.querySelectorAll('*');
+            for (const el of elements) {
+                if (el.shadowRoot) {
+                    debugInfo.shadowRootsFound++;
+                    debugInfo.shadowHostClasses.push(el.className.substring(0, 50));
+
+                    // Check this shadow root
+                    const found = el.shadowRoot.querySelector(combined);
+                    if (found) {
+                        return {selector: matchedSelector(found), depth: depth};
+                    }
+
+                    // Search nested shadow roots
+                    const nested = searchShadowDOM(el.shadowRoot, depth + 1);
+                    if (nested) return nested;
+                }
+            }
+            return null;
+        };
+
+        const shadowResult = searchShadowDOM(document);
+        if (shadowResult) {
+            return {
+                found: true,
+                selector: shadowResult.selector,
+                location: 'shadow-dom-depth-' + shadowResult.depth,
+                debug: debugInfo
+            };
+        }
+
+        return {found: false, selector: null, debug: debugInfo};
+    }
+"""
+
+# True if anything close_all_overlays would act on is open, in light or shadow DOM
+HAS_OPEN_OVERLAYS_JS = """
+    () => {
+        const selector = '[role="dialog"], .msg-overlay-conversation-bubble, button[aria-label*="Close"]';
+        if (document.querySelector(selector)) return true;
+        for (const el of document.querySelectorAll('*')) {
+            if (el.shadowRoot && el.shadowRoot.querySelector(selector)) return true;
+        }
+        return false;
+    }
+"""
+
+# Elements only an opened conversation has - unlike IS_MODAL_OPEN_JS's list,
+# the always-docked messaging list doesn't match these
+CHAT_CONVERSATION_SELECTOR = "div.msg-form__contenteditable, [role='dialog'] ul"
+
+# The conversation's message list, which the history is read from
+CHAT_MESSAGE_LIST_SELECTOR = "ul.msg-s-message-list-content, ul.msg-s-message-list"
+
+# Functions installed on window by register_helpers(), so each call only
+# ships a short invocation over CDP instead of the whole script
+_PAGE_HELPERS = {
+    "__jobiai_closeAllOverlays": CLOSE_ALL_OVERLAYS_JS,
+    "__jobiai_closeCurrentChat": CLOSE_CURRENT_CHAT_JS,
+    "__jobiai_isModalOpen": IS_MODAL_OPEN_JS,
+    "__jobiai_hasOpenOverlays": HAS_OPEN_OVERLAYS_JS,
+}
+
+HELPERS_INIT_SCRIPT = "".join(
+    "window." + name + " = " + source.strip() + ";\n" for name, source in _PAGE_HELPERS.items()
+)
+
+_HELPER_CALLS = {
+    name: "() => window." + name + " ? {value: window." + name + "()} : null"
+    for name in _PAGE_HELPERS
+}
+
+
+def register_helpers(context):
+    """
+    Install the chat modal helpers in every page of a browser context.
+
+    Init scripts run on each new document, so this only needs to be
+    called once, right after the context is created.
+    """
+    context.add_init_script(HELPERS_INIT_SCRIPT)
+
+
+def _call_helper(page, name: str):
+    """
+    Call a helper installed by register_helpers().
+
+    Falls back to evaluating the full script when the page's document was
+    loaded before the helpers were registered.
+    """
+    result = page.evaluate(_HELPER_CALLS[name])
+    if result is None:
+        return page.evaluate(_PAGE_HELPERS[name])
+    return result["value"]
+
+
+# How long a "no overlays open" probe result is trusted, in seconds
+OVERLAY_PROBE_TTL = 2.0
+
+# Page -> time.monotonic() until which the page is known to have no overlays
+_overlay_free_until: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+
+@final
 class ChatModalHelper:
     """Helper class for chat modal operations."""
 
+    __slots__ = ()
+
+    @staticmethod
+    def has_open_overlays(page) -> bool:
+        """
+        Cheap check for anything close_all_overlays would act on.
+
+        A negative result is remembered for OVERLAY_PROBE_TTL seconds so
+        back-to-back close calls don't repeat the round-trip.
+        """
+        if time.monotonic() < _overlay_free_until.get(page, 0):
+            return False
+
+        try:
+            found = _call_helper(page, "__jobiai_hasOpenOverlays")
+        except Exception as e:
+            logger.debug(f"Overlay probe failed: {e}")
+            return True
+
+        if found:
+            _overlay_free_until.pop(page, None)
+        else:
+            _overlay_free_until[page] = time.monotonic() + OVERLAY_PROBE_TTL
+        return found
+
     @staticmethod
     def close_all_overlays(page):
         """
@@ -250,70 +1087,36 @@ class ChatModalHelper:
         Uses JavaScript execution for reliability with LinkedIn's dynamic DOM.
         LinkedIn 2026 uses Shadow DOM for messaging UI.
         """
+        if not ChatModalHelper.has_open_overlays(page):
+            logger.info("No open message overlays found")
+            return
+
         logger.info("Closing any open message overlays...")
         page.wait_for_timeout(500)
 
         try:
-            closed_count = page.evaluate("""
-                () => {
-                    let closedCount = 0;
-
-                    // Helper to search in shadow DOM
-                    function findAllInShadowDOM(selector) {
-                        const results = [];
-                        document.querySelectorAll(selector).forEach(el => results.push(el));
-                        const allElements = document.querySelectorAll('*');
-                        for (const el of allElements) {
-                            if (el.shadowRoot) {
-                                el.shadowRoot.querySelectorAll(selector).forEach(shadowEl => results.push(shadowEl));
-                            }
-                        }
-                        return results;
-                    }
-
-                    // LinkedIn 2026: Find all dialogs in shadow DOM and close them
-                    // The close button is .msg-overlay-bubble-header__control but NOT .msg-overlay-conversation-bubble__expand-btn
-                    const allElements = document.querySelectorAll('*');
-                    for (const el of allElements) {
-                        if (el.shadowRoot) {
-                            const dialogs = el.shadowRoot.querySelectorAll('[role="dialog"]');
-                            for (const dialog of dialogs) {
-                                const headerControls = dialog.querySelectorAll('.msg-overlay-bubble-header__control');
-                                for (const btn of headerControls) {
-                                    // Close button doesn't have expand-btn class (that's the minimize button)
-                                    if (!btn.classList.contains('msg-overlay-conversation-bubble__expand-btn')) {
-                                        try {
-                                            btn.click();
-                                            closedCount++;
-                                        } catch (e) {}
-                                    }
-                                }
-                            }
-                        }
-                    }
-
-                    // Fallback: Find close buttons by aria-label (older LinkedIn versions)
-                    const closeButtons = findAllInShadowDOM('button[aria-label*="Close"]');
-                    for (const btn of closeButtons) {
-                        try {
-                            btn.click();
-                            closedCount++;
-                        } catch (e) {}
-                    }
-
-                    return closedCount;
-                }
-            """)
+            # Clicks close buttons, or dispatches Escape if there were none
+            result = _call_helper(page, "__jobiai_closeAllOverlays")
+            closed_count = result.get('closed', 0)
+            still_open = result.get('stillOpen', True)
 
             if closed_count > 0:
                 logger.info(f"Closed {closed_count} message overlay(s)")
-                page.wait_for_timeout(500)
             else:
                 logger.info("No open message overlays found")
 
-            # Press Escape as backup
-            page.keyboard.press("Escape")
-            page.wait_for_timeout(300)
+            # The close script already checked; only poll if something's left
+            if still_open and (closed_count > 0 or result.get('escapeDispatched')):
+                still_open = not wait_until(page, NO_CHAT_OPEN_JS, 500)
+
+            # Press a real Escape as backup
+            if still_open:
+                page.keyboard.press("Escape")
+                still_open = not wait_until(page, NO_CHAT_OPEN_JS, 300)
+
+            if not still_open:
+                # Lets the next close call skip its probe round-trip
+                _overlay_free_until[page] = time.monotonic() + OVERLAY_PROBE_TTL
 
         except Exception as e:
             logger.warning(f"JavaScript overlay close failed: {e}")
@@ -331,84 +1134,14 @@ class ChatModalHelper:
             # Use JavaScript to find and click the close button
             # LinkedIn 2026 uses Shadow DOM for messaging UI
             # NOTE: LinkedIn removed aria-label from close button, so we identify it by class
-            closed = page.evaluate("""
-                () => {
-                    // Helper to search in shadow DOM
-                    function findInShadowDOM(selector) {
-                        let result = document.querySelector(selector);
-                        if (result) return result;
-                        const allElements = document.querySelectorAll('*');
-                        for (const el of allElements) {
-                            if (el.shadowRoot) {
-                                result = el.shadowRoot.querySelector(selector);
-                                if (result) return result;
-                            }
-                        }
-                        return null;
-                    }
-
-                    function findAllInShadowDOM(selector) {
-                        const results = [];
-                        document.querySelectorAll(selector).forEach(el => results.push(el));
-                        const allElements = document.querySelectorAll('*');
-                        for (const el of allElements) {
-                            if (el.shadowRoot) {
-                                el.shadowRoot.querySelectorAll(selector).forEach(shadowEl => results.push(shadowEl));
-                            }
-                        }
-                        return results;
-                    }
-
-                    // LinkedIn 2026: Find dialog in shadow DOM and click close button
-                    // The close button is .msg-overlay-bubble-header__control but NOT .msg-overlay-conversation-bubble__expand-btn
-                    const allElements = document.querySelectorAll('*');
-                    for (const el of allElements) {
-                        if (el.shadowRoot) {
-                            const dialog = el.shadowRoot.querySelector('[role="dialog"]');
-                            if (dialog) {
-                                const headerControls = dialog.querySelectorAll('.msg-overlay-bubble-header__control');
-                                for (const btn of headerControls) {
-                                    // Close button doesn't have expand-btn class (that's the minimize button)
-                                    if (!btn.classList.contains('msg-overlay-conversation-bubble__expand-btn')) {
-                                        btn.click();
-                                        return true;
-                                    }
-                                }
-                            }
-                        }
-                    }
-
-                    // Fallback: Try aria-label (older LinkedIn versions)
-                    const closeButtons = findAllInShadowDOM('button[aria-label*="Close"]');
-                    for (const btn of closeButtons) {
-                        try {
-                            btn.click();
-                            return true;
-                        } catch (e) {}
-                    }
-
-                    // Fallback: Try legacy selectors
-                    const activeBubble = findInShadowDOM('.msg-overlay-conversation-bubble--is-active') ||
-                                        findInShadowDOM('.msg-overlay-conversation-bubble');
-                    if (activeBubble) {
-                        const headerControls = activeBubble.querySelectorAll('.msg-overlay-bubble-header__control');
-                        for (const btn of headerControls) {
-                            if (!btn.classList.contains('msg-overlay-conversation-bubble__expand-btn')) {
-                                btn.click();
-                                return true;
-                            }
-                        }
-                    }
-
-                    return false;
-                }
-            """)
+            result = _call_helper(page, "__jobiai_closeCurrentChat")
 
-            page.wait_for_timeout(500)
+            wait_until(page, NO_CHAT_OPEN_JS, 500)
 
             # Press Escape as backup
-            page.keyboard.press("Escape")
-            page.wait_for_timeout(200)
+            if result.get('stillOpen', True):
+                page.keyboard.press("Escape")
+                wait_until(page, NO_CHAT_OPEN_JS, 200)
 
             return True
         except Exception as e:
@@ -421,76 +1154,84 @@ class ChatModalHelper:
                 pass
             return False
 
+    @staticmethod
+    def dismiss_chat(page, timeout_ms: int = 1500) -> bool:
+        """
+        Close the open chat modal with Escape, clicking its X only if needed.
+
+        Escape is usually enough on its own, which saves the close-button
+        lookup in the page.
+        """
+        try:
+            page.keyboard.press("Escape")
+            if wait_until(page, NO_CHAT_OPEN_JS, timeout_ms):
+                return True
+        except Exception as e:
+            logger.debug(f"Escape didn't close the chat: {e}")
+        return ChatModalHelper.close_current_chat(page)
+
+    @staticmethod
+    def check_history(page, timeout_ms: int = 1500) -> dict:
+        """
+        Check the open chat for earlier messages, closing it if there are any.
+
+        Counting and clicking the close button share one evaluate; Escape
+        (via dismiss_chat) is only tried if the chat doesn't go away.
+
+        Returns:
+            get_message_history_script's result, plus `closed`
+        """
+        result = page.evaluate(HISTORY_OR_CLOSE_JS)
+        if result.get('count', 0) > 0:
+            if not (result.get('closed') and wait_until(page, NO_CHAT_OPEN_JS, timeout_ms)):
+                result['closed'] = ChatModalHelper.dismiss_chat(page)
+        return result
+
+    @staticmethod
+    def wait_for_modal(page, timeout_ms: int) -> bool:
+        """
+        Wait for a conversation to open, for at most timeout_ms.
+
+        Waits on the conversation's own message box or list (in the modal or
+        on the messaging page), so the docked messaging list doesn't count.
+        """
+        try:
+            page.locator(CHAT_CONVERSATION_SELECTOR).first.wait_for(state="visible", timeout=timeout_ms)
+        except PlaywrightTimeoutError:
+            logger.info("Conversation did not open")
+            return False
+        except Exception as e:
+            logger.warning(f"Error waiting for conversation: {e}")
+            return False
+        _overlay_free_until.pop(page, None)
+        return True
+
+    @staticmethod
+    def wait_for_message_list(page, timeout_ms: int) -> bool:
+        """
+        Wait for the open conversation's message list, for at most timeout_ms.
+
+        The history loads after the conversation opens; counting it before
+        the list is there could mean messaging someone twice.
+        """
+        try:
+            page.locator(CHAT_MESSAGE_LIST_SELECTOR).first.wait_for(state="attached", timeout=timeout_ms)
+            return True
+        except PlaywrightTimeoutError:
+            logger.info("No message list in the conversation")
+            return False
+        except Exception as e:
+            logger.warning(f"Error waiting for message list: {e}")
+            return False
+
     @staticmethod
     def is_modal_open(page) -> bool:
         """Check if a chat modal is currently open."""
         try:
             # LinkedIn 2026 uses Shadow DOM for messaging UI
-            result = page.evaluate("""
-                () => {
-                    const selectors = [
-                        '[role="dialog"]',
-                        '.msg-overlay-conversation-bubble',
-                        '.msg-form',
-                        '[role="textbox"]',
-                        '.msg-overlay-bubble-header',
-                        '.msg-s-message-list-container',
-                        '.artdeco-modal'
-                    ];
-
-                    const debugInfo = {
-                        lightDomChecked: true,
-                        shadowRootsFound: 0,
-                        shadowHostClasses: []
-                    };
-
-                    // Check light DOM first
-                    for (const sel of selectors) {
-                        if (document.querySelector(sel)) {
-                            return {found: true, selector: sel, location: 'light-dom', debug: debugInfo};
-                        }
-                    }
-
-                    // Recursive function to search shadow DOM at any depth
-                    const searchShadowDOM = (root, depth = 0) => {
-                        if (depth > 5) return null; // Prevent infinite recursion
-
-                        const elements = root.querySelectorAll('*');
-                        for (const el of elements) {
-                            if (el.shadowRoot) {
-                                debugInfo.shadowRootsFound++;
-                                debugInfo.shadowHostClasses.push(el.className.substring(0, 50));
-
-                                // Check this shadow root
-                                for (const sel of selectors) {
-                                    const found = el.shadowRoot.querySelector(sel);
-                                    if (found) {
-                                        return {selector: sel, depth: depth};
-                                    }
-                                }
-
-                                // Search nested shadow roots
-                                const nested = searchShadowDOM(el.shadowRoot, depth + 1);
-                                if (nested) return nested;
-                            }
-                        }
-                        return null;
-                    };
-
-                    const shadowResult = searchShadowDOM(document);
-                    if (shadowResult) {
-                        return {
-                            found: true,
-                            selector: shadowResult.selector,
-                            location: 'shadow-dom-depth-' + shadowResult.depth,
-                            debug: debugInfo
-                        };
-                    }
-
-                    return {found: false, selector: null, debug: debugInfo};
-                }
-            """)
+            result = _call_helper(page, "__jobiai_isModalOpen")
             if result.get('found'):
+                _overlay_free_until.pop(page, None)
                 logger.info(f"Modal detected via: {result.get('selector')} in {result.get('location')}")
             else:
                 debug = result.get('debug', {})
@@ -501,23 +1242,74 @@ class ChatModalHelper:
             return False
 
 
-def bring_browser_to_front():
-    """Bring the Chromium browser window to the foreground (Windows only)."""
+# Window class of Chromium's top-level browser windows
+CHROMIUM_WINDOW_CLASS = "Chrome_WidgetWin_1"
+
+
+def _is_browser_title(title: str) -> bool:
+    """Check a window title against the Chromium build Playwright launches."""
+    # Matching "LinkedIn" too would grab the user's own Chrome or Edge tab
+    return title == "Chromium" or title.endswith(" - Chromium")
+
+
+# Last window found, reused while it still exists and still looks like ours
+_browser_hwnd = 0
+
+
+def _find_browser_window(win32gui) -> int:
+    """
+    Find the Chromium window used for LinkedIn (Windows only).
+
+    Reuses the last window found if it is still valid; otherwise only walks
+    windows of Chromium's window class instead of every top-level window.
+
+    Returns:
+        The window handle, or 0 if not found
+    """
+    global _browser_hwnd
+    if _browser_hwnd and win32gui.IsWindow(_browser_hwnd) and _is_browser_title(win32gui.GetWindowText(_browser_hwnd)):
+        return _browser_hwnd
+
+    hwnd = 0
+    while True:
+        hwnd = win32gui.FindWindowEx(0, hwnd, CHROMIUM_WINDOW_CLASS, None)
+        if not hwnd:
+            return 0
+        if _is_browser_title(win32gui.GetWindowText(hwnd)):
+            _browser_hwnd = hwnd
+            return hwnd
+
+
+# Window-manager calls don't touch Playwright, so they can run off the caller's thread
+_window_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="browser-window")
+
+
+def bring_browser_to_front() -> Future:
+    """
+    Bring the Chromium browser window to the foreground (Windows only).
+
+    Runs in the background so the caller can keep driving the page while
+    the window appears. Call .result() on the returned future to wait.
+    """
+    return _window_executor.submit(_bring_browser_to_front)
+
+
+def _bring_browser_to_front():
+    """Bring the Chromium browser window to the foreground (blocking)."""
     try:
         import win32gui
         import win32con
-        import time
-        time.sleep(0.5)
-
-        def bring_chromium_to_front(hwnd, _):
-            title = win32gui.GetWindowText(hwnd)
-            if "Chromium" in title or "LinkedIn" in title:
-                win32gui.ShowWindow(hwnd, win32con.SW_RESTORE)
-                win32gui.SetForegroundWindow(hwnd)
-                return False
-            return True
 
-        win32gui.EnumWindows(bring_chromium_to_front, None)
+        # The window may not exist yet right after launch - poll briefly
+        deadline = time.monotonic() + 0.5
+        hwnd = _find_browser_window(win32gui)
+        while not hwnd and time.monotonic() < deadline:
+            time.sleep(0.05)
+            hwnd = _find_browser_window(win32gui)
+
+        if hwnd:
+            win32gui.ShowWindow(hwnd, win32con.SW_RESTORE)
+            win32gui.SetForegroundWindow(hwnd)
     except Exception as e:
         logger.debug(f"Could not bring window to front: {e}")
 
@@ -528,20 +1320,15 @@ def hide_browser_window():
         import win32gui
         import win32con
 
-        def hide_chromium(hwnd, _):
-            title = win32gui.GetWindowText(hwnd)
-            if "Chromium" in title or "LinkedIn" in title:
-                # Move window far off-screen
-                win32gui.SetWindowPos(
-                    hwnd, None,
-                    -32000, -32000,  # Off-screen position
-                    0, 0,  # Keep current size
-                    win32con.SWP_NOSIZE | win32con.SWP_NOZORDER
-                )
-                return False
-            return True
-
-        win32gui.EnumWindows(hide_chromium, None)
+        hwnd = _find_browser_window(win32gui)
+        if hwnd:
+            # Move window far off-screen
+            win32gui.SetWindowPos(
+                hwnd, None,
+                -32000, -32000,  # Off-screen position
+                0, 0,  # Keep current size
+                win32con.SWP_NOSIZE | win32con.SWP_NOZORDER
+            )
         logger.info("Browser window hidden (moved off-screen)")
     except Exception as e:
         logger.debug(f"Could not hide browser window: {e}")
@@ -553,22 +1340,17 @@ def show_browser_window():
         import win32gui
         import win32con
 
-        def show_chromium(hwnd, _):
-            title = win32gui.GetWindowText(hwnd)
-            if "Chromium" in title or "LinkedIn" in title:
-                # Move window to visible position and restore
-                win32gui.SetWindowPos(
-                    hwnd, None,
-                    100, 100,  # Visible position
-                    0, 0,  # Keep current size
-                    win32con.SWP_NOSIZE | win32con.SWP_NOZORDER
-                )
-                win32gui.ShowWindow(hwnd, win32con.SW_RESTORE)
-                win32gui.SetForegroundWindow(hwnd)
-                return False
-            return True
-
-        win32gui.EnumWindows(show_chromium, None)
+        hwnd = _find_browser_window(win32gui)
+        if hwnd:
+            # Move window to visible position and restore
+            win32gui.SetWindowPos(
+                hwnd, None,
+                100, 100,  # Visible position
+                0, 0,  # Keep current size
+                win32con.SWP_NOSIZE | win32con.SWP_NOZORDER
+            )
+            win32gui.ShowWindow(hwnd, win32con.SW_RESTORE)
+            win32gui.SetForegroundWindow(hwnd)
         logger.info("Browser window shown")
     except Exception as e:
         logger.debug(f"Could not show browser window: {e}")
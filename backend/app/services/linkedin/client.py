@@ -6,8 +6,16 @@ This is more reliable than cookie extraction as it maintains the full
 browser environment including localStorage, sessionStorage, and cookies.
 """
 import asyncio
+import contextlib
+import copy
+import functools
+import re
+import shutil
 import sys
+import threading
+import time
 from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 
 from app.utils.logger import get_logger
 from .selectors import LinkedInSelectors, conversation_selectors
@@ -15,23 +23,142 @@ from .vip_filter import is_vip
 from .extractors import (
     extract_person_from_search_result,
     extract_people_from_search_results,
-    extract_connection_from_card,
+    extract_connections_from_page,
+    query_search_results,
 )
 from .browser_utils import (
-    BROWSER_DATA_PATH, DELAY_MS, FAST_MODE,
-    ensure_browser_data_dir, get_browser_args,
-    RetryHelper, ChatModalHelper, bring_browser_to_front,
+    BROWSER_DATA_PATH, DELAY_MS, FAST_MODE, PlaywrightTimeoutError,
+    ensure_browser_data_dir, get_browser_args, get_browser_visibility, compile_selectors,
+    RetryHelper, ChatModalHelper, bring_browser_to_front, register_helpers,
+    blocking_heavy_resources, find_first_in_page, prewarm_dns,
 )
 from .js_scripts import (
-    get_message_history_script,
     get_reply_check_script,
     get_close_current_chat_script,
+    get_embedded_profile_name_script,
 )
 
 logger = get_logger(__name__)
 
-# Create a dedicated thread pool for Playwright operations
-_playwright_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="playwright")
+# Static selector lists are joined once here rather than on every retry
+_SEARCH_INPUT_SELECTORS = compile_selectors(tuple(LinkedInSelectors.SEARCH_INPUT))
+_PEOPLE_TAB_SELECTORS = compile_selectors(tuple(LinkedInSelectors.PEOPLE_TAB))
+_CONNECTIONS_DROPDOWN_SELECTORS = compile_selectors(tuple(LinkedInSelectors.CONNECTIONS_DROPDOWN))
+_SHOW_RESULTS_SELECTORS = compile_selectors(tuple(LinkedInSelectors.SHOW_RESULTS))
+_MESSAGE_BUTTON_SELECTORS = compile_selectors(tuple(LinkedInSelectors.MESSAGE_BUTTON))
+_MESSAGE_INPUT_SELECTORS = compile_selectors(tuple(LinkedInSelectors.MESSAGE_INPUT))
+_SEND_MESSAGE_SELECTORS = compile_selectors(tuple(LinkedInSelectors.SEND_MESSAGE))
+_SEND_CONNECTION_SELECTORS = compile_selectors(tuple(LinkedInSelectors.SEND_CONNECTION))
+_MESSAGING_SEARCH_SELECTORS = compile_selectors(tuple(LinkedInSelectors.MESSAGING_SEARCH))
+_MESSAGING_PANEL_OPEN_SELECTORS = compile_selectors(tuple(LinkedInSelectors.MESSAGING_PANEL_OPEN))
+_MESSAGING_OPENER_SELECTORS = compile_selectors(
+    tuple(LinkedInSelectors.MESSAGING_BUTTON + LinkedInSelectors.MESSAGING_MINIMIZED)
+)
+_CONNECT_BUTTON_SELECTORS = compile_selectors(tuple(LinkedInSelectors.CONNECT_BUTTON))
+_SEND_WITHOUT_NOTE_SELECTOR = "button[aria-label='Send without a note'], button:has-text('Send without a note')"
+
+# Pages LinkedIn lands on after a successful login, and how long to wait for one.
+# Anchored to the path, so a login URL carrying session_redirect=/feed/ doesn't count
+_LOGGED_IN_URL = re.compile(r"^https://www\.linkedin\.com/(feed|mynetwork|in/)")
+_LOGIN_TIMEOUT_MS = 300_000
+
+# Pages LinkedIn redirects to when the session is no longer valid
+_LOGGED_OUT_URL = re.compile(r"/(login|checkpoint|authwall)")
+
+# How long a failed session check is trusted before verifying again (seconds)
+_SESSION_TTL = 300
+
+# Longest slice of a wait before checking for an abort again - long enough
+# to keep driver round-trips rare, short enough for an abort to land quickly
+_ABORT_POLL_MS = 500
+
+# How long a read-only company search's results are reused (seconds)
+_SEARCH_CACHE_TTL = 3600
+
+# Any search results page, reached after submitting the search box
+_SEARCH_RESULTS_URL = re.compile(r"/search/results/")
+
+# The people results page, reached from the People tab
+_PEOPLE_RESULTS_URL = re.compile(r"/search/results/people/")
+
+# How long a clicked Message button gets to open the chat (or messaging page)
+_CHAT_OPEN_TIMEOUT_MS = 4000
+
+# True once the chat's message box is empty (or gone with the closed chat)
+_INPUT_CLEARED_JS = "(el) => !el.isConnected || !(el.innerText || el.value || '').trim()"
+_MESSAGE_CLEARED_TIMEOUT_MS = 5000
+
+# How long an opened chat gets to show its message list
+_CHAT_HISTORY_TIMEOUT_MS = 3000
+
+# Cards on the connections page
+_CONNECTION_CARDS_SELECTOR = ", ".join(LinkedInSelectors.CONNECTION_CARDS)
+
+# Connection degree filters on the people search, with their selectors
+# built once: the filter itself, its selected state, and any other
+# degree's selected state
+_DEGREES = ("1st", "2nd", "3rd+")
+_DEGREE_FILTER_SELECTORS = {
+    degree: compile_selectors(tuple(LinkedInSelectors.degree_filter(degree))) for degree in _DEGREES
+}
+_ACTIVE_DEGREE_SELECTORS = {
+    degree: compile_selectors(tuple(LinkedInSelectors.active_degree_filter(degree))) for degree in _DEGREES
+}
+_OTHER_ACTIVE_DEGREE_SELECTORS = {
+    degree: compile_selectors(tuple(
+        selector
+        for other in _DEGREES if other != degree
+        for selector in LinkedInSelectors.active_degree_filter(other)
+    ))
+    for degree in _DEGREES
+}
+# Used while clearing other degrees: the filter's radio (checked or not),
+# the older UI's selected pill, and the dropdown's option
+_DEGREE_RADIO_SELECTORS = {degree: f"[role='radio']:has-text('{degree}')" for degree in _DEGREES}
+_SELECTED_DEGREE_PILL_SELECTORS = {
+    degree: compile_selectors((
+        f"button:has-text('{degree}')[aria-pressed='true']",
+        f"button.artdeco-pill--selected:has-text('{degree}')",
+    ))
+    for degree in _DEGREES
+}
+_DEGREE_OPTION_SELECTORS = {
+    degree: compile_selectors((f"label:has-text('{degree}')",)) for degree in _DEGREES
+}
+
+# How long to wait for a clicked degree filter to show as selected
+_FILTER_APPLIED_TIMEOUT_MS = 3000
+
+# Search result list, and how long to wait for it (or the empty-results
+# message) after a page change
+_SEARCH_RESULTS_SELECTOR = ", ".join(LinkedInSelectors.SEARCH_RESULTS)
+_SEARCH_PAGE_LOADED_SELECTOR = ", ".join(LinkedInSelectors.SEARCH_RESULTS + LinkedInSelectors.NO_RESULTS)
+_SEARCH_RESULTS_TIMEOUT_MS = 10000
+
+
+def _init_playwright_thread():
+    """
+    Prepare the Playwright worker thread's event loop policy once.
+
+    sync_playwright builds its own loop from the global policy. uvicorn
+    installs uvloop's policy when it is available, and libuv-backed loops
+    deadlock Playwright's sync dispatcher, so the stock loop is pinned here.
+    The server loop is already running by then and keeps uvloop.
+    """
+    if sys.platform == 'win32':
+        # Playwright's driver is a subprocess, which needs the Proactor loop
+        asyncio.set_event_loop_policy(asyncio.WindowsProactorEventLoopPolicy())
+    else:
+        asyncio.set_event_loop_policy(asyncio.DefaultEventLoopPolicy())
+
+
+# Create a dedicated thread pool for Playwright operations. It has to stay at
+# one worker: the sync API is bound to the thread that started it, the
+# persistent profile allows one context, and all jobs drive the same LinkedIn
+# account, which must not act in parallel. Jobs wait in the client's queue.
+_playwright_executor = ThreadPoolExecutor(
+    max_workers=1, thread_name_prefix="playwright", initializer=_init_playwright_thread,
+)
 
 # Try to import playwright
 try:
@@ -50,21 +177,62 @@ except ImportError:
     logger.warning("playwright-stealth not installed - stealth features disabled")
 
 
-def _run_sync_playwright(func, *args, **kwargs):
-    """Run a synchronous Playwright function with correct Windows event loop."""
-    if sys.platform == 'win32':
-        asyncio.set_event_loop_policy(asyncio.WindowsProactorEventLoopPolicy())
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-    return func(*args, **kwargs)
-
-
 async def _run_playwright_async(func, *args, **kwargs):
     """Run a synchronous Playwright function asynchronously."""
-    loop = asyncio.get_event_loop()
-    def wrapper():
-        return _run_sync_playwright(func, *args, **kwargs)
-    return await loop.run_in_executor(_playwright_executor, wrapper)
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_playwright_executor, functools.partial(func, *args, **kwargs))
+
+
+# Profile files that identify the LinkedIn session. Cache, prefs and the
+# rest of the profile are kept so the next login starts warm.
+_SESSION_FILES = (
+    "Default/Cookies",
+    "Default/Cookies-journal",
+    "Default/Network/Cookies",
+    "Default/Network/Cookies-journal",
+    "Default/Login Data",
+    "Default/Login Data-journal",
+)
+_SESSION_DIRS = ("Default/Local Storage",)
+
+
+def _clear_session_files() -> bool:
+    """
+    Delete the session files from the browser profile.
+
+    Returns:
+        False if there is no profile to clear
+    """
+    if not BROWSER_DATA_PATH.exists():
+        return False
+    for rel in _SESSION_FILES:
+        (BROWSER_DATA_PATH / rel).unlink(missing_ok=True)
+    for rel in _SESSION_DIRS:
+        shutil.rmtree(BROWSER_DATA_PATH / rel, ignore_errors=True)
+    return True
+
+
+def _search_page_url(url: str, page_num: int) -> str:
+    """Return the search URL with its page parameter set to page_num."""
+    parts = urlsplit(url)
+    params = [(k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True) if k != "page"]
+    params.append(("page", str(page_num)))
+    return urlunsplit(parts._replace(query=urlencode(params)))
+
+
+# API calls the chat's and the invitation modal's Send buttons make
+_MESSAGE_SENT_URL = re.compile(r"/voyager/api/(voyagerMessagingDashMessengerMessages|messaging/conversations)")
+_INVITATION_SENT_URL = re.compile(r"/voyager/api/(voyagerRelationshipsDashMemberRelationships|growth/normInvitations)")
+
+
+def _is_message_sent_response(response) -> bool:
+    """Match the response to a chat's Send click."""
+    return response.request.method == "POST" and bool(_MESSAGE_SENT_URL.search(response.url))
+
+
+def _is_invitation_sent_response(response) -> bool:
+    """Match the response to a connection invitation's Send click."""
+    return response.request.method == "POST" and bool(_INVITATION_SENT_URL.search(response.url))
 
 
 class WorkflowAbortedException(Exception):
@@ -110,9 +278,14 @@ class LinkedInClient:
             cls._instance._browser = None
             cls._instance._context = None
             cls._instance._page = None
-            cls._instance._abort_requested = False
+            cls._instance._session_checked_at = 0.0
+            # Set from API handlers, waited on by the Playwright thread
+            cls._instance._abort_event = threading.Event()
             cls._instance._current_job_id = None
             cls._instance._queued_jobs = []
+            cls._instance._inflight_searches = {}
+            # (company, limit) -> (time.monotonic() when scraped, result)
+            cls._instance._search_cache = {}
         return cls._instance
 
     def __init__(self):
@@ -132,6 +305,13 @@ class LinkedInClient:
                     self._page = pages[0]
                     logger.info("Reusing existing browser context")
                     return self._context, self._page
+                # Every tab was closed but Chromium is still running - the
+                # profile stays locked, so open a tab rather than relaunch
+                self._page = self._context.new_page()
+                self._page.set_default_timeout(10000)
+                _apply_stealth(self._page)
+                logger.info("Reusing existing browser context with a new page")
+                return self._context, self._page
             except Exception as e:
                 logger.info(f"Existing context invalid: {e}, creating new one")
                 self._cleanup_browser()
@@ -143,16 +323,42 @@ class LinkedInClient:
 
         # Create new context
         logger.info("Creating new browser context...")
+        prewarm_dns()
         ensure_browser_data_dir()
         self._context = self._playwright.chromium.launch_persistent_context(
             str(BROWSER_DATA_PATH),
             **get_browser_args()
         )
+        register_helpers(self._context)
         self._page = self._context.pages[0] if self._context.pages else self._context.new_page()
         self._page.set_default_timeout(10000)
         _apply_stealth(self._page)
         return self._context, self._page
 
+    def _new_page(self):
+        """
+        Open a fresh page in the shared browser context.
+
+        The persistent context locks its profile directory, so one-off flows
+        (like login) open a page in it instead of launching their
+        own Chromium. Callers close the page when done.
+        """
+        context, _ = self._get_or_create_browser()
+        page = context.new_page()
+        page.set_default_timeout(10000)
+        _apply_stealth(page)
+        return page
+
+    @staticmethod
+    def _close_page(page):
+        """Close a page opened with _new_page, ignoring already-closed pages."""
+        if page is None:
+            return
+        try:
+            page.close()
+        except Exception:
+            pass
+
     def _cleanup_browser(self):
         """Clean up browser context but keep playwright instance."""
         if self._context:
@@ -186,6 +392,12 @@ class LinkedInClient:
             finally:
                 self._playwright = None
 
+    async def close(self):
+        """Close the shared browser, on the Playwright thread that opened it."""
+        if self._context is None and self._playwright is None:
+            return
+        await _run_playwright_async(self.close_browser)
+
     @classmethod
     def get_instance(cls) -> "LinkedInClient":
         return cls()
@@ -193,17 +405,17 @@ class LinkedInClient:
     # --- Abort and Queue Management ---
 
     def request_abort(self, job_id: int | None = None):
-        self._abort_requested = True
+        self._abort_event.set()
         logger.info(f"Abort requested for job {job_id if job_id else 'current'}")
 
     def clear_abort(self):
-        self._abort_requested = False
+        self._abort_event.clear()
 
     def is_abort_requested(self) -> bool:
-        return self._abort_requested
+        return self._abort_event.is_set()
 
     def check_abort(self):
-        if self._abort_requested:
+        if self._abort_event.is_set():
             raise WorkflowAbortedException("Workflow aborted by user")
 
     def set_current_job(self, job_id: int | None):
@@ -229,26 +441,36 @@ class LinkedInClient:
         return job_id in self._queued_jobs
 
     def _wait_with_abort_check(self, page, ms: int):
-        """Wait for specified ms, checking for abort every 500ms."""
-        remaining = ms
-        while remaining > 0:
-            self.check_abort()
-            wait_time = min(remaining, 500)
-            page.wait_for_timeout(wait_time)
-            remaining -= wait_time
+        """
+        Wait for specified ms, returning early if an abort is requested.
+
+        Waits inside Playwright in short slices so the driver keeps
+        dispatching page events and route handlers meanwhile.
+        """
+        deadline = time.monotonic() + ms / 1000
+        while not self._abort_event.is_set():
+            remaining_ms = (deadline - time.monotonic()) * 1000
+            if remaining_ms <= 0:
+                return
+            page.wait_for_timeout(min(remaining_ms, _ABORT_POLL_MS))
+        raise WorkflowAbortedException("Workflow aborted by user")
 
     # --- Authentication ---
 
-    async def login_with_browser(self) -> bool:
-        """Open a browser window for manual LinkedIn login."""
+    async def login_with_browser(self, force_relogin: bool = False) -> bool:
+        """
+        Open a browser window for manual LinkedIn login.
+
+        A still-valid stored session is reused unless force_relogin is set.
+        """
         if not HAS_PLAYWRIGHT:
             logger.error("playwright not installed")
             return False
 
         try:
             logger.info("Opening browser for LinkedIn login...")
-            ensure_browser_data_dir()
-            result = await _run_playwright_async(self._browser_login_flow)
+            # The data directory is created on the Playwright thread at launch
+            result = await _run_playwright_async(self._browser_login_flow, force_relogin)
 
             if result:
                 self._logged_in = True
@@ -263,67 +485,59 @@ class LinkedInClient:
             self._logged_in = False
             return False
 
-    def _browser_login_flow(self) -> dict | None:
-        """Synchronous browser login flow."""
-        context = None
+    @staticmethod
+    def _session_cookie_present(context) -> bool:
+        """Check whether the context holds a LinkedIn auth cookie, raising if it can't tell."""
+        return any(c["name"] == "li_at" for c in context.cookies("https://www.linkedin.com"))
+
+    @staticmethod
+    def _has_session_cookie(context) -> bool:
+        """Check whether the context holds a LinkedIn auth cookie."""
         try:
-            with sync_playwright() as p:
-                context = p.chromium.launch_persistent_context(
-                    str(BROWSER_DATA_PATH),
-                    **get_browser_args(maximized=True)
-                )
+            return LinkedInClient._session_cookie_present(context)
+        except Exception:
+            return False
 
-                page = context.pages[0] if context.pages else context.new_page()
-                page.set_default_timeout(10000)
-                _apply_stealth(page)
-                page.bring_to_front()
-                bring_browser_to_front()
+    def _browser_login_flow(self, force_relogin: bool = False) -> dict | None:
+        """Synchronous browser login flow."""
+        page = None
+        try:
+            page = self._new_page()
+            page.bring_to_front()
+            bring_browser_to_front()
 
-                # Logout first for fresh login
+            if force_relogin:
                 logger.info("Clearing any existing LinkedIn session...")
                 try:
                     page.goto("https://www.linkedin.com/m/logout/", wait_until="domcontentloaded", timeout=30000)
-                    page.wait_for_timeout(1000)
                 except Exception:
                     return None
-
-                # Go to login page
+            elif self._has_session_cookie(page.context):
+                # A stored session may still be good - skip the login form if so
                 try:
-                    page.goto("https://www.linkedin.com/login")
+                    page.goto("https://www.linkedin.com/feed/", wait_until="domcontentloaded", timeout=30000)
+                    if _LOGGED_IN_URL.search(page.url):
+                        logger.info("Existing LinkedIn session is still valid")
+                        return self._get_profile_from_page(page)
                 except Exception:
                     return None
 
-                logger.info("Browser opened - please login to LinkedIn")
-
-                # Poll for login success
-                import time
-                start_time = time.time()
-                timeout_seconds = 300
-
-                while True:
-                    if time.time() - start_time > timeout_seconds:
-                        logger.info("Login timed out")
-                        context.close()
-                        return None
-
-                    try:
-                        if page.is_closed():
-                            return None
-                        current_url = page.url
-                        if "/feed" in current_url or "/mynetwork" in current_url or "/in/" in current_url:
-                            logger.info("Login detected!")
-                            break
-                    except Exception:
-                        return None
+            # Go to login page
+            try:
+                page.goto("https://www.linkedin.com/login")
+            except Exception:
+                return None
 
-                    try:
-                        page.wait_for_timeout(500)
-                    except:
-                        return None
+            logger.info("Browser opened - please login to LinkedIn")
+
+            try:
+                page.wait_for_url(_LOGGED_IN_URL, timeout=_LOGIN_TIMEOUT_MS)
+            except PlaywrightTimeoutError:
+                logger.info("Login timed out")
+                return None
+            logger.info("Login detected!")
 
-                profile = self._get_profile_from_page(page)
-                context.close()
-                return profile
+            return self._get_profile_from_page(page)
 
         except Exception as e:
             error_str = str(e).lower()
@@ -331,18 +545,25 @@ class LinkedInClient:
                 logger.info("Login cancelled - browser was closed")
             else:
                 logger.error(f"Browser login failed: {e}")
-            if context:
-                try:
-                    context.close()
-                except:
-                    pass
+            return None
+        finally:
+            self._close_page(page)
+
+    @staticmethod
+    def _extract_profile_from_embedded_json(page: "Page") -> str | None:
+        """Read the user's name from the JSON embedded in the page, if present."""
+        try:
+            return page.evaluate(get_embedded_profile_name_script())
+        except Exception as e:
+            logger.debug(f"Embedded profile data not readable: {e}")
             return None
 
     def _get_profile_from_page(self, page: "Page") -> dict:
         """Extract profile info from the LinkedIn page."""
         try:
-            name = None
-            nav_profile = page.query_selector(LinkedInSelectors.NAV_PROFILE_PHOTO)
+            name = self._extract_profile_from_embedded_json(page)
+
+            nav_profile = None if name else page.query_selector(LinkedInSelectors.NAV_PROFILE_PHOTO)
             if nav_profile:
                 name = nav_profile.get_attribute("alt")
                 if name:
@@ -364,15 +585,25 @@ class LinkedInClient:
             return {"name": None, "email": None}
 
     async def check_session(self) -> bool:
-        """Check if we have a valid LinkedIn session."""
+        """
+        Check if we have a valid LinkedIn session.
+
+        A valid session is trusted until an operation is redirected to the
+        login page; a missing one is only re-verified after _SESSION_TTL.
+        """
         if self._logged_in:
             return True
 
-        if not BROWSER_DATA_PATH.exists():
+        if time.monotonic() - self._session_checked_at < _SESSION_TTL:
+            return False
+
+        if not await asyncio.to_thread(BROWSER_DATA_PATH.exists):
             return False
 
         try:
             result = await _run_playwright_async(self._verify_session)
+            # Only a definite answer is cached - errors raise and are retried
+            self._session_checked_at = time.monotonic()
             if result:
                 self._logged_in = True
                 self._name = result.get("name")
@@ -384,46 +615,99 @@ class LinkedInClient:
             return False
 
     def _verify_session(self) -> dict | None:
-        """Verify the saved session is still valid."""
+        """
+        Verify the saved session is still valid.
+
+        Without an auth cookie there's nothing to load. With no browser
+        open, the feed is checked in a headless throwaway context so a
+        status poll never opens a window; with one open, in a page of its
+        own so the page the user is on isn't navigated away.
+
+        Returns:
+            The profile if the session is valid, None if there's no auth
+            cookie or LinkedIn redirected to the login page
+
+        Raises:
+            Exception: If the check couldn't be completed (e.g. a timeout),
+                so it isn't taken for a logged-out session
+        """
         if not HAS_PLAYWRIGHT:
             return None
 
-        with sync_playwright() as p:
-            try:
-                context = p.chromium.launch_persistent_context(
-                    str(BROWSER_DATA_PATH),
-                    headless=True,
-                )
-                page = context.pages[0] if context.pages else context.new_page()
-                page.set_default_timeout(10000)
-                _apply_stealth(page)
+        if self._context is None:
+            return self._verify_session_headless()
 
-                page.goto("https://www.linkedin.com/feed/", wait_until="domcontentloaded", timeout=30000)
+        if not self._session_cookie_present(self._context):
+            return None
+        page = self._new_page()
+        try:
+            return self._profile_if_logged_in(page)
+        finally:
+            self._close_page(page)
 
-                if "/login" in page.url or "/checkpoint" in page.url:
-                    context.close()
-                    return None
+    def _verify_session_headless(self) -> dict | None:
+        """Run _verify_session's check in a headless context that's closed afterwards."""
+        if self._playwright is None:
+            logger.info("Starting Playwright...")
+            self._playwright = sync_playwright().start()
 
-                profile = self._get_profile_from_page(page)
-                context.close()
-                return profile
-            except Exception as e:
-                logger.error(f"Session verification failed: {e}")
+        context = self._playwright.chromium.launch_persistent_context(str(BROWSER_DATA_PATH), headless=True)
+        try:
+            if not self._session_cookie_present(context):
                 return None
+            page = context.pages[0] if context.pages else context.new_page()
+            page.set_default_timeout(10000)
+            _apply_stealth(page)
+            return self._profile_if_logged_in(page)
+        finally:
+            context.close()
+
+    def _profile_if_logged_in(self, page) -> dict | None:
+        """Load the feed on page and read the profile, or None if sent to login."""
+        with blocking_heavy_resources(page):
+            page.goto("https://www.linkedin.com/feed/", wait_until="domcontentloaded", timeout=30000)
+
+            if _LOGGED_OUT_URL.search(page.url):
+                return None
+
+            return self._get_profile_from_page(page)
+
+    def _session_expired(self, page) -> bool:
+        """Check for a redirect to the login page, dropping the cached session if so."""
+        if not _LOGGED_OUT_URL.search(page.url):
+            return False
+        logger.error("LinkedIn session expired - please login again")
+        self._logged_in = False
+        self._session_checked_at = 0.0
+        return True
 
     async def logout(self):
-        """Clear saved session data."""
-        import shutil
+        """Clear saved session data, keeping the rest of the browser profile."""
         self._logged_in = False
         self._name = None
         self._email = None
+        # Results were scraped with this account's network
+        self._search_cache.clear()
+        # Known to be logged out - no need to verify on the next status check
+        self._session_checked_at = time.monotonic()
 
-        if BROWSER_DATA_PATH.exists():
-            try:
-                shutil.rmtree(BROWSER_DATA_PATH)
-                logger.info("LinkedIn browser context cleared")
-            except Exception as e:
-                logger.error(f"Error clearing browser context: {e}")
+        if self._context:
+            # The open browser would otherwise write its cookies back to disk
+            await _run_playwright_async(self._clear_context_cookies)
+
+        try:
+            if await asyncio.to_thread(_clear_session_files):
+                logger.info("LinkedIn session data cleared")
+        except Exception as e:
+            logger.error(f"Error clearing session data: {e}")
+
+    def _clear_context_cookies(self):
+        """Drop all cookies from the open browser context."""
+        try:
+            if self._context:
+                self._context.clear_cookies()
+        except Exception as e:
+            logger.warning(f"Error clearing browser cookies: {e}")
 
     async def get_profile_info(self) -> dict:
         return {"name": self._name, "email": self._email}
@@ -440,9 +724,35 @@ class LinkedInClient:
             logger.error("Not logged in")
             return {"first_degree": [], "second_degree": [], "third_plus": []}
 
-        return await _run_playwright_async(
-            self._search_company_all_degrees_sync, company, limit, message_generator, first_degree_only
-        )
+        if message_generator is not None or not first_degree_only:
+            # Sends messages or connection requests - every call must run
+            return await _run_playwright_async(
+                self._search_company_all_degrees_sync, company, limit, message_generator, first_degree_only
+            )
+
+        # Read-only lookup: reuse a recent scrape of the same company, and let
+        # identical requests waiting on the browser share one scrape
+        key = (company.lower(), limit)
+        cached = self._search_cache.get(key)
+        if cached and time.monotonic() - cached[0] < _SEARCH_CACHE_TTL:
+            logger.info(f"Using cached search results for '{company}'")
+            return copy.deepcopy(cached[1])
+
+        search = self._inflight_searches.get(key)
+        if search is None:
+            search = asyncio.ensure_future(_run_playwright_async(
+                self._search_company_all_degrees_sync, company, limit, None, True
+            ))
+            self._inflight_searches[key] = search
+            search.add_done_callback(lambda _: self._inflight_searches.pop(key, None))
+        else:
+            logger.info(f"Joining in-flight search for '{company}'")
+        # Shielded so one caller going away doesn't cancel it for the others
+        result = await asyncio.shield(search)
+        if result.get("first_degree"):
+            # Failed scrapes come back empty too, so only hits are kept
+            self._search_cache[key] = (time.monotonic(), result)
+        return copy.deepcopy(result)
 
     def _search_company_all_degrees_sync(self, company: str, limit: int, message_generator=None, first_degree_only: bool = False) -> dict:
         """Synchronous combined search for all degree connections."""
@@ -452,6 +762,7 @@ class LinkedInClient:
         result = {"first_degree": [], "second_degree": [], "third_plus": [], "connection_requests_sent": []}
         logger.info(f"Starting combined search for connections at: {company}")
 
+        resources = contextlib.ExitStack()
         try:
             logger.info(f"Running in {'FAST' if FAST_MODE else 'SAFE'} mode (delays: {DELAY_MS}ms)")
             import time
@@ -459,6 +770,9 @@ class LinkedInClient:
             context, page = self._get_or_create_browser()
             launch_time = time.time() - launch_start
             logger.info(f"Browser ready in {launch_time:.1f}s")
+            if not get_browser_visibility():
+                # Nobody sees the window, so don't download images and fonts
+                resources.enter_context(blocking_heavy_resources(page))
 
             self.check_abort()
 
@@ -466,19 +780,21 @@ class LinkedInClient:
             logger.info("Step 1: Going to LinkedIn feed page...")
             page.goto("https://www.linkedin.com/feed/", timeout=60000)
             page.wait_for_load_state("domcontentloaded", timeout=30000)
+            if self._session_expired(page):
+                return result
             self._wait_with_abort_check(page, DELAY_MS)
 
             # Step 2: Search for company
             logger.info(f"Step 2: Searching for '{company}'...")
-            search_input = RetryHelper.retry_find(page, LinkedInSelectors.SEARCH_INPUT, "find search input")
+            search_input = RetryHelper.retry_find(page, _SEARCH_INPUT_SELECTORS, "find search input")
             search_input.click()
             page.wait_for_timeout(DELAY_MS // 2)
             search_input.fill(company)
             page.wait_for_timeout(DELAY_MS // 2)
             page.keyboard.press("Enter")
 
-            page.wait_for_load_state("domcontentloaded", timeout=30000)
-            page.wait_for_timeout(3000)
+            # Wait for the results page itself rather than a fixed pause
+            page.wait_for_url(_SEARCH_RESULTS_URL, wait_until="domcontentloaded", timeout=30000)
 
             # Step 3: Click People tab
             logger.info("Step 3: Clicking on People tab...")
@@ -538,6 +854,7 @@ class LinkedInClient:
             logger.error(f"Combined search failed: {e}", exc_info=True)
             return result
         finally:
+            resources.close()
             # Don't close browser - keep it open for next operation
             # Just close any open chat overlays
             try:
@@ -552,15 +869,15 @@ class LinkedInClient:
             return True
 
         try:
-            RetryHelper.retry_click(page, LinkedInSelectors.PEOPLE_TAB, "click People tab")
-            page.wait_for_load_state("domcontentloaded", timeout=30000)
+            RetryHelper.retry_click(page, _PEOPLE_TAB_SELECTORS, "click People tab")
+            # The tab switches in-page, so the load state has long settled -
+            # wait for the people results URL before touching the filters
+            page.wait_for_url(_PEOPLE_RESULTS_URL, wait_until="domcontentloaded", timeout=30000)
             return True
         except Exception:
             # Try direct URL navigation
-            from urllib.parse import urlparse, parse_qs
-            parsed = urlparse(page.url)
-            params = parse_qs(parsed.query)
-            keywords = params.get('keywords', [''])[0]
+            params = dict(parse_qsl(urlsplit(page.url).query))
+            keywords = params.get('keywords', '')
 
             if keywords:
                 page.goto(f"https://www.linkedin.com/search/results/people/?keywords={keywords}")
@@ -568,17 +885,27 @@ class LinkedInClient:
                 return True
             raise
 
+    @staticmethod
+    def _degree_filter_active(page, degree: str) -> bool:
+        """Check whether degree is already the only degree filter applied."""
+        if not find_first_in_page(page, _ACTIVE_DEGREE_SELECTORS[degree]):
+            return False
+        return find_first_in_page(page, _OTHER_ACTIVE_DEGREE_SELECTORS[degree]) is None
+
     def _apply_connection_filter(self, page, degree: str):
         """Apply connection degree filter."""
+        # Re-clicking an applied filter would reload the results for nothing
+        if self._degree_filter_active(page, degree):
+            logger.info(f"{degree} filter already applied")
+            return
+
         # Clear other degree filters first
-        other_degrees = ['1st', '2nd', '3rd+']
-        if degree in other_degrees:
-            other_degrees.remove(degree)
+        other_degrees = [other for other in _DEGREES if other != degree]
 
         for other in other_degrees:
             try:
                 # Try new LinkedIn UI (2026) - radio buttons
-                active_btn = page.query_selector(f"[role='radio']:has-text('{other}')")
+                active_btn = page.query_selector(_DEGREE_RADIO_SELECTORS[other])
                 if active_btn:
                     # Check if it has checked state (via aria-checked or inner checkbox)
                     is_checked = active_btn.get_attribute("aria-checked") == "true"
@@ -590,9 +917,7 @@ class LinkedInClient:
                         page.wait_for_timeout(500)
                         continue
                 # Fallback to old selectors
-                active_btn = page.query_selector(f"button:has-text('{other}')[aria-pressed='true']")
-                if not active_btn:
-                    active_btn = page.query_selector(f"button.artdeco-pill--selected:has-text('{other}')")
+                active_btn = find_first_in_page(page, _SELECTED_DEGREE_PILL_SELECTORS[other])
                 if active_btn:
                     active_btn.click()
                     page.wait_for_timeout(500)
@@ -600,42 +925,62 @@ class LinkedInClient:
                 pass
 
         try:
-            RetryHelper.retry_click(page, LinkedInSelectors.degree_filter(degree), f"click {degree} degree filter")
+            RetryHelper.retry_click(page, _DEGREE_FILTER_SELECTORS[degree], f"click {degree} degree filter", delay_ms=0)
             page.wait_for_load_state("domcontentloaded", timeout=30000)
-            page.wait_for_timeout(2000)
+            self._wait_for_filter_applied(page, degree)
         except Exception:
             # Try dropdown approach
             try:
-                RetryHelper.retry_click(page, LinkedInSelectors.CONNECTIONS_DROPDOWN, "click Connections dropdown")
+                RetryHelper.retry_click(page, _CONNECTIONS_DROPDOWN_SELECTORS, "click Connections dropdown")
                 page.wait_for_timeout(1000)
-                RetryHelper.retry_click(page, [f"label:has-text('{degree}')"], f"click {degree} option")
+                RetryHelper.retry_click(page, _DEGREE_OPTION_SELECTORS[degree], f"click {degree} option", delay_ms=0)
                 page.wait_for_timeout(500)
                 try:
-                    RetryHelper.retry_click(page, LinkedInSelectors.SHOW_RESULTS, "click Show button")
+                    RetryHelper.retry_click(page, _SHOW_RESULTS_SELECTORS, "click Show button")
                 except Exception:
                     pass
-                page.wait_for_timeout(2000)
+                self._wait_for_filter_applied(page, degree)
             except Exception as e:
                 raise Exception(f"Failed to apply {degree} filter: {e}")
 
-    def _go_to_next_search_page(self, page) -> bool:
-        """Navigate to the next search results page."""
+    @staticmethod
+    def _wait_for_filter_applied(page, degree: str):
+        """Wait until the degree filter shows as selected, instead of a fixed pause."""
         try:
-            page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-            page.wait_for_timeout(500)
-
-            next_btn = None
-            for selector in LinkedInSelectors.NEXT_PAGE:
-                next_btn = page.query_selector(selector)
-                if next_btn:
-                    break
+            page.wait_for_selector(
+                _ACTIVE_DEGREE_SELECTORS[degree][0],
+                state="attached",
+                timeout=_FILTER_APPLIED_TIMEOUT_MS,
+            )
+        except PlaywrightTimeoutError:
+            # Unknown markup - carry on as the fixed pause used to
+            logger.debug(f"{degree} filter not seen as selected, continuing")
 
-            if next_btn and next_btn.is_enabled():
-                next_btn.click()
-                page.wait_for_load_state("domcontentloaded", timeout=15000)
-                page.wait_for_timeout(DELAY_MS * 2)
-                return True
+    @staticmethod
+    def _wait_for_search_results(page) -> bool:
+        """Wait until the search page has rendered; returns whether it has results."""
+        try:
+            page.wait_for_selector(
+                _SEARCH_PAGE_LOADED_SELECTOR, state="attached", timeout=_SEARCH_RESULTS_TIMEOUT_MS
+            )
+        except PlaywrightTimeoutError:
+            logger.debug("No search results rendered")
             return False
+        return page.query_selector(_SEARCH_RESULTS_SELECTOR) is not None
+
+    def _go_to_next_search_page(self, page, page_num: int) -> bool:
+        """
+        Navigate from search results page page_num to the next one.
+
+        LinkedIn's search URLs take a page parameter, so this loads the
+        next page directly instead of finding and clicking Next.
+
+        Returns:
+            True if the next page has results
+        """
+        try:
+            page.goto(_search_page_url(page.url, page_num + 1), timeout=60000, wait_until="domcontentloaded")
+            return self._wait_for_search_results(page)
         except WorkflowAbortedException:
             raise
         except Exception as e:
@@ -647,46 +992,55 @@ class LinkedInClient:
     def _send_messages_on_search_page(self, page, company: str, message_generator=None, num_pages: int = 1, first_degree_only: bool = False) -> list[dict]:
         """Send messages to 1st degree connections from search results."""
         messaged_people = []
+        messaged_urls = set()
         company_lower = company.lower()
 
         for page_num in range(1, num_pages + 1):
             self.check_abort()
             logger.info(f"Processing page {page_num} for messaging")
-            self._wait_with_abort_check(page, DELAY_MS)
+            self._wait_for_search_results(page)
 
             page_results = self._process_message_results_page(
-                page, company_lower, messaged_people, message_generator, first_degree_only
+                page, company_lower, messaged_urls, message_generator, first_degree_only
             )
             messaged_people.extend(page_results)
 
             if first_degree_only and messaged_people:
                 break
 
-            if page_num < num_pages and not self._go_to_next_search_page(page):
+            if page_num < num_pages and not self._go_to_next_search_page(page, page_num):
                 break
 
         return messaged_people
 
-    def _process_message_results_page(self, page, company_lower: str, already_messaged: list, message_generator=None, first_degree_only: bool = False) -> list[dict]:
-        """Process search results page to send messages."""
-        page_messaged = []
+    @staticmethod
+    def _wait_for_input_cleared(page, message_input) -> bool:
+        """Wait for the chat's message box to empty, which it does once the message is posted."""
+        try:
+            handle = message_input.element_handle() if hasattr(message_input, "element_handle") else message_input
+            page.wait_for_function(_INPUT_CLEARED_JS, arg=handle, timeout=_MESSAGE_CLEARED_TIMEOUT_MS, polling=100)
+            return True
+        except PlaywrightTimeoutError:
+            return False
 
-        results = []
-        for selector in LinkedInSelectors.SEARCH_RESULTS:
-            results = page.query_selector_all(selector)
-            if results:
-                break
+    def _process_message_results_page(self, page, company_lower: str, already_messaged: set[str], message_generator=None, first_degree_only: bool = False) -> list[dict]:
+        """
+        Process search results page to send messages.
 
+        already_messaged holds the profile URLs messaged so far in this
+        search; it's updated in place as messages go out.
+        """
+        page_messaged = []
+
+        results = query_search_results(page, _MESSAGE_BUTTON_SELECTORS, company_lower, already_messaged)
         if not results:
             return []
 
-        already_messaged_urls = {p.get("linkedin_url") for p in already_messaged}
-
-        for result in results:
+        for result, card, message_btn in results:
             self.check_abort()
 
             try:
-                person = extract_person_from_search_result(result, company_lower)
+                person = extract_person_from_search_result(result, company_lower, card)
                 if not person:
                     continue
 
@@ -694,12 +1048,19 @@ class LinkedInClient:
                     logger.info(f"Skipping {person['name']} - VIP")
                     continue
 
-                if person["linkedin_url"] in already_messaged_urls:
+                if person["linkedin_url"] in already_messaged:
+                    continue
+
+                # Only 1st-degree connections can be messaged; when the card's
+                # badge says otherwise, don't wait for a button
+                degree = card.get("degree") if card else ""
+                if degree and "1st" not in degree:
+                    logger.info(f"Skipping {person['name']} - not a 1st degree connection ({degree})")
                     continue
 
-                # Find Message button
-                message_btn = RetryHelper.retry_find_in_element(
-                    page, result, LinkedInSelectors.MESSAGE_BUTTON, f"find Message button for {person['name']}"
+                # Find Message button - wait for it only if it hasn't rendered yet
+                message_btn = message_btn or RetryHelper.retry_find_in_element(
+                    page, result, _MESSAGE_BUTTON_SELECTORS, f"find Message button for {person['name']}"
                 )
                 if not message_btn:
                     logger.info(f"Skipping {person['name']} - no Message button found")
@@ -712,29 +1073,19 @@ class LinkedInClient:
                     page.wait_for_timeout(500)
 
                 # Log what element we found for debugging
-                btn_tag = message_btn.evaluate("el => el.tagName")
-                btn_href = message_btn.evaluate("el => el.href || 'none'")
+                btn_tag, btn_href = message_btn.evaluate("el => [el.tagName, el.href || 'none']")
                 logger.info(f"Clicking Message for: {person['name']} (tag={btn_tag}, href={btn_href[:50] if btn_href != 'none' else 'none'})")
 
                 url_before = page.url
                 message_btn.click()
-                page.wait_for_timeout(1500)  # Wait 1.5 seconds for modal to appear
+
+                # Wait for the conversation (modal or messaging page) to show up
+                modal_found = ChatModalHelper.wait_for_modal(page, _CHAT_OPEN_TIMEOUT_MS)
 
                 # Check if we navigated away (link click) vs modal opened
                 url_after = page.url
                 if url_after != url_before:
                     logger.info(f"Message click navigated to: {url_after[:80]}")
-                    # If we navigated to messaging page, the conversation should be there
-                    # Try to find the textbox on the messaging page
-                    page.wait_for_timeout(1000)
-
-                # Retry checking for modal a few times
-                modal_found = False
-                for attempt in range(3):
-                    if ChatModalHelper.is_modal_open(page):
-                        modal_found = True
-                        break
-                    page.wait_for_timeout(500)
 
                 if not modal_found:
                     logger.info(f"Chat modal did not open for {person['name']}, skipping")
@@ -744,21 +1095,20 @@ class LinkedInClient:
                         page.wait_for_timeout(1000)
                     continue
 
-                # Check for existing message history
+                # Check for existing message history once it has loaded
+                ChatModalHelper.wait_for_message_list(page, _CHAT_HISTORY_TIMEOUT_MS)
                 page.wait_for_timeout(500)
-                history_result = page.evaluate(get_message_history_script())
+                history_result = ChatModalHelper.check_history(page)
                 message_count = history_result.get('count', 0)
 
                 if message_count > 0:
                     logger.info(f"Existing conversation with {person['name']} - skipping")
-                    closed = ChatModalHelper.close_current_chat(page)
-                    logger.info(f"Closed chat modal for {person['name']}: {closed}")
-                    page.wait_for_timeout(300)  # Extra wait after closing
+                    logger.info(f"Closed chat modal for {person['name']}: {history_result['closed']}")
                     continue
 
                 # Find message input and send
                 try:
-                    message_input = RetryHelper.retry_find(page, LinkedInSelectors.MESSAGE_INPUT, "find message input")
+                    message_input = RetryHelper.retry_find(page, _MESSAGE_INPUT_SELECTORS, "find message input")
 
                     first_name = person['name'].split()[0]
                     if message_generator:
@@ -772,19 +1122,23 @@ class LinkedInClient:
                     else:
                         message_text = f"Hi {first_name}, I noticed you work at {company_lower}. I'd love to connect!"
 
+                    # fill() focuses the input, and the Send click waits for
+                    # the button to enable, so neither needs a pause
                     message_input.click()
-                    page.wait_for_timeout(300)
                     message_input.fill(message_text)
-                    page.wait_for_timeout(500)
 
-                    RetryHelper.retry_click(page, LinkedInSelectors.SEND_MESSAGE, f"click Send for {person['name']}")
+                    RetryHelper.retry_click(page, _SEND_MESSAGE_SELECTORS, f"click Send for {person['name']}", wait_response=_is_message_sent_response)
+                    # Closing the chat before the composer has posted the
+                    # message could drop it
+                    if not self._wait_for_input_cleared(page, message_input):
+                        raise Exception("message box was not cleared after Send")
                     logger.info(f"Message sent to: {person['name']}")
 
                     person["is_connection"] = True
                     person["message_sent"] = True
                     page_messaged.append(person)
+                    already_messaged.add(person["linkedin_url"])
 
-                    page.wait_for_timeout(500)
                     ChatModalHelper.close_current_chat(page)
 
                     # Stop after first successful message
@@ -810,6 +1164,7 @@ class LinkedInClient:
     def _send_connection_requests_on_search_page(self, page, company: str, max_requests: int = 10) -> list[dict]:
         """Send connection requests from search results page."""
         connected_people = []
+        connected_urls = set()
         company_lower = company.lower()
         page_num = 0
         max_pages = 5
@@ -818,44 +1173,41 @@ class LinkedInClient:
             page_num += 1
             self.check_abort()
             logger.info(f"Processing page {page_num} ({len(connected_people)}/{max_requests} sent)")
-
-            self._wait_with_abort_check(page, DELAY_MS)
+            self._wait_for_search_results(page)
 
             remaining = max_requests - len(connected_people)
-            page_results = self._process_connection_results_page(page, company_lower, connected_people, remaining)
+            page_results = self._process_connection_results_page(page, company_lower, connected_urls, remaining)
             connected_people.extend(page_results)
 
             if len(connected_people) >= max_requests:
                 break
 
-            if not self._go_to_next_search_page(page):
+            if not self._go_to_next_search_page(page, page_num):
                 break
 
         return connected_people
 
-    def _process_connection_results_page(self, page, company_lower: str, already_connected: list, max_to_send: int) -> list[dict]:
-        """Process search results page to send connection requests."""
-        page_connected = []
+    def _process_connection_results_page(self, page, company_lower: str, already_connected: set[str], max_to_send: int) -> list[dict]:
+        """
+        Process search results page to send connection requests.
 
-        results = []
-        for selector in LinkedInSelectors.SEARCH_RESULTS:
-            results = page.query_selector_all(selector)
-            if results:
-                break
+        already_connected holds the profile URLs invited so far in this
+        search; it's updated in place as requests go out.
+        """
+        page_connected = []
 
+        results = query_search_results(page, _CONNECT_BUTTON_SELECTORS, company_lower, already_connected)
         if not results:
             return []
 
-        already_connected_urls = {p.get("linkedin_url") for p in already_connected}
-
-        for result in results:
+        for result, card, connect_btn in results:
             if len(page_connected) >= max_to_send:
                 break
 
             self.check_abort()
 
             try:
-                person = extract_person_from_search_result(result, company_lower)
+                person = extract_person_from_search_result(result, company_lower, card)
                 if not person:
                     continue
 
@@ -863,27 +1215,24 @@ class LinkedInClient:
                     logger.info(f"Skipping {person['name']} - VIP")
                     continue
 
-                if person["linkedin_url"] in already_connected_urls:
+                if person["linkedin_url"] in already_connected:
                     continue
 
-                # Look for Connect button
-                connect_btn = None
-                for selector in LinkedInSelectors.CONNECT_BUTTON:
-                    connect_btn = result.query_selector(selector)
-                    if connect_btn:
-                        break
-
+                # Connect buttons were looked up for the whole page at once
                 if not connect_btn:
                     logger.info(f"Skipping {person['name']} - no Connect button")
                     continue
 
                 logger.info(f"Clicking Connect for: {person['name']}")
                 connect_btn.click()
-                page.wait_for_timeout(DELAY_MS)
 
                 # Check for email verification modal
-                page.wait_for_timeout(DELAY_MS // 2)
-                send_btn = page.query_selector("button[aria-label='Send without a note'], button:has-text('Send without a note')")
+                try:
+                    send_btn = page.wait_for_selector(
+                        _SEND_WITHOUT_NOTE_SELECTOR, state="attached", timeout=DELAY_MS + DELAY_MS // 2
+                    )
+                except PlaywrightTimeoutError:
+                    send_btn = None
                 if send_btn and not send_btn.is_enabled():
                     logger.info(f"Skipping {person['name']} - email verification required")
                     close_btn = page.query_selector("button[aria-label='Dismiss'], button[aria-label='Close']")
@@ -893,12 +1242,13 @@ class LinkedInClient:
                     continue
 
                 try:
-                    RetryHelper.retry_click(page, LinkedInSelectors.SEND_CONNECTION, f"click Send for {person['name']}")
+                    RetryHelper.retry_click(page, _SEND_CONNECTION_SELECTORS, f"click Send for {person['name']}", wait_response=_is_invitation_sent_response)
                     logger.info(f"Connection request sent to: {person['name']}")
 
                     person["is_connection"] = False
                     person["connection_request_sent"] = True
                     page_connected.append(person)
+                    already_connected.add(person["linkedin_url"])
 
                 except WorkflowAbortedException:
                     raise
@@ -955,6 +1305,8 @@ class LinkedInClient:
             if "linkedin.com" not in current_url or "/login" in current_url:
                 page.goto("https://www.linkedin.com/feed/", timeout=60000)
                 page.wait_for_load_state("domcontentloaded", timeout=30000)
+                if self._session_expired(page):
+                    return {"replied_contacts": [], "failed_contacts": []}
                 page.wait_for_timeout(DELAY_MS)
             else:
                 logger.info(f"Already on LinkedIn: {current_url[:50]}")
@@ -972,11 +1324,7 @@ class LinkedInClient:
 
                 try:
                     # Search for conversation
-                    search_input = None
-                    for selector in LinkedInSelectors.MESSAGING_SEARCH:
-                        search_input = page.query_selector(selector)
-                        if search_input:
-                            break
+                    search_input = find_first_in_page(page, _MESSAGING_SEARCH_SELECTORS)
 
                     if search_input:
                         # Clear and search with proper waits
@@ -994,10 +1342,7 @@ class LinkedInClient:
                     # Find and click conversation - try multiple times
                     conversation = None
                     for attempt in range(3):
-                        for selector in conversation_selectors(name):
-                            conversation = page.query_selector(selector)
-                            if conversation:
-                                break
+                        conversation = find_first_in_page(page, conversation_selectors(name))
                         if conversation:
                             break
                         # Wait and retry
@@ -1051,36 +1396,19 @@ class LinkedInClient:
         logger.info("Opening messaging panel...")
 
         # Check if already open
-        for selector in LinkedInSelectors.MESSAGING_PANEL_OPEN:
-            if page.query_selector(selector):
-                logger.info("Messaging panel already open")
-                # Even if open, wait for conversations to load
-                page.wait_for_timeout(3000)
-                return
-
-        # Try to click messaging button
-        clicked = False
-        for selector in LinkedInSelectors.MESSAGING_BUTTON:
-            btn = page.query_selector(selector)
-            if btn:
-                logger.info(f"Clicking messaging button: {selector}")
-                btn.click()
-                clicked = True
-                break
+        if find_first_in_page(page, _MESSAGING_PANEL_OPEN_SELECTORS):
+            logger.info("Messaging panel already open")
+            # Even if open, wait for conversations to load
+            page.wait_for_timeout(3000)
+            return
 
-        # Try minimized version if main button didn't work
-        if not clicked:
-            for selector in LinkedInSelectors.MESSAGING_MINIMIZED:
-                minimized = page.query_selector(selector)
-                if minimized:
-                    logger.info(f"Clicking minimized messaging: {selector}")
-                    minimized.click()
-                    clicked = True
-                    break
-
-        if not clicked:
+        # Try to click messaging button, then the minimized version
+        btn = find_first_in_page(page, _MESSAGING_OPENER_SELECTORS)
+        if not btn:
             logger.warning("Could not find messaging button")
             return
+        logger.info("Clicking messaging button")
+        btn.click()
 
         # Wait for panel to open with longer timeout
         try:
@@ -1127,31 +1455,28 @@ class LinkedInClient:
         if not HAS_PLAYWRIGHT:
             return []
 
+        resources = contextlib.ExitStack()
         try:
             context, page = self._get_or_create_browser()
+            if not get_browser_visibility():
+                # Nobody is watching - only the DOM matters
+                resources.enter_context(blocking_heavy_resources(page))
 
             page.goto("https://www.linkedin.com/mynetwork/invite-connect/connections/", timeout=60000)
             page.wait_for_load_state("domcontentloaded", timeout=30000)
-            page.wait_for_timeout(1000)
-
-            connections = []
-            results = []
-            for selector in LinkedInSelectors.CONNECTION_CARDS:
-                results = page.query_selector_all(selector)
-                if results:
-                    break
-
-            for card in results[:limit]:
-                conn = extract_connection_from_card(card)
-                if conn:
-                    connections.append(conn)
+            try:
+                page.wait_for_selector(_CONNECTION_CARDS_SELECTOR, state="attached", timeout=15000)
+            except PlaywrightTimeoutError:
+                logger.info("No connection cards rendered")
 
             # Don't close browser
-            return connections
+            return extract_connections_from_page(page, limit)
 
         except Exception as e:
             logger.error(f"Failed to get connections: {e}")
             return []
+        finally:
+            resources.close()
 
     async def send_message(self, message: str, public_id: str = None, profile_url: str = None, urn_id: str = None) -> bool:
         """Send a message to a connection."""
@@ -6,10 +6,14 @@ Centralized logic for extracting name, headline, and profile URL from search res
 
 import re
 from app.utils.logger import get_logger
+from .browser_utils import find_first, find_first_in_each
 from .selectors import LinkedInSelectors
 
 logger = get_logger(__name__)
 
+# Profile handle in a LinkedIn URL: the path segment after /in/
+_PUBLIC_ID_RE = re.compile(r"/in/([^/?#]*)")
+
 
 def clean_name(name: str) -> str:
     """
@@ -90,26 +94,133 @@ def extract_public_id(url: str) -> str:
     Returns:
         Public ID (e.g., "john-doe") or empty string
     """
-    if "/in/" not in url:
-        return ""
-    return url.split("/in/")[1].split("/")[0].split("?")[0]
+    match = _PUBLIC_ID_RE.search(url)
+    return match.group(1) if match else ""
+
+
+# Raw data for one search result card, gathered in a single evaluation.
+# Selector lists are tried in order, like extract_text_from_element does.
+CARD_DATA_JS = """
+(card, selectors) => {
+    const text = (el) => ((el && el.innerText) || '').trim();
+    const href = (el) => (el && el.getAttribute('href')) || '';
+    const first = (list, read) => {
+        for (const selector of list) {
+            const value = read(card.querySelector(selector));
+            if (value) return value;
+        }
+        return '';
+    };
+    const paragraphs = Array.from(card.querySelectorAll('p'), text);
+    // The new UI's name and headline are paragraphs; only older cards
+    // need the selector cascades
+    const legacy = paragraphs.length < 2;
+    return {
+        paragraphs,
+        name: legacy ? first(selectors.name, text) : '',
+        headline: legacy ? first(selectors.headline, text) : '',
+        link: first(selectors.link, href),
+        degree: selectors.degree ? first(selectors.degree, text) : '',
+    };
+}
+"""
 
+CARD_SELECTORS = {
+    "name": LinkedInSelectors.PERSON_NAME,
+    "headline": LinkedInSelectors.PERSON_HEADLINE,
+    "link": LinkedInSelectors.PROFILE_LINK,
+    "degree": LinkedInSelectors.PERSON_DEGREE,
+}
+
+# In-page version of extract_person_from_search_result's company filter:
+# the company (lowercased) must be in the headline or the "Current:" line
+CARD_MATCHES_COMPANY_JS = """
+(data, company) => {
+    if (!company) return true;
+    let headline = data.headline;
+    let currentJob = '';
+    if (data.paragraphs.length >= 2) {
+        headline = data.paragraphs[1];
+        for (const text of data.paragraphs.slice(2)) {
+            if (text.startsWith('Current:')) {
+                currentJob = text;
+                break;
+            }
+            if (text.startsWith('Past:')) break;
+        }
+    }
+    return headline.toLowerCase().includes(company) || currentJob.toLowerCase().includes(company);
+}
+"""
+
+# The same for every card matching a selector, in one round-trip. Cards
+# failing the company filter, or whose profile is in selectors.exclude,
+# come back as null instead of their data.
+SEARCH_RESULTS_JS = f"""
+(cards, selectors) => {{
+    const cardData = {CARD_DATA_JS.strip()};
+    const matchesCompany = {CARD_MATCHES_COMPANY_JS.strip()};
+    const exclude = new Set(selectors.exclude || []);
+    const profileUrl = (link) => {{
+        const match = /\/in\/([^/?#]*)/.exec(link);
+        return match ? `https://www.linkedin.com/in/${{match[1]}}` : '';
+    }};
+    return cards.map((card) => {{
+        const data = cardData(card, selectors);
+        if (!matchesCompany(data, selectors.company) || exclude.has(profileUrl(data.link))) return null;
+        return data;
+    }});
+}}
+"""
 
-def extract_person_from_search_result(result, company_filter: str = None) -> dict | None:
+# Tries each result-list selector in order and reads the first one that
+# matches, so finding the list costs one round-trip too. Cards failing the
+# company filter are dropped in the page rather than sent back, and cards
+# past selectors.limit usable matches aren't read at all.
+SEARCH_RESULTS_PAGE_JS = f"""
+(selectors) => {{
+    const cardData = {CARD_DATA_JS.strip()};
+    const matchesCompany = {CARD_MATCHES_COMPANY_JS.strip()};
+    const usable = (data) => (data.paragraphs[0] || data.name) && /\/in\/[^/?#]/.test(data.link);
+    for (const selector of selectors.results) {{
+        const cards = document.querySelectorAll(selector);
+        if (!cards.length) continue;
+        const matches = [];
+        let usableCount = 0;
+        for (const card of cards) {{
+            const data = cardData(card, selectors);
+            if (!matchesCompany(data, selectors.company)) continue;
+            matches.push(data);
+            if (usable(data) && ++usableCount === selectors.limit) break;
+        }}
+        return {{selector, total: cards.length, cards: matches}};
+    }}
+    return null;
+}}
+"""
+
+RESULTS_PAGE_SELECTORS = {**CARD_SELECTORS, "results": LinkedInSelectors.SEARCH_RESULTS}
+
+
+def extract_person_from_search_result(result, company_filter: str = None, card_data: dict = None) -> dict | None:
     """
     Extract person information from a LinkedIn search result element.
 
     Args:
         result: Playwright element representing a search result
         company_filter: Optional company name to filter by (checks headline and current job)
+        card_data: Card data already gathered with SEARCH_RESULTS_JS, if any
 
     Returns:
         Dict with name, headline, linkedin_url, public_id, or None if extraction failed
     """
     try:
+        if card_data is None:
+            card_data = result.evaluate(CARD_DATA_JS, CARD_SELECTORS)
+
         # New LinkedIn UI (2026): Get all paragraphs and use by index
         # The paragraphs are not siblings, so nth-of-type won't work
-        paragraphs = result.query_selector_all("p")
+        paragraphs = card_data["paragraphs"]
 
         name = ""
         headline = ""
@@ -117,15 +228,13 @@ def extract_person_from_search_result(result, company_filter: str = None) -> dic
 
         if len(paragraphs) >= 2:
             # New UI: first paragraph is name (with degree), second is headline
-            raw_name = paragraphs[0].inner_text().strip() if paragraphs[0] else ""
-            name = clean_name(raw_name)
-            headline = paragraphs[1].inner_text().strip() if paragraphs[1] else ""
+            name = clean_name(paragraphs[0])
+            headline = paragraphs[1]
 
             # Look for "Current:" paragraph which contains the actual company
             # Skip "Past:" - we only want current employees, not former ones
             # This is typically paragraph 3 or 4, and has a <strong> tag with company name
-            for p in paragraphs[2:]:
-                p_text = p.inner_text().strip()
+            for p_text in paragraphs[2:]:
                 if p_text.startswith("Current:"):
                     current_job = p_text
                     break
@@ -136,9 +245,8 @@ def extract_person_from_search_result(result, company_filter: str = None) -> dic
                     break
         else:
             # Fallback to old selector-based extraction
-            raw_name = extract_text_from_element(result, LinkedInSelectors.PERSON_NAME)
-            name = clean_name(raw_name)
-            headline = extract_text_from_element(result, LinkedInSelectors.PERSON_HEADLINE)
+            name = clean_name(card_data["name"])
+            headline = card_data["headline"]
 
         if not name:
             return None
@@ -155,8 +263,7 @@ def extract_person_from_search_result(result, company_filter: str = None) -> dic
                 return None
 
         # Get profile link and extract public_id
-        link = extract_attribute_from_element(result, LinkedInSelectors.PROFILE_LINK, "href")
-        public_id = extract_public_id(link)
+        public_id = extract_public_id(card_data["link"])
 
         if not public_id:
             return None
@@ -173,6 +280,78 @@ def extract_person_from_search_result(result, company_filter: str = None) -> dic
         return None
 
 
+def query_search_results(
+    page,
+    button_selectors=None,
+    company_filter: str = None,
+    exclude_urls=(),
+) -> list[tuple[object, dict | None, object]]:
+    """
+    Find the search result cards on the current page, with their data.
+
+    The card elements are still returned for clicking buttons inside them,
+    but their text is read with one evaluation for the whole page. When
+    button_selectors is given, each card's button is looked up the same way.
+    Cards not matching company_filter, or whose profile URL is in
+    exclude_urls, are dropped in that same evaluation.
+
+    Args:
+        page: Playwright page object
+        button_selectors: Optional selectors for a button inside each card
+        company_filter: Optional company name the card must mention
+        exclude_urls: Profile URLs (https://www.linkedin.com/in/<id>) to skip
+
+    Returns:
+        List of (result element, card data, button) triples. Card data is
+        None when the batch couldn't be matched up with the elements (the
+        filters are then left to the caller); button is None when the card
+        has none (or no selectors were given).
+    """
+    for selector in LinkedInSelectors.SEARCH_RESULTS:
+        results = page.query_selector_all(selector)
+        if results:
+            break
+    else:
+        return []
+
+    selectors = {
+        **CARD_SELECTORS,
+        "company": company_filter.lower() if company_filter else None,
+        "exclude": list(exclude_urls),
+    }
+    try:
+        cards = page.eval_on_selector_all(selector, SEARCH_RESULTS_JS, selectors)
+    except Exception as e:
+        logger.debug(f"Batched card extraction failed: {e}")
+        cards = []
+
+    filtered = len(cards) == len(results)
+    if not filtered:
+        # The list re-rendered in between - let each card be read on its own
+        cards = [None] * len(results)
+
+    buttons = [None] * len(results)
+    if button_selectors:
+        try:
+            buttons = find_first_in_each(page, selector, button_selectors)
+        except Exception as e:
+            logger.debug(f"Batched button lookup failed: {e}")
+            buttons = []
+    per_card_buttons = len(buttons) != len(results)
+    if per_card_buttons:
+        buttons = [None] * len(results)
+
+    triples = [
+        (result, card, button)
+        for result, card, button in zip(results, cards, buttons)
+        if card is not None or not filtered
+    ]
+    if per_card_buttons:
+        # Only the cards that passed the filters are worth searching one by one
+        triples = [(result, card, find_first(result, button_selectors)) for result, card, _ in triples]
+    return triples
+
+
 def extract_people_from_search_results(
     page,
     company_filter: str = None,
@@ -192,58 +371,102 @@ def extract_people_from_search_results(
     people = []
 
     # Find search results using various selectors
-    results = []
-    for selector in LinkedInSelectors.SEARCH_RESULTS:
-        results = page.query_selector_all(selector)
-        if results:
-            logger.info(f"Found {len(results)} results using selector: {selector}")
-            break
-
-    if not results:
+    company = company_filter.lower() if company_filter else None
+    found = page.evaluate(
+        SEARCH_RESULTS_PAGE_JS, {**RESULTS_PAGE_SELECTORS, "company": company, "limit": limit or None}
+    )
+    if not found:
         logger.warning("No search results found with known selectors")
         return []
 
-    for result in results:
+    cards = found["cards"]
+    logger.info(f"Found {found.get('total', len(cards))} results using selector: {found['selector']}")
+    if company_filter:
+        logger.info(f"{len(cards)} of them match '{company_filter}'")
+
+    for card in cards:
         if limit and len(people) >= limit:
             break
 
-        person = extract_person_from_search_result(result, company_filter)
+        person = extract_person_from_search_result(None, company_filter, card)
         if person:
             people.append(person)
             logger.info(f"Extracted person: {person.get('name')} - {person.get('headline', '')[:50]}")
         else:
             # Debug: log why extraction failed
-            paragraphs = result.query_selector_all("p")
+            paragraphs = card["paragraphs"]
             if paragraphs:
-                raw_name = paragraphs[0].inner_text().strip() if len(paragraphs) > 0 else "N/A"
-                raw_headline = paragraphs[1].inner_text().strip() if len(paragraphs) > 1 else "N/A"
+                raw_name = paragraphs[0]
+                raw_headline = paragraphs[1] if len(paragraphs) > 1 else "N/A"
                 logger.info(f"Skipped result - name: '{raw_name[:30]}', headline: '{raw_headline[:50]}', filter: '{company_filter}'")
 
     return people
 
 
-def extract_connection_from_card(card) -> dict | None:
+# Raw data for one connection card, read in a single evaluation.
+# Selector lists are tried in order, like extract_text_from_element does.
+CONNECTION_DATA_JS = """
+(card, selectors) => {
+    const text = (el) => ((el && el.innerText) || '').trim();
+    const href = (el) => (el && el.getAttribute('href')) || '';
+    const first = (list, read) => {
+        for (const selector of list) {
+            const value = read(card.querySelector(selector));
+            if (value) return value;
+        }
+        return '';
+    };
+    return {
+        name: first(selectors.name, text),
+        headline: first(selectors.headline, text),
+        link: first(selectors.link, href),
+    };
+}
+"""
+
+CONNECTION_SELECTORS = {
+    "name": LinkedInSelectors.CONNECTION_NAME,
+    "headline": LinkedInSelectors.CONNECTION_HEADLINE,
+    "link": LinkedInSelectors.CONNECTION_LINK,
+}
+
+# Finds the connection list and reads up to selectors.limit cards from it,
+# all in one round-trip
+CONNECTIONS_PAGE_JS = f"""
+(selectors) => {{
+    const connectionData = {CONNECTION_DATA_JS.strip()};
+    for (const selector of selectors.cards) {{
+        const cards = Array.from(document.querySelectorAll(selector));
+        if (cards.length) {{
+            return cards.slice(0, selectors.limit).map((card) => connectionData(card, selectors));
+        }}
+    }}
+    return [];
+}}
+"""
+
+
+def extract_connection_from_card(card, card_data: dict = None) -> dict | None:
     """
     Extract connection information from a connection card element.
 
     Args:
         card: Playwright element representing a connection card
+        card_data: Card data already gathered with CONNECTION_DATA_JS, if any
 
     Returns:
         Dict with name, headline, linkedin_url, public_id, is_connection=True
     """
     try:
-        # Get name
-        name = extract_text_from_element(card, LinkedInSelectors.CONNECTION_NAME)
+        if card_data is None:
+            card_data = card.evaluate(CONNECTION_DATA_JS, CONNECTION_SELECTORS)
+
+        name = card_data["name"]
         if not name:
             return None
 
-        # Get headline
-        headline = extract_text_from_element(card, LinkedInSelectors.CONNECTION_HEADLINE)
-
-        # Get profile link
-        link = extract_attribute_from_element(card, LinkedInSelectors.CONNECTION_LINK, "href")
-        public_id = extract_public_id(link)
+        headline = card_data["headline"]
+        public_id = extract_public_id(card_data["link"])
 
         if not public_id:
             return None
@@ -259,3 +482,26 @@ def extract_connection_from_card(card) -> dict | None:
     except Exception as e:
         logger.error(f"Error extracting connection from card: {e}")
         return None
+
+
+def extract_connections_from_page(page, limit: int) -> list[dict]:
+    """
+    Extract connections from the current connections page.
+
+    Args:
+        page: Playwright page object
+        limit: Maximum number of cards to read
+
+    Returns:
+        List of connection dicts
+    """
+    cards = page.evaluate(
+        CONNECTIONS_PAGE_JS,
+        {**CONNECTION_SELECTORS, "cards": LinkedInSelectors.CONNECTION_CARDS, "limit": limit},
+    )
+    connections = []
+    for card_data in cards:
+        connection = extract_connection_from_card(None, card_data)
+        if connection:
+            connections.append(connection)
+    return connections
@@ -357,3 +357,33 @@ def get_check_overlay_open_script() -> str:
 def get_scroll_to_bottom_script() -> str:
     """JavaScript to scroll to the bottom of the page."""
     return "window.scrollTo(0, document.body.scrollHeight)"
+
+
+def get_embedded_profile_name_script() -> str:
+    """
+    JavaScript to read the logged-in user's name from the JSON LinkedIn
+    embeds in <code> blocks. Parsed in the page so only the name is returned.
+    """
+    return """
+        () => {
+            const fullName = (p) => p && p.firstName
+                ? `${p.firstName} ${p.lastName || ''}`.trim()
+                : null;
+            for (const code of document.querySelectorAll('code')) {
+                const text = code.textContent;
+                if (!text || !text.includes('miniProfile')) continue;
+                let blob;
+                try { blob = JSON.parse(text); } catch (e) { continue; }
+                const data = blob.data || {};
+                const inline = fullName(data.miniProfile);
+                if (inline) return inline;
+                const urn = data['*miniProfile'];
+                if (!urn) continue;
+                const profile = (blob.included || []).find((item) => item && item.entityUrn === urn);
+                const name = fullName(profile);
+                if (name) return name;
+            }
+            return null;
+        }
+    """
+
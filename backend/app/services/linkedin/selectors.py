@@ -18,15 +18,18 @@ class LinkedInSelectors:
 
     # People tab in search results
     PEOPLE_TAB = [
-        "button:has-text('People')",
-        "a:has-text('People')",
+        # Attribute selectors first - stable, and no text scan
         "[data-test-search-tab='PEOPLE']",
+        "a[href*='/search/results/people']",
+        "button.search-reusables__filter-pill-button:has-text('People')",
         ".search-reusables__filter-pill-button:has-text('People')",
         ".artdeco-pill:has-text('People')",
-        "button.search-reusables__filter-pill-button:has-text('People')",
-        "li button:has-text('People')",
-        "nav a:has-text('People')",
         ".search-navigation a:has-text('People')",
+        "nav a:has-text('People')",
+        "li button:has-text('People')",
+        # Last resort: any button/link with the text
+        "button:has-text('People')",
+        "a:has-text('People')",
     ]
 
     # Search result containers
@@ -41,6 +44,13 @@ class LinkedInSelectors:
         ".search-results-container li",
     ]
 
+    # Empty search result page (e.g. paging past the last page)
+    NO_RESULTS = [
+        ".search-reusable-search-no-results",
+        ".artdeco-empty-state",
+        "h2:has-text('No results found')",
+    ]
+
     # Person name in search result
     PERSON_NAME = [
         # New LinkedIn UI (2026) - name is in first paragraph
@@ -70,6 +80,12 @@ class LinkedInSelectors:
         "a[href*='/in/']",
     ]
 
+    # Connection degree badge in search result ("1st", "2nd", ...)
+    PERSON_DEGREE = [
+        ".entity-result__badge-text",
+        ".dist-value",
+    ]
+
     # Connection degree filters
     @staticmethod
     def degree_filter(degree: str) -> list[str]:
@@ -87,6 +103,17 @@ class LinkedInSelectors:
             f"button.artdeco-pill--choice:has-text('{degree}')",
         ]
 
+    @staticmethod
+    def active_degree_filter(degree: str) -> list[str]:
+        """Get selectors matching a degree filter once it's applied."""
+        return [
+            # New LinkedIn UI (2026) - radio buttons with checked state
+            f"[role='radio'][aria-checked='true']:has-text('{degree}')",
+            # Fallback to older selectors
+            f"button.artdeco-pill--selected:has-text('{degree}')",
+            f"button[aria-pressed='true']:has-text('{degree}')",
+        ]
+
     # Active degree filter (for clearing)
     ACTIVE_DEGREE_FILTERS = [
         # New LinkedIn UI (2026) - radio buttons with checked state
@@ -106,9 +133,9 @@ class LinkedInSelectors:
     # Connections dropdown filter (fallback if direct degree filters don't work)
     CONNECTIONS_DROPDOWN = [
         "[role='radio']:has-text('Connections')",
-        "button:has-text('Connections')",
         "button[aria-label*='Connections']",
         ".search-reusables__filter-pill-button:has-text('Connections')",
+        "button:has-text('Connections')",
     ]
 
     # Show/Apply results button in filter dropdown
@@ -118,14 +145,6 @@ class LinkedInSelectors:
         "button[aria-label*='Apply']",
     ]
 
-    # Next page button
-    NEXT_PAGE = [
-        "button[aria-label='Next']",
-        "button:has-text('Next')",
-        "a[aria-label='Next']",
-        "[aria-label='Next']",
-    ]
-
     # Message button on search results
     # NOTE: Similar to Connect, LinkedIn may use links or buttons
     MESSAGE_BUTTON = [
@@ -24,6 +24,7 @@ from app.models.contact import Contact
 from app.models.template import Template
 from app.models.activity import ActivityLog, ActionType
 from app.models.site_selector import SiteSelector
+from app.services.job_processor import invalidate_selector_cache
 
 
 # Test database URL (in-memory SQLite for tests)
@@ -67,6 +68,14 @@ async def db_session(async_engine) -> AsyncGenerator[AsyncSession, None]:
         await session.rollback()
 
 
+@pytest.fixture(autouse=True)
+def reset_selector_cache():
+    """Each test gets a fresh database, so drop the cached selector domains."""
+    invalidate_selector_cache()
+    yield
+    invalidate_selector_cache()
+
+
 @pytest_asyncio.fixture
 async def client(async_engine, db_session) -> AsyncGenerator[AsyncClient, None]:
     """Create a test client with database override."""
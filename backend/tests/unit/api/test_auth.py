@@ -185,6 +185,23 @@ class TestLoginEndpoint:
         mock_auth.close.assert_called_once()
 
 
+class TestLoginBrowserEndpoint:
+    """Tests for POST /api/auth/login-browser endpoint."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("query, forced", [("", False), ("?force_relogin=true", True)])
+    async def test_force_relogin_passed_through(self, client: AsyncClient, query, forced):
+        """Test that the relogin flag reaches the LinkedIn client."""
+        mock_client = MagicMock()
+        mock_client.login_with_browser = AsyncMock(return_value=False)
+
+        with patch("app.api.auth.get_linkedin_client", return_value=mock_client):
+            response = await client.post(f"/api/auth/login-browser{query}")
+
+        assert response.status_code == 200
+        mock_client.login_with_browser.assert_awaited_once_with(force_relogin=forced)
+
+
 class TestLogoutEndpoint:
     """Tests for POST /api/auth/logout endpoint."""
 
@@ -0,0 +1,764 @@
+"""
+Unit tests for LinkedIn browser utilities.
+"""
+import random
+from concurrent.futures import Future
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.services.linkedin import browser_utils
+from app.services.linkedin.browser_utils import (
+    CHAT_CONVERSATION_SELECTOR,
+    CHAT_MESSAGE_LIST_SELECTOR,
+    CHROMIUM_WINDOW_CLASS,
+    CLOSE_CURRENT_CHAT_JS,
+    DELAY_MS,
+    FIRST_MATCH_INDEX_JS,
+    FIRST_MATCH_JS,
+    HELPERS_INIT_SCRIPT,
+    ChatModalHelper,
+    RESPONSE_TIMEOUT_MS,
+    RETRY_TIMEOUT_MS,
+    PlaywrightTimeoutError,
+    RetryHelper,
+    _backoff_delays,
+    _find_browser_window,
+    find_first,
+    find_first_in_page,
+    blocking_heavy_resources,
+    bring_browser_to_front,
+    compile_selectors,
+    get_browser_args,
+    prewarm_dns,
+    register_helpers,
+    wait_until,
+)
+
+
+class FakeLocator:
+    """Minimal stand-in for a Playwright Locator."""
+
+    def __init__(self, root: "FakeRoot", selector: str):
+        self.root = root
+        self.selector = selector
+        self.first = self
+
+    @property
+    def target(self):
+        return self.root._match(self.selector)
+
+    def wait_for(self, state=None, timeout=None):
+        self.root.wait_for_selector(self.selector, state=state, timeout=timeout)
+
+    def count(self):
+        return 1 if self.target else 0
+
+    def click(self, timeout=None):
+        self.target.click()
+
+
+class FakeRoot:
+    """Minimal stand-in for a Playwright page/element handle."""
+
+    def __init__(self, matches: dict[str, object], reject_combined: bool = False):
+        self.matches = matches
+        self.reject_combined = reject_combined
+        self.queries: list[str] = []
+        self.waits: list[str] = []
+        self.wait_for_timeout = MagicMock()
+
+    def _match(self, selector):
+        if self.reject_combined and "," in selector:
+            raise ValueError("Unexpected token in selector")
+        for part in selector.split(","):
+            if part.strip() in self.matches:
+                return self.matches[part.strip()]
+        return None
+
+    def locator(self, selector):
+        return FakeLocator(self, selector)
+
+    def query_selector(self, selector):
+        self.queries.append(selector)
+        return self._match(selector)
+
+    def wait_for_selector(self, selector, state=None, timeout=None):
+        self.waits.append(selector)
+        found = self._match(selector)
+        if not found:
+            raise PlaywrightTimeoutError(f"Timeout {timeout}ms exceeded")
+        return found
+
+
+class TestRetryFind:
+    """Tests for RetryHelper selector lookups."""
+
+    def test_miss_uses_single_combined_wait(self):
+        """Test that a miss is a single combined wait with no polling."""
+        page = FakeRoot({})
+
+        with pytest.raises(Exception, match="Failed to find thing"):
+            RetryHelper.retry_find(page, ["a.one", "a.two", "a.three"], "find thing")
+
+        assert page.waits == ["a.one, a.two, a.three"]
+        assert page.queries == []
+        page.wait_for_timeout.assert_not_called()
+
+    def test_selector_priority_preserved(self):
+        """Test that the earliest selector in the list wins."""
+        first, second = object(), object()
+        page = FakeRoot({"a.two": second, "a.one": first})
+
+        assert RetryHelper.retry_find(page, ["a.one", "a.two"], "find thing").target is first
+
+    def test_priority_resolved_in_one_evaluation(self):
+        """Test that the winning selector is picked by a single evaluate."""
+        first, second = object(), object()
+        page = FakeRoot({"a.two": second, "a.one": first})
+        page.evaluate = MagicMock(return_value=1)
+
+        assert RetryHelper.retry_find(page, ["a.one", "a.two"], "find thing").target is second
+        page.evaluate.assert_called_once_with(FIRST_MATCH_INDEX_JS, ["a.one", "a.two"])
+
+    def test_polls_when_combined_selector_rejected(self):
+        """Test fallback to polling when the combined wait errors out."""
+        found = object()
+        page = FakeRoot({"a.two": found}, reject_combined=True)
+
+        assert RetryHelper.retry_find(page, ["a.one", "a.two"], "find thing") is found
+
+    def test_find_in_element(self):
+        """Test that element-scoped lookups use the same path."""
+        found = object()
+        element = FakeRoot({"button.msg": found})
+        page = FakeRoot({})
+
+        assert RetryHelper.retry_find_in_element(page, element, ["a.x", "button.msg"], "find") is found
+        assert element.waits == ["a.x, button.msg"]
+
+    def test_find_in_element_batches_cascade(self):
+        """Test that the selector cascade is resolved in one evaluation."""
+        found = MagicMock()
+        element = FakeRoot({"button.msg": object()})
+        element.evaluate_handle = MagicMock()
+        element.evaluate_handle.return_value.as_element.return_value = found
+
+        assert RetryHelper.retry_find_in_element(FakeRoot({}), element, ["a.x", "button.msg"], "find") is found
+        element.evaluate_handle.assert_called_once_with(FIRST_MATCH_JS, ["a.x", "button.msg"])
+        assert element.queries == []
+
+    def test_find_in_element_batch_error_falls_back(self):
+        """Test that selectors the browser can't evaluate are queried one by one."""
+        found = object()
+        element = FakeRoot({"button.msg": found})
+        element.evaluate_handle = MagicMock(side_effect=RuntimeError("not a valid selector"))
+
+        assert RetryHelper.retry_find_in_element(FakeRoot({}), element, ["a.x", "button.msg"], "find") is found
+        assert "button.msg" in element.queries
+
+    def test_find_in_element_missing_returns_none(self):
+        """Test that element-scoped lookups return None on timeout."""
+        page = FakeRoot({})
+
+        assert RetryHelper.retry_find_in_element(page, FakeRoot({}), ["a.x"], "find") is None
+
+
+class TestFindFirst:
+    """Tests for the one-shot find_first lookup."""
+
+    def test_single_evaluation(self):
+        """Test that the whole selector list is resolved in one call."""
+        found = MagicMock()
+        element = FakeRoot({})
+        element.evaluate_handle = MagicMock()
+        element.evaluate_handle.return_value.as_element.return_value = found
+
+        assert find_first(element, ["a.invite", "button.connect"]) is found
+        assert element.queries == []
+        assert element.waits == []
+
+    def test_falls_back_to_queries(self):
+        """Test that an unsupported selector falls back to per-selector queries."""
+        found = object()
+        element = FakeRoot({"button.connect": found})
+        element.evaluate_handle = MagicMock(side_effect=RuntimeError("is not a valid selector"))
+
+        assert find_first(element, ["a.invite", "button.connect"]) is found
+
+    def test_page_lookup_single_evaluation(self):
+        """Test that a page-wide lookup is one evaluation over the document."""
+        found = MagicMock()
+        page = FakeRoot({})
+        page.evaluate_handle = MagicMock()
+        page.evaluate_handle.return_value.as_element.return_value = found
+
+        assert find_first_in_page(page, ["a.next", "button.next"]) is found
+        assert page.evaluate_handle.call_args.args[1] == ["a.next", "button.next"]
+        assert page.queries == []
+
+    def test_page_lookup_falls_back_to_queries(self):
+        """Test that the page-wide lookup degrades like find_first."""
+        found = object()
+        page = FakeRoot({"button.next": found})
+        page.evaluate_handle = MagicMock(side_effect=RuntimeError("is not a valid selector"))
+
+        assert find_first_in_page(page, ["a.next", "button.next"]) is found
+
+
+class TestRetryClick:
+    """Tests for RetryHelper.retry_click."""
+
+    def test_click_found_element(self):
+        """Test that the matched element is clicked."""
+        button = MagicMock()
+        page = FakeRoot({"button.send": button})
+
+        assert RetryHelper.retry_click(page, ["button.send"], "click Send", delay_ms=0) is True
+        button.click.assert_called_once()
+
+    def test_post_click_delay_by_action(self):
+        """Test that actions listed in POST_CLICK_DELAYS skip the sleep."""
+        page = FakeRoot({"button.tab": MagicMock()})
+
+        RetryHelper.retry_click(page, ["button.tab"], "click People tab")
+
+        page.wait_for_timeout.assert_not_called()
+
+    def test_default_post_click_delay(self):
+        """Test that other actions keep the DELAY_MS pause."""
+        page = FakeRoot({"button.send": MagicMock()})
+
+        RetryHelper.retry_click(page, ["button.send"], "click Send for Dana")
+
+        page.wait_for_timeout.assert_called_once()
+        (delay,), _ = page.wait_for_timeout.call_args
+        assert DELAY_MS <= delay <= DELAY_MS * 1.5
+
+    def test_wait_response_replaces_sleep(self):
+        """Test that an opted-in click waits for its response instead of sleeping."""
+        button = MagicMock()
+        page = FakeRoot({"button.send": button})
+        page.expect_response = MagicMock()
+        predicate = MagicMock()
+
+        RetryHelper.retry_click(page, ["button.send"], "click Send for Dana", wait_response=predicate)
+
+        page.expect_response.assert_called_once_with(predicate, timeout=RESPONSE_TIMEOUT_MS)
+        button.click.assert_called_once()
+        page.wait_for_timeout.assert_not_called()
+
+    def test_missing_response_is_a_failure(self):
+        """Test that a click whose request never completes isn't reported as done."""
+        page = FakeRoot({"button.send": MagicMock()})
+        page.expect_response = MagicMock()
+        page.expect_response.return_value.__exit__.side_effect = PlaywrightTimeoutError("Timeout")
+
+        with pytest.raises(Exception, match="Failed to click Send"):
+            RetryHelper.retry_click(page, ["button.send"], "click Send", wait_response=MagicMock())
+
+    def test_error_response_is_a_failure(self):
+        """Test that an error status from the click's request fails the click."""
+        page = FakeRoot({"button.send": MagicMock()})
+        page.expect_response = MagicMock()
+        response = page.expect_response.return_value.__enter__.return_value.value
+        response.ok = False
+        response.status = 429
+
+        with pytest.raises(Exception, match="Failed to click Send"):
+            RetryHelper.retry_click(page, ["button.send"], "click Send", wait_response=MagicMock())
+
+    def test_click_failure_raises(self):
+        """Test that a failing click surfaces as a retry failure."""
+        button = MagicMock()
+        button.click.side_effect = RuntimeError("detached")
+        page = FakeRoot({"button.send": button})
+
+        with pytest.raises(Exception, match="Failed to click Send"):
+            RetryHelper.retry_click(page, ["button.send"], "click Send")
+
+
+class TestCompileSelectors:
+    """Tests for compile_selectors."""
+
+    def test_compiled_form(self):
+        """Test that selectors are joined once and kept individually."""
+        assert compile_selectors(("a.one", "a.two")) == ("a.one, a.two", ("a.one", "a.two"))
+
+    def test_compiled_cached(self):
+        """Test that the same selectors reuse the cached result."""
+        assert compile_selectors(("a.one", "a.two")) is compile_selectors(("a.one", "a.two"))
+
+    def test_retry_find_accepts_compiled(self):
+        """Test that retry helpers take pre-compiled selectors."""
+        found = object()
+        page = FakeRoot({"a.two": found})
+
+        assert RetryHelper.retry_find(page, compile_selectors(("a.one", "a.two")), "find").target is found
+        assert page.waits == ["a.one, a.two"]
+
+
+class TestCloseAllOverlays:
+    """Tests for the close_all_overlays fast path."""
+
+    def test_no_overlays_skips_close_script(self):
+        """Test that a negative probe returns without waiting or closing."""
+        page = MagicMock()
+        page.evaluate.return_value = {"value": False}
+
+        ChatModalHelper.close_all_overlays(page)
+
+        page.evaluate.assert_called_once()
+        page.wait_for_timeout.assert_not_called()
+        page.keyboard.press.assert_not_called()
+
+    def test_negative_probe_remembered(self):
+        """Test that back-to-back calls reuse the negative probe."""
+        page = MagicMock()
+        page.evaluate.return_value = {"value": False}
+
+        ChatModalHelper.close_all_overlays(page)
+        ChatModalHelper.close_all_overlays(page)
+
+        page.evaluate.assert_called_once()
+
+    def test_open_overlay_runs_close_script(self):
+        """Test that open overlays are still closed."""
+        page = MagicMock()
+        page.evaluate.side_effect = [{"value": True}, {"value": {"closed": 1, "stillOpen": True}}]
+        page.wait_for_function.side_effect = PlaywrightTimeoutError("timeout")
+
+        ChatModalHelper.close_all_overlays(page)
+
+        assert page.evaluate.call_count == 2
+        page.keyboard.press.assert_called_with("Escape")
+
+    def test_real_escape_skipped_once_overlay_settles(self):
+        """Test that the in-page close/Escape is given time before pressing Escape."""
+        page = MagicMock()
+        page.evaluate.side_effect = [
+            {"value": True},
+            {"value": {"closed": 0, "stillOpen": True, "escapeDispatched": True}},
+        ]
+
+        ChatModalHelper.close_all_overlays(page)
+
+        page.wait_for_function.assert_called_once()
+        page.keyboard.press.assert_not_called()
+
+    def test_escape_skipped_when_all_closed(self):
+        """Test that Escape is only pressed if something is still open."""
+        page = MagicMock()
+        page.evaluate.side_effect = [{"value": True}, {"value": {"closed": 2, "stillOpen": False}}]
+
+        ChatModalHelper.close_all_overlays(page)
+
+        page.keyboard.press.assert_not_called()
+        page.wait_for_function.assert_not_called()
+
+    def test_cleared_page_skips_next_probe(self):
+        """Test that a close leaving nothing open stands in for the next probe."""
+        page = MagicMock()
+        page.evaluate.side_effect = [{"value": True}, {"value": {"closed": 1, "stillOpen": False}}]
+
+        ChatModalHelper.close_all_overlays(page)
+        ChatModalHelper.close_all_overlays(page)
+
+        assert page.evaluate.call_count == 2
+
+
+class TestWaitForModal:
+    """Tests for ChatModalHelper.wait_for_modal."""
+
+    def test_waits_for_the_conversation_itself(self):
+        """Test that the wait targets the conversation, not any messaging UI."""
+        page = MagicMock()
+
+        assert ChatModalHelper.wait_for_modal(page, 4000) is True
+        page.locator.assert_called_once_with(CHAT_CONVERSATION_SELECTOR)
+        page.locator.return_value.first.wait_for.assert_called_once_with(state="visible", timeout=4000)
+        page.evaluate.assert_not_called()
+        page.wait_for_timeout.assert_not_called()
+
+    def test_docked_list_alone_is_not_a_conversation(self):
+        """Test that the docked messaging list doesn't match the selector."""
+        for selector in ('.msg-overlay-bubble-header', '[role="textbox"]', '[role="dialog"]'):
+            assert selector not in CHAT_CONVERSATION_SELECTOR.split(", ")
+
+    def test_modal_never_opens(self):
+        """Test that a timeout reports no modal."""
+        page = MagicMock()
+        page.locator.return_value.first.wait_for.side_effect = PlaywrightTimeoutError("timeout")
+
+        assert ChatModalHelper.wait_for_modal(page, 4000) is False
+
+
+class TestWaitForMessageList:
+    """Tests for ChatModalHelper.wait_for_message_list."""
+
+    def test_waits_for_list(self):
+        """Test that the history's list is awaited before counting."""
+        page = MagicMock()
+
+        assert ChatModalHelper.wait_for_message_list(page, 3000) is True
+        page.locator.assert_called_once_with(CHAT_MESSAGE_LIST_SELECTOR)
+
+    def test_missing_list(self):
+        """Test that a list that never shows up is reported."""
+        page = MagicMock()
+        page.locator.return_value.first.wait_for.side_effect = PlaywrightTimeoutError("timeout")
+
+        assert ChatModalHelper.wait_for_message_list(page, 3000) is False
+
+
+class TestDismissChat:
+    """Tests for ChatModalHelper.dismiss_chat."""
+
+    def test_escape_is_enough(self):
+        """Test that the close button isn't searched for once Escape worked."""
+        page = MagicMock()
+
+        assert ChatModalHelper.dismiss_chat(page) is True
+        page.keyboard.press.assert_called_once_with("Escape")
+        page.evaluate.assert_not_called()
+
+    def test_falls_back_to_close_button(self):
+        """Test that a chat still open after Escape is closed by its X."""
+        page = MagicMock()
+        page.wait_for_function.side_effect = [PlaywrightTimeoutError("timeout"), None]
+        page.evaluate.return_value = {"value": {"clicked": True, "stillOpen": False}}
+
+        assert ChatModalHelper.dismiss_chat(page) is True
+        page.evaluate.assert_called_once()
+
+
+class TestCheckHistory:
+    """Tests for ChatModalHelper.check_history."""
+
+    def test_counts_and_closes_in_one_evaluate(self):
+        """Test that a chat with history is closed by the counting script."""
+        page = MagicMock()
+        page.evaluate.return_value = {"count": 2, "closed": True}
+
+        assert ChatModalHelper.check_history(page)["closed"] is True
+        page.evaluate.assert_called_once()
+        page.keyboard.press.assert_not_called()
+
+    def test_escape_when_close_click_missed(self):
+        """Test that Escape is tried if no close button was clicked."""
+        page = MagicMock()
+        page.evaluate.return_value = {"count": 1, "closed": False}
+
+        assert ChatModalHelper.check_history(page)["closed"] is True
+        page.keyboard.press.assert_called_once_with("Escape")
+
+    def test_new_conversation_left_open(self):
+        """Test that an empty chat isn't closed."""
+        page = MagicMock()
+        page.evaluate.return_value = {"count": 0, "closed": False}
+
+        assert ChatModalHelper.check_history(page)["count"] == 0
+        page.wait_for_function.assert_not_called()
+        page.keyboard.press.assert_not_called()
+
+
+class TestCloseCurrentChat:
+    """Tests for ChatModalHelper.close_current_chat."""
+
+    def test_single_round_trip(self):
+        """Test that closing and the still-open check share one evaluate."""
+        page = MagicMock()
+        page.evaluate.return_value = {"value": {"clicked": True, "stillOpen": False}}
+
+        assert ChatModalHelper.close_current_chat(page) is True
+        page.evaluate.assert_called_once()
+        page.keyboard.press.assert_not_called()
+
+    def test_unregistered_helper_falls_back_to_full_script(self):
+        """Test that pages loaded before register_helpers still work."""
+        page = MagicMock()
+        page.evaluate.side_effect = [None, {"clicked": True, "stillOpen": False}]
+
+        assert ChatModalHelper.close_current_chat(page) is True
+        assert page.evaluate.call_args_list[1].args[0] == CLOSE_CURRENT_CHAT_JS
+
+    def test_escape_when_still_open(self):
+        """Test that Escape is pressed when the chat didn't close."""
+        page = MagicMock()
+        page.evaluate.return_value = {"value": {"clicked": False, "stillOpen": True}}
+
+        ChatModalHelper.close_current_chat(page)
+
+        page.keyboard.press.assert_called_once_with("Escape")
+
+
+class TestWaitUntil:
+    """Tests for wait_until."""
+
+    def test_returns_true_when_predicate_holds(self):
+        """Test that a satisfied predicate returns without sleeping."""
+        page = MagicMock()
+
+        assert wait_until(page, "() => true", 500) is True
+        page.wait_for_timeout.assert_not_called()
+
+    def test_timeout_returns_false(self):
+        """Test that a timeout is swallowed."""
+        page = MagicMock()
+        page.wait_for_function.side_effect = PlaywrightTimeoutError("Timeout 500ms exceeded")
+
+        assert wait_until(page, "() => false", 500) is False
+        page.wait_for_timeout.assert_not_called()
+
+    def test_evaluation_error_falls_back_to_sleep(self):
+        """Test that a broken predicate keeps the old fixed padding."""
+        page = MagicMock()
+        page.wait_for_function.side_effect = RuntimeError("Execution context was destroyed")
+
+        assert wait_until(page, "() => x", 300) is False
+        page.wait_for_timeout.assert_called_once_with(300)
+
+
+class TestFindBrowserWindow:
+    """Tests for the Chromium window lookup."""
+
+    @pytest.fixture(autouse=True)
+    def no_cached_window(self, monkeypatch):
+        """Start every lookup without a remembered window."""
+        monkeypatch.setattr(browser_utils, "_browser_hwnd", 0)
+
+    def test_walks_only_chromium_windows(self):
+        """Test that windows are enumerated by class until a title matches."""
+        titles = {11: "Feed | LinkedIn - Chromium", 12: "Untitled - Chromium"}
+        win32gui = MagicMock()
+        win32gui.FindWindowEx.side_effect = [11, 12]
+        win32gui.GetWindowText.side_effect = lambda hwnd: titles[hwnd]
+
+        assert _find_browser_window(win32gui) == 11
+        win32gui.FindWindowEx.assert_called_once_with(0, 0, CHROMIUM_WINDOW_CLASS, None)
+
+    def test_skips_other_chromium_based_windows(self):
+        """Test that the user's own Chrome, Edge or Electron apps are skipped."""
+        titles = {
+            21: "Visual Studio Code",
+            22: "Feed | LinkedIn - Google Chrome",
+            23: "Feed | LinkedIn - Profile 1 - Microsoft\u200b Edge",
+            24: "Feed | LinkedIn - Chromium",
+        }
+        win32gui = MagicMock()
+        win32gui.FindWindowEx.side_effect = [21, 22, 23, 24]
+        win32gui.GetWindowText.side_effect = lambda hwnd: titles[hwnd]
+
+        assert _find_browser_window(win32gui) == 24
+        win32gui.FindWindowEx.assert_called_with(0, 23, CHROMIUM_WINDOW_CLASS, None)
+
+    def test_reuses_found_window(self):
+        """Test that a still-valid window is returned without walking again."""
+        win32gui = MagicMock()
+        win32gui.FindWindowEx.side_effect = [31]
+        win32gui.GetWindowText.return_value = "Feed | LinkedIn - Chromium"
+        win32gui.IsWindow.return_value = True
+
+        assert _find_browser_window(win32gui) == 31
+        assert _find_browser_window(win32gui) == 31
+        win32gui.FindWindowEx.assert_called_once()
+
+    def test_closed_window_found_again(self):
+        """Test that a destroyed window triggers a fresh lookup."""
+        win32gui = MagicMock()
+        win32gui.FindWindowEx.side_effect = [41, 42]
+        win32gui.GetWindowText.return_value = "Feed | LinkedIn - Chromium"
+        win32gui.IsWindow.return_value = False
+
+        assert _find_browser_window(win32gui) == 41
+        assert _find_browser_window(win32gui) == 42
+
+    def test_not_found(self):
+        """Test that 0 is returned when no window matches."""
+        win32gui = MagicMock()
+        win32gui.FindWindowEx.return_value = 0
+
+        assert _find_browser_window(win32gui) == 0
+
+
+class TestBringBrowserToFront:
+    """Tests for bring_browser_to_front."""
+
+    def test_runs_in_background(self):
+        """Test that the window lookup runs off the caller's thread."""
+        future = bring_browser_to_front()
+
+        assert isinstance(future, Future)
+        # No win32gui here - the failure is logged, not raised
+        assert future.result(timeout=5) is None
+
+
+class TestGetBrowserArgs:
+    """Tests for get_browser_args."""
+
+    def test_same_arguments_reuse_result(self):
+        """Test that repeated calls return the cached mapping."""
+        assert get_browser_args(hidden=False) is get_browser_args(hidden=False)
+
+    def test_maximized(self):
+        """Test the default maximized window arguments."""
+        args = get_browser_args(hidden=False)
+
+        assert args["no_viewport"] is True
+        assert args["args"] == ("--start-maximized",)
+
+    def test_hidden_overrides_maximized(self):
+        """Test that hidden windows are placed off-screen."""
+        args = get_browser_args(hidden=True)
+
+        assert "--window-position=-32000,-32000" in args["args"]
+
+    def test_custom_viewport(self):
+        """Test that a custom viewport is passed through."""
+        args = get_browser_args(viewport={"width": 800, "height": 600}, maximized=False, hidden=False)
+
+        assert args["viewport"] == {"width": 800, "height": 600}
+
+    def test_result_is_read_only(self):
+        """Test that the shared cached mapping can't be mutated."""
+        with pytest.raises(TypeError):
+            get_browser_args(hidden=False)["headless"] = True
+
+    def test_nested_values_not_shared(self):
+        """Test that a caller can't corrupt the arguments of later launches."""
+        args = get_browser_args(hidden=True)
+        args["viewport"]["width"] = 1
+
+        assert isinstance(args["args"], tuple)
+        assert get_browser_args(hidden=True)["viewport"] == {"width": 1280, "height": 720}
+
+
+class TestEnsureBrowserDataDir:
+    """Tests for ensure_browser_data_dir."""
+
+    def test_creates_directory_once(self, monkeypatch):
+        """Test that the directory is created on the first call only."""
+        path = MagicMock()
+        monkeypatch.setattr(browser_utils, "BROWSER_DATA_PATH", path)
+        monkeypatch.setattr(browser_utils, "_browser_data_dir_ensured", False)
+
+        browser_utils.ensure_browser_data_dir()
+        browser_utils.ensure_browser_data_dir()
+
+        path.mkdir.assert_called_once_with(parents=True, exist_ok=True)
+
+
+class TestRegisterHelpers:
+    """Tests for register_helpers."""
+
+    def test_installs_init_script(self):
+        """Test that all chat helpers are installed via one init script."""
+        context = MagicMock()
+
+        register_helpers(context)
+
+        script = context.add_init_script.call_args.args[0]
+        assert script == HELPERS_INIT_SCRIPT
+        for name in (
+            "__jobiai_closeAllOverlays",
+            "__jobiai_closeCurrentChat",
+            "__jobiai_isModalOpen",
+            "__jobiai_hasOpenOverlays",
+        ):
+            assert f"window.{name} = " in script
+
+
+class TestBackoffDelays:
+    """Tests for the polling backoff schedule."""
+
+    def test_delays_stay_under_doubling_ceiling(self):
+        """Test that each jittered delay stays under its doubling ceiling."""
+        delays = list(_backoff_delays(10000))
+
+        assert delays[0] == 0.0
+        ceiling = 0.05
+        for delay in delays[1:]:
+            assert 0 <= delay <= ceiling
+            ceiling = min(ceiling * 2, 2.0)
+
+    def test_spends_exactly_the_budget(self):
+        """Test that the total wait matches the retry budget."""
+        assert sum(_backoff_delays()) == pytest.approx(RETRY_TIMEOUT_MS / 1000)
+
+    def test_delays_are_jittered(self, monkeypatch):
+        """Test that two schedules don't retry on the same offsets."""
+        monkeypatch.setattr(browser_utils, "_rng", random.Random(1))
+
+        assert list(_backoff_delays()) != list(_backoff_delays())
+
+
+class TestBlockingHeavyResources:
+    """Tests for blocking_heavy_resources."""
+
+    @pytest.mark.parametrize("resource_type, blocked", [
+        ("image", True), ("font", True), ("media", True),
+        ("document", False), ("script", False), ("stylesheet", False), ("xhr", False),
+    ])
+    def test_filters_by_resource_type(self, resource_type, blocked):
+        """Test that only display-only requests are aborted."""
+        page = MagicMock()
+        route = MagicMock()
+        route.request.resource_type = resource_type
+        route.request.url = "https://www.linkedin.com/search/results/people/"
+
+        with blocking_heavy_resources(page):
+            _, handler = page.route.call_args.args
+            handler(route)
+
+        assert route.abort.called is blocked
+        assert route.continue_.called is not blocked
+
+    @pytest.mark.parametrize("url", [
+        "https://www.linkedin.com/li/track",
+        "https://ad.doubleclick.net/ddm/activity/src=1",
+    ])
+    def test_tracking_requests_blocked(self, url):
+        """Test that analytics beacons are aborted whatever their type."""
+        page = MagicMock()
+        route = MagicMock()
+        route.request.resource_type = "xhr"
+        route.request.url = url
+
+        with blocking_heavy_resources(page):
+            _, handler = page.route.call_args.args
+            handler(route)
+
+        route.abort.assert_called_once()
+
+    def test_filter_removed_on_error(self):
+        """Test that the page is left unfiltered even if the block raises."""
+        page = MagicMock()
+
+        with pytest.raises(RuntimeError):
+            with blocking_heavy_resources(page):
+                raise RuntimeError("navigation failed")
+
+        _, handler = page.route.call_args.args
+        page.unroute.assert_called_once_with("**/*", handler)
+
+
+class TestPrewarmDns:
+    """Tests for prewarm_dns."""
+
+    def test_resolves_each_host(self, monkeypatch):
+        """Test that every host is looked up."""
+        lookups = []
+        monkeypatch.setattr(browser_utils.socket, "getaddrinfo", lambda host, *a, **kw: lookups.append(host))
+
+        for future in prewarm_dns(("a.example", "b.example")):
+            future.result()
+
+        assert sorted(lookups) == ["a.example", "b.example"]
+
+    def test_lookup_errors_swallowed(self, monkeypatch):
+        """Test that an offline machine doesn't break the browser launch."""
+        def fail(*args, **kwargs):
+            raise OSError("Name or service not known")
+        monkeypatch.setattr(browser_utils.socket, "getaddrinfo", fail)
+
+        assert [f.result() for f in prewarm_dns(("a.example",))] == [None]
@@ -0,0 +1,713 @@
+"""
+Unit tests for the LinkedIn client's browser lifecycle.
+"""
+import asyncio
+import sys
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.services.linkedin.browser_utils import PlaywrightTimeoutError, blocking_heavy_resources
+from app.services.linkedin.client import (
+    LinkedInClient,
+    WorkflowAbortedException,
+    _DEGREE_RADIO_SELECTORS,
+    _LOGGED_IN_URL,
+    _SEARCH_RESULTS_SELECTOR,
+    _SELECTED_DEGREE_PILL_SELECTORS,
+    _init_playwright_thread,
+    _is_invitation_sent_response,
+    _is_message_sent_response,
+)
+
+
+@pytest.fixture
+def client(monkeypatch):
+    """LinkedIn client wired to a mocked shared browser context."""
+    client = LinkedInClient()
+    context = MagicMock()
+    page = MagicMock()
+    monkeypatch.setattr(client, "_get_or_create_browser", lambda: (context, page))
+    monkeypatch.setattr(client, "_get_profile_from_page", lambda page: {"name": "Dana Levi", "email": None})
+    client.context = context
+    client.page = page
+    return client
+
+
+class TestVerifySession:
+    """Tests for LinkedInClient._verify_session."""
+
+    @pytest.fixture(autouse=True)
+    def browser_open(self, client, monkeypatch):
+        """Mark the mocked context as the running browser."""
+        monkeypatch.setattr(client, "_context", client.context)
+
+    @pytest.fixture
+    def session_page(self, client):
+        """Page _verify_session opens in the already-running browser."""
+        client.context.cookies.return_value = [{"name": "li_at", "value": "token"}]
+        return client.context.new_page.return_value
+
+    def test_uses_own_page_in_open_browser(self, client, session_page):
+        """Test that the user's page isn't navigated and no Chromium is launched."""
+        session_page.url = "https://www.linkedin.com/feed/"
+
+        assert client._verify_session() == {"name": "Dana Levi", "email": None}
+        client.page.goto.assert_not_called()
+        session_page.close.assert_called_once()
+        client.context.close.assert_not_called()
+
+    def test_no_cookie_loads_nothing(self, client):
+        """Test that a context without an auth cookie is logged out outright."""
+        client.context.cookies.return_value = []
+
+        assert client._verify_session() is None
+        client.context.new_page.assert_not_called()
+
+    def test_login_redirect_is_invalid(self, client, session_page):
+        """Test that a redirect to the login page means no session."""
+        session_page.url = "https://www.linkedin.com/login?session_redirect=feed"
+
+        assert client._verify_session() is None
+
+    def test_navigation_error_raises(self, client, session_page):
+        """Test that a failed load isn't reported as a missing session."""
+        session_page.goto.side_effect = PlaywrightTimeoutError("Timeout 30000ms exceeded")
+
+        with pytest.raises(PlaywrightTimeoutError):
+            client._verify_session()
+        session_page.close.assert_called_once()
+
+    def test_no_open_browser_checks_headless(self, client, monkeypatch):
+        """Test that a status check doesn't open the visible browser."""
+        monkeypatch.setattr(client, "_context", None)
+        playwright = MagicMock()
+        monkeypatch.setattr(client, "_playwright", playwright)
+        headless = playwright.chromium.launch_persistent_context.return_value
+        headless.cookies.return_value = [{"name": "li_at", "value": "token"}]
+        headless.pages = [MagicMock(url="https://www.linkedin.com/feed/")]
+
+        assert client._verify_session() == {"name": "Dana Levi", "email": None}
+        assert playwright.chromium.launch_persistent_context.call_args.kwargs == {"headless": True}
+        headless.close.assert_called_once()
+        assert client._context is None
+
+
+class TestGetProfileFromPage:
+    """Tests for LinkedInClient._get_profile_from_page."""
+
+    def test_embedded_json_skips_dom_and_navigation(self, client):
+        """Test that the embedded profile data is used when present."""
+        page = MagicMock()
+        page.evaluate.return_value = "Dana Levi"
+
+        assert LinkedInClient._get_profile_from_page(client, page) == {"name": "Dana Levi", "email": None}
+        page.query_selector.assert_not_called()
+        page.goto.assert_not_called()
+
+    def test_falls_back_to_nav_photo(self, client):
+        """Test that the nav photo's alt text is used without embedded data."""
+        page = MagicMock()
+        page.evaluate.return_value = None
+        page.query_selector.return_value.get_attribute.return_value = "Photo of Dana Levi"
+
+        assert LinkedInClient._get_profile_from_page(client, page)["name"] == "Dana Levi"
+        page.goto.assert_not_called()
+
+
+class TestBrowserLoginFlow:
+    """Tests for LinkedInClient._browser_login_flow."""
+
+    @pytest.fixture
+    def page(self, client, monkeypatch):
+        """Page opened by the login flow, with window focusing stubbed out."""
+        monkeypatch.setattr("app.services.linkedin.client.bring_browser_to_front", MagicMock())
+        return client.context.new_page.return_value
+
+    def test_valid_stored_session_skips_login_form(self, client, page):
+        """Test that an li_at cookie plus a feed landing returns straight away."""
+        page.context.cookies.return_value = [{"name": "li_at", "value": "token"}]
+        page.url = "https://www.linkedin.com/feed/"
+
+        assert client._browser_login_flow() == {"name": "Dana Levi", "email": None}
+        visited = [c.args[0] for c in page.goto.call_args_list]
+        assert visited == ["https://www.linkedin.com/feed/"]
+        page.wait_for_url.assert_not_called()
+
+    def test_expired_stored_session_shows_login_form(self, client, page):
+        """Test that a redirect to login carrying /feed/ isn't taken as logged in."""
+        page.context.cookies.return_value = [{"name": "li_at", "value": "token"}]
+        page.url = "https://www.linkedin.com/login?session_redirect=/feed/"
+
+        assert client._browser_login_flow() == {"name": "Dana Levi", "email": None}
+        visited = [c.args[0] for c in page.goto.call_args_list]
+        assert visited == ["https://www.linkedin.com/feed/", "https://www.linkedin.com/login"]
+        page.wait_for_url.assert_called_once()
+
+    def test_no_cookie_goes_straight_to_login(self, client, page):
+        """Test that without a session the logout round-trip is skipped."""
+        page.context.cookies.return_value = []
+
+        assert client._browser_login_flow() == {"name": "Dana Levi", "email": None}
+        visited = [c.args[0] for c in page.goto.call_args_list]
+        assert visited == ["https://www.linkedin.com/login"]
+        page.wait_for_url.assert_called_once()
+
+    def test_login_timeout_returns_none(self, client, page):
+        """Test that the wait for a logged-in page gives up cleanly."""
+        page.context.cookies.return_value = []
+        page.wait_for_url.side_effect = PlaywrightTimeoutError("Timeout 300000ms exceeded")
+
+        assert client._browser_login_flow() is None
+        page.close.assert_called_once()
+
+
+class TestLoggedInUrl:
+    """Tests for the login-detection URL pattern."""
+
+    @pytest.mark.parametrize("url", [
+        "https://www.linkedin.com/feed/",
+        "https://www.linkedin.com/mynetwork/",
+        "https://www.linkedin.com/in/dana-levi/",
+    ])
+    def test_logged_in_pages(self, url):
+        """Test that post-login landing pages are detected."""
+        assert _LOGGED_IN_URL.search(url)
+
+    @pytest.mark.parametrize("url", [
+        "https://www.linkedin.com/login",
+        "https://www.linkedin.com/uas/login?session_redirect=/feed/",
+        "https://www.linkedin.com/checkpoint/challenge?redirect=/in/me",
+    ])
+    def test_login_pages(self, url):
+        """Test that login pages redirecting to the feed are not mistaken for it."""
+        assert not _LOGGED_IN_URL.search(url)
+
+
+class TestPlaywrightThread:
+    """Tests for the Playwright worker thread setup."""
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="POSIX loop policy")
+    def test_pins_stock_event_loop(self):
+        """Test that a uvloop policy installed by uvicorn is replaced."""
+        uvloop = pytest.importorskip("uvloop")
+        original = asyncio.get_event_loop_policy()
+        try:
+            asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+            _init_playwright_thread()
+
+            assert type(asyncio.get_event_loop_policy()) is asyncio.DefaultEventLoopPolicy
+        finally:
+            asyncio.set_event_loop_policy(original)
+
+
+class TestAbort:
+    """Tests for abort signalling."""
+
+    @pytest.fixture(autouse=True)
+    def cleared(self, client):
+        """Don't leak an abort signal into other tests."""
+        client.clear_abort()
+        yield
+        client.clear_abort()
+
+    def test_abort_during_wait_ends_it_within_a_slice(self, client):
+        """Test that an abort requested mid-wait stops it promptly."""
+        page = MagicMock()
+        page.wait_for_timeout.side_effect = lambda ms: time.sleep(ms / 1000)
+        threading.Timer(0.05, client.request_abort, args=(7,)).start()
+
+        start = time.monotonic()
+        with pytest.raises(WorkflowAbortedException):
+            client._wait_with_abort_check(page, 60_000)
+
+        assert time.monotonic() - start < 1.0
+        assert max(call.args[0] for call in page.wait_for_timeout.call_args_list) <= 500
+
+    def test_long_wait_uses_few_round_trips(self, client, monkeypatch):
+        """Test that a wait is split into as few slices as the abort check allows."""
+        now = [0.0]
+        monkeypatch.setattr("app.services.linkedin.client.time.monotonic", lambda: now[0])
+        page = MagicMock()
+        page.wait_for_timeout.side_effect = lambda ms: now.__setitem__(0, now[0] + ms / 1000)
+
+        client._wait_with_abort_check(page, 1200)
+
+        assert [call.args[0] for call in page.wait_for_timeout.call_args_list] == pytest.approx([500, 500, 200])
+
+    def test_wait_ends_when_abort_requested(self, client):
+        """Test that a pending abort interrupts the wait immediately."""
+        client.request_abort(7)
+
+        with pytest.raises(WorkflowAbortedException):
+            client._wait_with_abort_check(MagicMock(), 60_000)
+        assert client.is_abort_requested()
+
+
+class TestLogout:
+    """Tests for LinkedInClient.logout."""
+
+    async def test_removes_only_session_files(self, client, tmp_path, monkeypatch):
+        """Test that cookies and storage go while the cache stays."""
+        monkeypatch.setattr("app.services.linkedin.client.BROWSER_DATA_PATH", tmp_path)
+        monkeypatch.setattr(client, "_context", None)
+        for rel in ("Default/Network/Cookies", "Default/Login Data", "Default/Local Storage/leveldb/000003.log",
+                    "Default/Cache/Cache_Data/data_0"):
+            (tmp_path / rel).parent.mkdir(parents=True, exist_ok=True)
+            (tmp_path / rel).write_text("x")
+
+        await client.logout()
+
+        assert not (tmp_path / "Default/Network/Cookies").exists()
+        assert not (tmp_path / "Default/Login Data").exists()
+        assert not (tmp_path / "Default/Local Storage").exists()
+        assert (tmp_path / "Default/Cache/Cache_Data/data_0").exists()
+        assert not client.is_logged_in
+
+    async def test_clears_cookies_of_open_browser(self, client, tmp_path, monkeypatch):
+        """Test that an open context drops its in-memory cookies too."""
+        monkeypatch.setattr("app.services.linkedin.client.BROWSER_DATA_PATH", tmp_path / "missing")
+        monkeypatch.setattr(client, "_context", client.context)
+
+        await client.logout()
+
+        client.context.clear_cookies.assert_called_once()
+
+
+class TestCheckSession:
+    """Tests for LinkedInClient.check_session caching."""
+
+    @pytest.fixture
+    def logged_out(self, client, monkeypatch, tmp_path):
+        """Client with no session and a mocked verification."""
+        monkeypatch.setattr("app.services.linkedin.client.BROWSER_DATA_PATH", tmp_path)
+        monkeypatch.setattr(client, "_logged_in", False)
+        monkeypatch.setattr(client, "_session_checked_at", 0.0)
+        verify = MagicMock(return_value=None)
+        monkeypatch.setattr(client, "_verify_session", verify)
+        return verify
+
+    async def test_failed_check_is_cached(self, client, logged_out):
+        """Test that a missing session isn't re-verified on every status poll."""
+        assert await client.check_session() is False
+        assert await client.check_session() is False
+
+        logged_out.assert_called_once()
+
+    async def test_failed_verification_not_cached(self, client, logged_out):
+        """Test that a timeout isn't remembered as a logged-out session."""
+        logged_out.side_effect = PlaywrightTimeoutError("Timeout 30000ms exceeded")
+
+        assert await client.check_session() is False
+        assert client._session_checked_at == 0.0
+
+        logged_out.side_effect = None
+        logged_out.return_value = {"name": "Dana Levi", "email": None}
+        assert await client.check_session() is True
+
+    async def test_valid_session_skips_browser(self, client, logged_out):
+        """Test that a known session doesn't touch the browser."""
+        logged_out.return_value = {"name": "Dana Levi", "email": None}
+
+        assert await client.check_session() is True
+        assert await client.check_session() is True
+        logged_out.assert_called_once()
+
+    def test_login_redirect_drops_session(self, client, logged_out, monkeypatch):
+        """Test that an operation bounced to the login page forces a re-check."""
+        monkeypatch.setattr(client, "_logged_in", True)
+        monkeypatch.setattr(client, "_session_checked_at", 123.0)
+        page = MagicMock(url="https://www.linkedin.com/authwall?trk=feed")
+
+        assert client._session_expired(page) is True
+        assert client.is_logged_in is False
+        assert client._session_checked_at == 0.0
+
+
+class TestSearchCollapsing:
+    """Tests for sharing read-only company searches."""
+
+    @pytest.fixture
+    def scrape(self, client, monkeypatch):
+        """Logged-in client whose browser search is mocked."""
+        monkeypatch.setattr(client, "_logged_in", True)
+        monkeypatch.setattr(client, "_search_cache", {})
+        calls = []
+
+        def search(company, limit, message_generator, first_degree_only):
+            calls.append((company, message_generator, first_degree_only))
+            return {"first_degree": [{"name": "Dana Levi"}], "second_degree": [], "third_plus": []}
+
+        monkeypatch.setattr(client, "_search_company_all_degrees_sync", search)
+        return calls
+
+    async def test_concurrent_lookups_share_one_scrape(self, client, scrape):
+        """Test that duplicate lookups in flight run the browser once."""
+        first, second = await asyncio.gather(
+            client.search_connections_by_company("Acme"),
+            client.search_connections_by_company("acme"),
+        )
+
+        assert first == second == [{"name": "Dana Levi"}]
+        assert first is not second
+        assert len(scrape) == 1
+        assert client._inflight_searches == {}
+
+    async def test_messaging_searches_never_shared(self, client, scrape):
+        """Test that searches with side effects always run."""
+        generator = MagicMock()
+
+        await asyncio.gather(
+            client.search_company_all_degrees("Acme", message_generator=generator),
+            client.search_company_all_degrees("Acme", message_generator=generator),
+        )
+
+        assert len(scrape) == 2
+
+    async def test_repeat_lookup_served_from_cache(self, client, scrape):
+        """Test that a recent lookup of the same company skips the browser."""
+        first = await client.search_connections_by_company("Acme")
+        first.append({"name": "Mutated"})
+        second = await client.search_connections_by_company("ACME")
+
+        assert second == [{"name": "Dana Levi"}]
+        assert len(scrape) == 1
+
+    async def test_expired_cache_scrapes_again(self, client, scrape, monkeypatch):
+        """Test that results older than the TTL aren't reused."""
+        await client.search_connections_by_company("Acme")
+        monkeypatch.setattr("app.services.linkedin.client._SEARCH_CACHE_TTL", 0)
+        await client.search_connections_by_company("Acme")
+
+        assert len(scrape) == 2
+
+
+class TestWaitForFilterApplied:
+    """Tests for LinkedInClient._wait_for_filter_applied."""
+
+    def test_waits_for_selected_state(self):
+        """Test that the wait is on the filter's state, not a fixed pause."""
+        page = MagicMock()
+
+        LinkedInClient._wait_for_filter_applied(page, "2nd")
+
+        selector = page.wait_for_selector.call_args.args[0]
+        assert "[aria-checked='true']:has-text('2nd')" in selector
+        page.wait_for_timeout.assert_not_called()
+
+    def test_timeout_is_not_an_error(self):
+        """Test that unrecognised markup doesn't fail the filter step."""
+        page = MagicMock()
+        page.wait_for_selector.side_effect = PlaywrightTimeoutError("timeout")
+
+        LinkedInClient._wait_for_filter_applied(page, "1st")
+
+
+class TestGoToNextSearchPage:
+    """Tests for LinkedInClient._go_to_next_search_page."""
+
+    def test_loads_next_page_by_url(self, client):
+        """Test that the next page is opened directly, without clicking Next."""
+        page = MagicMock()
+        page.url = "https://www.linkedin.com/search/results/people/?keywords=Acme&network=%5B%22S%22%5D&page=2"
+
+        assert client._go_to_next_search_page(page, 2) is True
+
+        url = page.goto.call_args.args[0]
+        assert url.endswith("page=3")
+        assert "keywords=Acme&network=%5B%22S%22%5D" in url
+        page.query_selector.assert_called_once_with(_SEARCH_RESULTS_SELECTOR)
+        page.wait_for_timeout.assert_not_called()
+
+    def test_first_page_without_param(self, client):
+        """Test that a URL without a page parameter gets one."""
+        page = MagicMock()
+        page.url = "https://www.linkedin.com/search/results/people/?keywords=Acme"
+
+        client._go_to_next_search_page(page, 1)
+
+        assert page.goto.call_args.args[0] == "https://www.linkedin.com/search/results/people/?keywords=Acme&page=2"
+
+    def test_past_last_page(self, client):
+        """Test that an empty results page ends pagination."""
+        page = MagicMock()
+        page.url = "https://www.linkedin.com/search/results/people/?keywords=Acme"
+        page.query_selector.return_value = None
+
+        assert client._go_to_next_search_page(page, 4) is False
+
+    def test_slow_page_ends_pagination(self, client):
+        """Test that a page that never renders doesn't raise."""
+        page = MagicMock()
+        page.url = "https://www.linkedin.com/search/results/people/?keywords=Acme"
+        page.wait_for_selector.side_effect = PlaywrightTimeoutError("timeout")
+
+        assert client._go_to_next_search_page(page, 1) is False
+
+
+class TestBrowserReuse:
+    """Tests for keeping one browser open across workflows."""
+
+    def test_context_without_pages_gets_new_page(self, monkeypatch):
+        """Test that a context whose tabs were all closed isn't relaunched."""
+        client = LinkedInClient()
+        context = MagicMock()
+        context.pages = []
+        monkeypatch.setattr(client, "_context", context)
+        monkeypatch.setattr(client, "_playwright", MagicMock())
+        monkeypatch.setattr(client, "_page", None)
+
+        assert client._get_or_create_browser() == (context, context.new_page.return_value)
+        client._playwright.chromium.launch_persistent_context.assert_not_called()
+
+    async def test_close_runs_on_playwright_thread(self, monkeypatch):
+        """Test that close() shuts the shared browser down."""
+        client = LinkedInClient()
+        context, playwright = MagicMock(), MagicMock()
+        monkeypatch.setattr(client, "_context", context)
+        monkeypatch.setattr(client, "_playwright", playwright)
+        monkeypatch.setattr(client, "_page", None)
+
+        await client.close()
+
+        context.close.assert_called_once()
+        playwright.stop.assert_called_once()
+        assert client._context is None and client._playwright is None
+
+    async def test_close_without_browser(self, monkeypatch):
+        """Test that close() is a no-op when nothing was launched."""
+        client = LinkedInClient()
+        monkeypatch.setattr(client, "_context", None)
+        monkeypatch.setattr(client, "_playwright", None)
+        monkeypatch.setattr(client, "close_browser", MagicMock())
+
+        await client.close()
+
+        client.close_browser.assert_not_called()
+
+
+class TestSearchResources:
+    """Tests for skipping display-only downloads during company searches."""
+
+    @pytest.mark.parametrize("visible", [False, True])
+    def test_blocks_images_only_when_hidden(self, client, monkeypatch, visible):
+        """Test that a hidden browser skips images for the whole search."""
+        monkeypatch.setattr("app.services.linkedin.client.HAS_PLAYWRIGHT", True)
+        monkeypatch.setattr("app.services.linkedin.client.get_browser_visibility", lambda: visible)
+        client.page.goto.side_effect = RuntimeError("offline")
+
+        client._search_company_all_degrees_sync("Acme", 10)
+
+        assert client.page.route.called is not visible
+        assert client.page.unroute.called is not visible
+
+    def test_feed_settles_through_playwright_while_filtered(self, client, monkeypatch):
+        """Test that the post-load wait lets the route handler keep running."""
+        monkeypatch.setattr("app.services.linkedin.client.HAS_PLAYWRIGHT", True)
+        monkeypatch.setattr("app.services.linkedin.client.get_browser_visibility", lambda: False)
+        monkeypatch.setattr("app.services.linkedin.client.DELAY_MS", 200)
+        monkeypatch.setattr(
+            "app.services.linkedin.client.RetryHelper.retry_find",
+            MagicMock(side_effect=RuntimeError("stop here")),
+        )
+        client.page.url = "https://www.linkedin.com/feed/"
+        filtered_waits = []
+        client.page.wait_for_timeout.side_effect = (
+            lambda ms: filtered_waits.append(client.page.route.called and not client.page.unroute.called)
+        )
+
+        client._search_company_all_degrees_sync("Acme", 10)
+
+        assert filtered_waits and all(filtered_waits)
+
+    @pytest.mark.parametrize("visible", [False, True])
+    def test_connections_list_blocks_images_when_hidden(self, client, monkeypatch, visible):
+        """Test that reading the connections list skips images too."""
+        monkeypatch.setattr("app.services.linkedin.client.HAS_PLAYWRIGHT", True)
+        monkeypatch.setattr("app.services.linkedin.client.get_browser_visibility", lambda: visible)
+        client.page.goto.side_effect = RuntimeError("offline")
+
+        assert client._get_connections_sync(10) == []
+        assert client.page.route.called is not visible
+        assert client.page.unroute.called is not visible
+
+
+class DispatchingPage:
+    """Page stand-in whose driver only runs route handlers inside Playwright calls."""
+
+    def __init__(self, pending):
+        self.pending = pending
+        self.handler = None
+
+    def route(self, pattern, handler):
+        self.handler = handler
+
+    def unroute(self, pattern, handler):
+        self.handler = None
+
+    def wait_for_timeout(self, ms):
+        while self.pending and self.handler:
+            self.handler(self.pending.pop(0))
+        time.sleep(ms / 1000)
+
+
+class TestWaitForInputCleared:
+    """Tests for LinkedInClient._wait_for_input_cleared."""
+
+    def test_waits_on_the_message_box(self):
+        """Test that the box's own contents are polled in the page."""
+        page = MagicMock()
+        message_input = MagicMock()
+
+        assert LinkedInClient._wait_for_input_cleared(page, message_input) is True
+        assert page.wait_for_function.call_args.kwargs["arg"] is message_input.element_handle.return_value
+
+    def test_box_never_clears(self):
+        """Test that a message still in the box isn't treated as sent."""
+        page = MagicMock()
+        page.wait_for_function.side_effect = PlaywrightTimeoutError("timeout")
+
+        assert LinkedInClient._wait_for_input_cleared(page, MagicMock()) is False
+
+
+class TestSendResponses:
+    """Tests for recognising the responses to Send clicks."""
+
+    @staticmethod
+    def response(url, method="POST"):
+        response = MagicMock(url=url)
+        response.request.method = method
+        return response
+
+    def test_message_send(self):
+        """Test that only the message-creating POST matches."""
+        url = "https://www.linkedin.com/voyager/api/voyagerMessagingDashMessengerMessages?action=createMessage"
+
+        assert _is_message_sent_response(self.response(url))
+        assert not _is_message_sent_response(self.response(url, "GET"))
+        assert not _is_message_sent_response(self.response("https://www.linkedin.com/li/track"))
+
+    def test_invitation_send(self):
+        """Test that the invitation POST matches and a message doesn't."""
+        url = "https://www.linkedin.com/voyager/api/voyagerRelationshipsDashMemberRelationships?action=verifyQuotaAndCreateV2"
+
+        assert _is_invitation_sent_response(self.response(url))
+        assert not _is_invitation_sent_response(
+            self.response("https://www.linkedin.com/voyager/api/voyagerMessagingDashMessengerMessages")
+        )
+
+
+class TestFilteredWait:
+    """Tests for waiting while the resource filter is installed."""
+
+    def test_request_served_during_wait(self, client):
+        """Test that a request issued mid-wait reaches the route handler."""
+        client.clear_abort()
+        route = MagicMock()
+        route.request.resource_type = "script"
+        route.request.url = "https://static.licdn.com/feed.js"
+        page = DispatchingPage([route])
+
+        with blocking_heavy_resources(page):
+            client._wait_with_abort_check(page, 50)
+
+        route.continue_.assert_called_once()
+        route.abort.assert_not_called()
+
+
+class TestApplyConnectionFilter:
+    """Tests for LinkedInClient._apply_connection_filter."""
+
+    def test_already_applied_filter_not_clicked(self, client):
+        """Test that an active filter is left alone."""
+        page = MagicMock()
+        page.evaluate_handle.return_value.as_element.side_effect = [MagicMock(), None]
+
+        client._apply_connection_filter(page, "2nd")
+
+        assert page.evaluate_handle.call_count == 2
+        page.query_selector.assert_not_called()
+        page.wait_for_selector.assert_not_called()
+
+    def test_other_active_degree_needs_apply(self):
+        """Test that another active degree means the filter isn't applied yet."""
+        page = MagicMock()
+        page.evaluate_handle.return_value.as_element.side_effect = [MagicMock(), MagicMock()]
+
+        assert LinkedInClient._degree_filter_active(page, "2nd") is False
+        others = page.evaluate_handle.call_args.args[1]
+        assert any("'1st'" in selector for selector in others)
+        assert not any("'2nd'" in selector for selector in others)
+
+
+    def test_clears_other_degrees_with_prebuilt_selectors(self, client, monkeypatch):
+        """Test that clearing other degrees uses the module-level selectors."""
+        monkeypatch.setattr(LinkedInClient, "_degree_filter_active", staticmethod(lambda page, degree: False))
+        monkeypatch.setattr(LinkedInClient, "_wait_for_filter_applied", staticmethod(lambda page, degree: None))
+        monkeypatch.setattr("app.services.linkedin.client.RetryHelper.retry_click", MagicMock())
+        page = MagicMock()
+        page.query_selector.return_value = None
+        page.evaluate_handle.return_value.as_element.return_value = None
+
+        client._apply_connection_filter(page, "1st")
+
+        queried = [call.args[0] for call in page.query_selector.call_args_list]
+        assert queried == [_DEGREE_RADIO_SELECTORS["2nd"], _DEGREE_RADIO_SELECTORS["3rd+"]]
+        searched = [call.args[1] for call in page.evaluate_handle.call_args_list]
+        assert searched == [
+            list(_SELECTED_DEGREE_PILL_SELECTORS["2nd"][1]),
+            list(_SELECTED_DEGREE_PILL_SELECTORS["3rd+"][1]),
+        ]
+
+
+class TestClickPeopleTab:
+    """Tests for LinkedInClient._click_people_tab."""
+
+    def test_waits_for_people_results_url(self, client, monkeypatch):
+        """Test that the in-page tab switch is awaited by its URL."""
+        monkeypatch.setattr("app.services.linkedin.client.RetryHelper.retry_click", MagicMock())
+        page = MagicMock(url="https://www.linkedin.com/search/results/all/?keywords=Acme")
+
+        assert client._click_people_tab(page) is True
+        pattern = page.wait_for_url.call_args.args[0]
+        assert pattern.search("https://www.linkedin.com/search/results/people/?keywords=Acme")
+        assert not pattern.search(page.url)
+        page.wait_for_load_state.assert_not_called()
+
+
+class TestSearchSubmit:
+    """Tests for submitting the company search."""
+
+    def test_waits_for_results_url(self, client, monkeypatch):
+        """Test that submitting waits for the results page, not a fixed pause."""
+        monkeypatch.setattr("app.services.linkedin.client.HAS_PLAYWRIGHT", True)
+        monkeypatch.setattr("app.services.linkedin.client.get_browser_visibility", lambda: True)
+        monkeypatch.setattr(client, "_wait_with_abort_check", lambda page, ms: None)
+        client.page.url = "https://www.linkedin.com/feed/"
+        client.page.wait_for_url.side_effect = RuntimeError("stop here")
+
+        client._search_company_all_degrees_sync("Acme", 10)
+
+        pattern = client.page.wait_for_url.call_args.args[0]
+        assert pattern.search("https://www.linkedin.com/search/results/all/?keywords=Acme")
+        assert 3000 not in [c.args[0] for c in client.page.wait_for_timeout.call_args_list]
+
+
+class TestProcessMessageResults:
+    """Tests for LinkedInClient._process_message_results_page."""
+
+    def test_skips_cards_badged_as_not_first_degree(self, client, monkeypatch):
+        """Test that a 2nd-degree badge skips the Message button lookup."""
+        card = {"paragraphs": ["Dana Levi", "Engineer at Acme"], "link": "/in/dana", "degree": "2nd"}
+        monkeypatch.setattr(
+            "app.services.linkedin.client.query_search_results",
+            lambda *args: [(MagicMock(), card, None)],
+        )
+        retry_find = MagicMock()
+        monkeypatch.setattr("app.services.linkedin.client.RetryHelper.retry_find_in_element", retry_find)
+
+        assert client._process_message_results_page(MagicMock(), "acme", set()) == []
+        retry_find.assert_not_called()
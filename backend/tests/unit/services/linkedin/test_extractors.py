@@ -0,0 +1,244 @@
+"""
+Unit tests for LinkedIn search result extraction.
+"""
+from unittest.mock import MagicMock
+
+from app.services.linkedin.extractors import (
+    CARD_DATA_JS,
+    CARD_SELECTORS,
+    CONNECTIONS_PAGE_JS,
+    RESULTS_PAGE_SELECTORS,
+    SEARCH_RESULTS_PAGE_JS,
+    extract_connections_from_page,
+    extract_people_from_search_results,
+    extract_person_from_search_result,
+    extract_public_id,
+    query_search_results,
+)
+
+
+def card(*paragraphs, name="", headline="", link="/in/dana-levi?trk=search"):
+    """Card data as returned by CARD_DATA_JS."""
+    return {"paragraphs": list(paragraphs), "name": name, "headline": headline, "link": link}
+
+
+class TestExtractPublicId:
+    """Tests for extract_public_id."""
+
+    def test_strips_path_query_and_fragment(self):
+        """Test that only the profile handle is kept."""
+        assert extract_public_id("https://www.linkedin.com/in/dana-levi/?trk=x") == "dana-levi"
+        assert extract_public_id("/in/dana-levi?miniProfileUrn=y") == "dana-levi"
+        assert extract_public_id("/in/dana-levi#about") == "dana-levi"
+
+    def test_non_profile_url(self):
+        """Test that links without /in/ give an empty id."""
+        assert extract_public_id("https://www.linkedin.com/company/acme/") == ""
+        assert extract_public_id("") == ""
+
+
+class TestExtractPerson:
+    """Tests for extract_person_from_search_result."""
+
+    def test_new_ui_paragraphs(self):
+        """Test that name and headline come from the first two paragraphs."""
+        data = card("Dana Levi • 2nd", "Engineer at Acme")
+
+        person = extract_person_from_search_result(None, "acme", data)
+
+        assert person == {
+            "name": "Dana Levi",
+            "headline": "Engineer at Acme",
+            "linkedin_url": "https://www.linkedin.com/in/dana-levi",
+            "public_id": "dana-levi",
+        }
+
+    def test_current_job_matches_company(self):
+        """Test that the Current: line counts for the company filter."""
+        data = card("Dana Levi", "Engineer", "Current: Backend at Acme")
+
+        assert extract_person_from_search_result(None, "acme", data)["public_id"] == "dana-levi"
+
+    def test_past_job_does_not_match_company(self):
+        """Test that former employees are filtered out."""
+        data = card("Dana Levi", "Engineer", "Past: Backend at Acme", "Current: Backend at Other")
+
+        assert extract_person_from_search_result(None, "acme", data) is None
+
+    def test_old_ui_selector_fallback(self):
+        """Test the selector-based fields when paragraphs are missing."""
+        data = card(name="Dana Levi", headline="Engineer at Acme")
+
+        assert extract_person_from_search_result(None, "acme", data)["name"] == "Dana Levi"
+
+    def test_reads_element_without_card_data(self):
+        """Test that a lone element is read with one evaluation."""
+        result = MagicMock()
+        result.evaluate.return_value = card("Dana Levi", "Engineer at Acme")
+
+        assert extract_person_from_search_result(result, "acme")["name"] == "Dana Levi"
+        result.evaluate.assert_called_once_with(CARD_DATA_JS, CARD_SELECTORS)
+        result.query_selector_all.assert_not_called()
+
+
+class TestQuerySearchResults:
+    """Tests for query_search_results."""
+
+    def test_pairs_elements_with_batched_data(self):
+        """Test that all cards are read in a single evaluation."""
+        page = MagicMock()
+        elements = [MagicMock(), MagicMock()]
+        page.query_selector_all.return_value = elements
+        page.eval_on_selector_all.return_value = [card("A", "x"), card("B", "y")]
+
+        results = query_search_results(page)
+
+        assert [r for r, _, _ in results] == elements
+        assert [c["paragraphs"][0] for _, c, _ in results] == ["A", "B"]
+        assert [b for _, _, b in results] == [None, None]
+        page.eval_on_selector_all.assert_called_once()
+        page.evaluate_handle.assert_not_called()
+
+    def test_mismatched_batch_falls_back_per_card(self):
+        """Test that a re-rendered list leaves each card to be read alone."""
+        page = MagicMock()
+        page.query_selector_all.return_value = [MagicMock(), MagicMock()]
+        page.eval_on_selector_all.return_value = [card("A", "x")]
+
+        assert [c for _, c, _ in query_search_results(page)] == [None, None]
+
+    def test_filtered_cards_dropped(self):
+        """Test that cards nulled by the in-page filters are skipped."""
+        page = MagicMock()
+        elements = [MagicMock(), MagicMock(), MagicMock()]
+        page.query_selector_all.return_value = elements
+        page.eval_on_selector_all.return_value = [card("A", "x"), None, card("C", "z")]
+
+        results = query_search_results(
+            page, company_filter="Acme", exclude_urls={"https://www.linkedin.com/in/b"}
+        )
+
+        assert [r for r, _, _ in results] == [elements[0], elements[2]]
+        args = page.eval_on_selector_all.call_args[0][2]
+        assert args["company"] == "acme"
+        assert args["exclude"] == ["https://www.linkedin.com/in/b"]
+
+    def test_failed_button_batch_searches_kept_cards_only(self):
+        """Test that the per-card button fallback skips filtered cards."""
+        page = MagicMock()
+        elements = [MagicMock(), MagicMock()]
+        page.query_selector_all.return_value = elements
+        page.eval_on_selector_all.return_value = [None, card("B", "y")]
+        page.evaluate_handle.side_effect = Exception("unsupported selector")
+        elements[1].evaluate_handle.return_value.as_element.return_value = None
+
+        results = query_search_results(page, ["button.connect"], "acme")
+
+        assert [r for r, _, _ in results] == [elements[1]]
+        elements[0].evaluate_handle.assert_not_called()
+
+    def test_buttons_found_in_one_evaluation(self):
+        """Test that every card's button comes from a single page lookup."""
+        page = MagicMock()
+        page.query_selector_all.return_value = [MagicMock(), MagicMock()]
+        page.eval_on_selector_all.return_value = [card("A", "x"), card("B", "y")]
+        button = MagicMock()
+        page.evaluate_handle.return_value.get_properties.return_value = {
+            "0": MagicMock(as_element=MagicMock(return_value=button)),
+            "1": MagicMock(as_element=MagicMock(return_value=None)),
+        }
+
+        results = query_search_results(page, ["button.connect"])
+
+        assert [b for _, _, b in results] == [button, None]
+        page.evaluate_handle.assert_called_once()
+        page.evaluate_handle.return_value.dispose.assert_called_once()
+
+    def test_failed_button_batch_falls_back_per_card(self):
+        """Test that each card is searched alone if the batch can't run."""
+        page = MagicMock()
+        elements = [MagicMock(), MagicMock()]
+        page.query_selector_all.return_value = elements
+        page.eval_on_selector_all.return_value = [card("A", "x"), card("B", "y")]
+        page.evaluate_handle.side_effect = Exception("unsupported selector")
+        for element in elements:
+            element.evaluate_handle.return_value.as_element.return_value = None
+
+        results = query_search_results(page, ["button.connect"])
+
+        assert [b for _, _, b in results] == [None, None]
+        for element in elements:
+            element.evaluate_handle.assert_called_once()
+
+    def test_no_results(self):
+        """Test that a page without cards returns nothing."""
+        page = MagicMock()
+        page.query_selector_all.return_value = []
+
+        assert query_search_results(page) == []
+        page.eval_on_selector_all.assert_not_called()
+
+
+class TestExtractPeople:
+    """Tests for extract_people_from_search_results."""
+
+    def test_filters_and_limits(self):
+        """Test that the batch is filtered by company and capped."""
+        page = MagicMock()
+        page.evaluate.return_value = {"selector": "div.entity-result", "cards": [
+            card("Dana Levi", "Engineer at Acme", link="/in/dana"),
+            card("Noa Cohen", "Designer at Other", link="/in/noa"),
+            card("Avi Mor", "PM at Acme", link="/in/avi"),
+            card("Lior Bar", "QA at Acme", link="/in/lior"),
+        ]}
+
+        people = extract_people_from_search_results(page, "acme", limit=2)
+
+        assert [p["public_id"] for p in people] == ["dana", "avi"]
+        page.evaluate.assert_called_once_with(
+            SEARCH_RESULTS_PAGE_JS, {**RESULTS_PAGE_SELECTORS, "company": "acme", "limit": 2}
+        )
+        page.query_selector_all.assert_not_called()
+
+    def test_no_filter_sends_no_company(self):
+        """Test that an unfiltered extraction keeps every card in the page."""
+        page = MagicMock()
+        page.evaluate.return_value = {"selector": "div.entity-result", "cards": [card("Dana Levi", "Engineer")]}
+
+        assert len(extract_people_from_search_results(page)) == 1
+        assert page.evaluate.call_args.args[1]["company"] is None
+        assert page.evaluate.call_args.args[1]["limit"] is None
+
+    def test_no_results(self):
+        """Test that a page without a result list returns nothing."""
+        page = MagicMock()
+        page.evaluate.return_value = None
+
+        assert extract_people_from_search_results(page, "acme") == []
+
+
+class TestExtractConnections:
+    """Tests for extract_connections_from_page."""
+
+    def test_single_evaluation(self):
+        """Test that all connection cards are read in one call."""
+        page = MagicMock()
+        page.evaluate.return_value = [
+            {"name": "Dana Levi", "headline": "Engineer", "link": "/in/dana-levi/"},
+            {"name": "", "headline": "Ghost", "link": "/in/ghost/"},
+            {"name": "Noa Cohen", "headline": "PM", "link": "/company/acme/"},
+        ]
+
+        connections = extract_connections_from_page(page, 40)
+
+        assert connections == [{
+            "name": "Dana Levi",
+            "headline": "Engineer",
+            "linkedin_url": "https://www.linkedin.com/in/dana-levi",
+            "public_id": "dana-levi",
+            "is_connection": True,
+        }]
+        page.evaluate.assert_called_once()
+        assert page.evaluate.call_args.args[0] == CONNECTIONS_PAGE_JS
+        assert page.evaluate.call_args.args[1]["limit"] == 40
+        page.query_selector_all.assert_not_called()
@@ -0,0 +1,123 @@
+"""
+Unit tests for Hebrew name translation service.
+"""
+import pytest
+
+from app.models.hebrew_name import HebrewName
+from app.services import hebrew_names
+from app.services.hebrew_names import (
+    get_builtin_names,
+    get_missing_hebrew_names,
+    load_all_translations_to_cache,
+    translate_name_to_hebrew,
+    translate_name_to_hebrew_sync,
+)
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache(monkeypatch):
+    """Give each test a fresh, not-yet-loaded DB translation cache."""
+    monkeypatch.setattr(hebrew_names, "_db_translations_cache", {})
+    monkeypatch.setattr(hebrew_names, "_db_cache_loaded", False)
+
+
+class TestBuiltinNames:
+    """Tests for the built-in name dictionary."""
+
+    def test_builtin_names_loaded(self):
+        """Test that the packaged dictionary is loaded."""
+        names = get_builtin_names()
+        assert len(names) > 500
+        assert names["tomer"] == "תומר"
+
+    def test_builtin_names_keys_are_lowercase(self):
+        """Test that all keys are normalized."""
+        for english in get_builtin_names():
+            assert english == english.strip().lower()
+
+    def test_builtin_names_cached(self):
+        """Test that the file is only parsed once."""
+        assert get_builtin_names() is get_builtin_names()
+
+
+class TestTranslateNameSync:
+    """Tests for translate_name_to_hebrew_sync."""
+
+    def test_translate_known_name(self):
+        """Test translating a name from the built-in dictionary."""
+        assert translate_name_to_hebrew_sync("Tomer Cohen") == "תומר"
+
+    def test_translate_unknown_name(self):
+        """Test that unknown names return None."""
+        assert translate_name_to_hebrew_sync("Xyzzyq Smith") is None
+
+    def test_translate_empty_name(self):
+        """Test that empty input returns None."""
+        assert translate_name_to_hebrew_sync("") is None
+
+    def test_already_hebrew(self):
+        """Test that Hebrew names are returned as-is."""
+        assert translate_name_to_hebrew_sync("תומר כהן") == "תומר"
+        assert translate_name_to_hebrew_sync("  תומר  ") == "תומר"
+
+    def test_whitespace_only_name(self):
+        """Test that whitespace-only input returns None."""
+        assert translate_name_to_hebrew_sync("   ") is None
+
+
+class TestTranslateNameAsync:
+    """Tests for translate_name_to_hebrew with DB lookup."""
+
+    async def test_translate_from_db(self, db_session):
+        """Test that names missing from the dictionary are found in the DB."""
+        db_session.add(HebrewName(english_name="zorblat", hebrew_name="זורבלט"))
+        await db_session.flush()
+
+        assert await translate_name_to_hebrew("Zorblat Levi", db_session) == "זורבלט"
+
+    async def test_loaded_cache_skips_db(self, db_session):
+        """Test that once the cache mirrors the DB, misses don't query it."""
+        await load_all_translations_to_cache(db_session)
+
+        # Inserted behind the cache's back, so only a DB query could find it
+        db_session.add(HebrewName(english_name="zorblat", hebrew_name="זורבלט"))
+        await db_session.flush()
+
+        assert await translate_name_to_hebrew("Zorblat Levi", db_session) is None
+
+    async def test_loaded_cache_serves_db_names(self, db_session):
+        """Test that names loaded at startup are served from the cache."""
+        db_session.add(HebrewName(english_name="zorblat", hebrew_name="זורבלט"))
+        await db_session.flush()
+        count = await load_all_translations_to_cache(db_session)
+
+        assert count == 1
+        assert translate_name_to_hebrew_sync("Zorblat") == "זורבלט"
+
+
+class TestGetMissingHebrewNames:
+    """Tests for get_missing_hebrew_names."""
+
+    async def test_missing_names_deduplicated_in_order(self, db_session):
+        """Test that missing first names are lowercased, deduped and ordered."""
+        names = ["Zorblat Levi", "Tomer Cohen", "Quuxia A", "zorblat B", "ZORBLAT"]
+
+        missing = await get_missing_hebrew_names(names, db_session)
+
+        assert missing == ["zorblat", "quuxia"]
+
+    async def test_db_names_not_missing(self, db_session):
+        """Test that names stored in the DB are resolved in one batch."""
+        db_session.add(HebrewName(english_name="zorblat", hebrew_name="זורבלט"))
+        await db_session.flush()
+
+        missing = await get_missing_hebrew_names(["Zorblat Levi", "Quuxia A"], db_session)
+
+        assert missing == ["quuxia"]
+        assert translate_name_to_hebrew_sync("Zorblat") == "זורבלט"
+
+    async def test_hebrew_and_empty_names_skipped(self, db_session):
+        """Test that Hebrew and blank names are never reported as missing."""
+        missing = await get_missing_hebrew_names(["תומר כהן", "", "   "], db_session)
+
+        assert missing == []
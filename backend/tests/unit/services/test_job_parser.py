@@ -7,7 +7,10 @@ from unittest.mock import AsyncMock, MagicMock, patch
 from app.services.job_parser import (
     JobParser,
     JOB_PLATFORMS,
+    compile_url_pattern,
     get_job_platform,
+    get_known_company,
+    get_platform_config,
     extract_company_from_platform_url,
 )
 
@@ -138,6 +141,21 @@ class TestJobPlatforms:
         is_platform, config = parser.is_job_platform("https://random-company.com/careers")
         assert is_platform is False
 
+    def test_platform_lookup_prefers_most_specific_domain(self):
+        """Test that nested subdomains resolve to the most specific platform entry."""
+        assert get_platform_config("acme.jobs.eu.lever.co") is JOB_PLATFORMS["jobs.eu.lever.co"]
+        assert get_platform_config("boards.greenhouse.io") is JOB_PLATFORMS["boards.greenhouse.io"]
+
+    def test_platform_lookup_matches_whole_labels(self):
+        """Test that a domain merely ending with the same characters isn't matched."""
+        assert get_platform_config("notlever.co") is None
+        assert get_platform_config("") is None
+
+    def test_known_company_lookup_by_parent_domain(self):
+        """Test that career-site subdomains resolve to the known company."""
+        assert get_known_company("jobs.nayax.com") == "Nayax"
+        assert get_known_company("unknown-company.com") is None
+
     def test_extract_company_from_greenhouse_url(self, parser):
         """Test extracting company from Greenhouse URL."""
         company = parser.extract_company_from_url(
@@ -194,6 +212,16 @@ class TestJobPlatforms:
         )
         assert company == "Notion"
 
+    def test_extract_company_invalid_pattern_returns_none(self, parser):
+        """Test that a malformed learned pattern doesn't raise."""
+        company = parser.extract_company_from_url("https://example.com/acme", r"example\.com/([")
+        assert company is None
+
+    def test_compiled_patterns_are_cached(self):
+        """Test that the same pattern string is only compiled once."""
+        pattern = r"jobs\.lever\.co/([^/]+)"
+        assert compile_url_pattern(pattern) is compile_url_pattern(pattern)
+
     def test_job_platforms_dict_has_entries(self):
         """Test that JOB_PLATFORMS has expected entries."""
         assert "greenhouse.io" in JOB_PLATFORMS
@@ -1,11 +1,13 @@
 """
 Unit tests for job processor service.
 """
+import asyncio
 import pytest
 from unittest.mock import AsyncMock, patch, MagicMock
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
-from app.services.job_processor import JobProcessor
+from app.services.job_processor import JobDispatcher, JobProcessor
 from app.models.job import Job, JobStatus
 from app.models.site_selector import SiteSelector, SiteType
 from app.models.activity import ActivityLog, ActionType
@@ -133,6 +135,36 @@ class TestJobProcessor:
 
         assert result is None
 
+    @pytest.mark.asyncio
+    async def test_get_db_selector_skips_query_for_uncached_domain(self, db_session: AsyncSession):
+        """Test that domains missing from the known-domain cache don't hit the DB."""
+        processor = JobProcessor(db_session)
+        await processor._get_db_selector("warmup.com")  # loads the cache
+
+        with patch.object(db_session, "execute", wraps=db_session.execute) as execute:
+            result = await processor._get_db_selector("not-a-selector.com")
+
+        assert result is None
+        execute.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_learned_domain_visible_to_cache(self, db_session: AsyncSession):
+        """Test that a newly learned selector is found without reloading the cache."""
+        processor = JobProcessor(db_session)
+        await processor._get_db_selector("warmup.com")  # loads the cache
+
+        await processor._learn_site_pattern(
+            domain="learned.com",
+            url="https://learned.com/jobs/1",
+            company_name="Learned",
+            site_type="company",
+        )
+        await db_session.flush()
+
+        result = await processor._get_db_selector("learned.com")
+        assert result is not None
+        assert result.company_name == "Learned"
+
     @pytest.mark.asyncio
     async def test_submit_company_info_as_company_site(self, db_session: AsyncSession):
         """Test submitting company info for a company website."""
@@ -426,6 +458,40 @@ class TestURLPatternGeneration:
         assert result["needs_input"] is False
 
 
+class TestKnownPlatformPatterns:
+    """Tests for reusing pre-configured platform patterns when learning."""
+
+    @pytest.mark.asyncio
+    async def test_known_platform_pattern_used_when_it_matches(self, db_session: AsyncSession):
+        """Test that a matching built-in platform pattern skips inference."""
+        processor = JobProcessor(db_session)
+
+        with patch.object(processor, "_generate_url_pattern") as generate:
+            await processor._learn_site_pattern(
+                domain="jobs.lever.co",
+                url="https://jobs.lever.co/acme/123",
+                company_name="Acme",
+                site_type="platform",
+                platform_name="Lever",
+            )
+        await db_session.flush()
+
+        generate.assert_not_called()
+        selector = await processor._get_db_selector("jobs.lever.co")
+        assert selector.url_pattern == r"jobs\.lever\.co/([^/]+)"
+
+    @pytest.mark.asyncio
+    async def test_known_platform_pattern_skipped_when_it_does_not_match(self, db_session: AsyncSession):
+        """Test that a non-matching built-in pattern falls back to inference."""
+        processor = JobProcessor(db_session)
+
+        pattern = processor._known_platform_pattern(
+            "greenhouse.io", "https://greenhouse.io/careers/acme/123"
+        )
+
+        assert pattern is None
+
+
 class TestLegacyCompatibility:
     """Tests for backward compatibility."""
 
@@ -448,3 +514,44 @@ class TestLegacyCompatibility:
 
         assert result["success"] is True
         assert result["company_name"] == "Old Company"
+
+
+class TestJobDispatcher:
+    """Tests for batched background job processing."""
+
+    @pytest.mark.asyncio
+    async def test_jobs_submitted_together_processed_in_one_batch(self, async_engine):
+        """Test that jobs queued within the batch window share one batch."""
+        session_factory = async_sessionmaker(async_engine, class_=AsyncSession, expire_on_commit=False)
+        async with session_factory() as db:
+            jobs = [
+                Job(url=f"https://boards.greenhouse.io/company{i}/jobs/1", status=JobStatus.PENDING)
+                for i in range(3)
+            ]
+            db.add_all(jobs)
+            await db.commit()
+            job_ids = [job.id for job in jobs]
+
+        dispatcher = JobDispatcher()
+        batch_done = asyncio.Event()
+        process_batch_impl = dispatcher._process_batch
+
+        async def process_batch_and_signal(batch):
+            await process_batch_impl(batch)
+            batch_done.set()
+
+        with patch("app.services.job_processor.AsyncSessionLocal", session_factory), \
+                patch.object(dispatcher, "_process_batch", side_effect=process_batch_and_signal) as process_batch:
+            for job_id in job_ids:
+                await dispatcher.submit(job_id)
+            await asyncio.wait_for(batch_done.wait(), timeout=5)
+            await dispatcher.stop()
+
+        process_batch.assert_awaited_once_with(job_ids)
+        async with session_factory() as db:
+            result = await db.execute(select(Job.status).where(Job.id.in_(job_ids)))
+            assert set(result.scalars()) == {JobStatus.COMPLETED}
+            result = await db.execute(select(ActivityLog).where(ActivityLog.job_id.in_(job_ids)))
+            logs = result.scalars().all()
+        assert sorted(log.job_id for log in logs) == job_ids
+        assert {log.action_type for log in logs} == {ActionType.COMPANY_EXTRACTED}
@@ -168,8 +168,8 @@ export const authApi = {
   login: (email: string, password: string) =>
     api.post('/auth/login', { email, password }).then(res => res.data),
 
-  loginWithBrowser: () =>
-    api.post('/auth/login-browser').then(res => res.data),
+  loginWithBrowser: (forceRelogin = false) =>
+    api.post('/auth/login-browser', null, { params: { force_relogin: forceRelogin } }).then(res => res.data),
 
   logout: () =>
     api.post('/auth/logout').then(res => res.data),